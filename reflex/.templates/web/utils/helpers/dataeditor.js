@@ -58,8 +58,10 @@ export function formatCell(value, column) {
   }
 }
 
-export function formatDataEditorCells(col, row, columns, data) {
-  if (row < data.length && col < columns.length) {
+export function formatDataEditorCells(col, row, columns, data, offset = 0) {
+  // data may only hold a window of the rows, starting at row offset.
+  row -= offset;
+  if (row >= 0 && row < data.length && col < columns.length) {
     const column = getDEColumn(columns, col);
     const rowData = getDERow(data, row);
     const cellData = locateCell(rowData, column);
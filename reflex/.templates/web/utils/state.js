@@ -134,13 +134,114 @@ export const isStateful = () => {
   return event_queue.some((event) => event.name.startsWith("reflex___state"));
 };
 
+// Suffix of delta keys carrying patch operations for a field.
+const PATCH_MARKER = "_rx_patch_";
+
+// Suffix of delta keys carrying a dataframe encoded column by column.
+const COLUMNAR_MARKER = "_rx_columnar_";
+
+// The typed arrays of the numeric columns of a columnar dataframe.
+const TYPED_ARRAYS = {
+  int8: Int8Array,
+  uint8: Uint8Array,
+  int16: Int16Array,
+  uint16: Uint16Array,
+  int32: Int32Array,
+  uint32: Uint32Array,
+  float32: Float32Array,
+  float64: Float64Array,
+  bool: Uint8Array,
+};
+
+/**
+ * Decode a column of a columnar dataframe.
+ * @param column The encoded column.
+ * @returns The values of the column.
+ */
+const decodeColumn = (column) => {
+  if (column.type === "list") {
+    return column.data;
+  }
+  if (column.type === "category") {
+    const codes = decodeColumn(column.codes);
+    return Array.from(codes, (code) =>
+      code < 0 ? null : column.categories[code],
+    );
+  }
+  const bytes = Uint8Array.from(atob(column.data), (c) => c.charCodeAt(0));
+  const values = new TYPED_ARRAYS[column.type](bytes.buffer);
+  return column.type === "bool" ? Array.from(values, Boolean) : values;
+};
+
+/**
+ * Decode a dataframe encoded column by column to its columns and rows.
+ * @param df The encoded dataframe.
+ * @returns The dataframe as serialized by serialize_dataframe.
+ */
+export const decodeColumnarDataFrame = ({ columns, length, values }) => {
+  const decoded = values.map(decodeColumn);
+  const data = new Array(length);
+  for (let row = 0; row < length; row++) {
+    data[row] = decoded.map((column) => column[row]);
+  }
+  return { columns, data };
+};
+
+/**
+ * Apply JSON-patch style operations to a list or object value.
+ * @param value The previous value of the field.
+ * @param ops The operations to apply, in order.
+ * @returns The patched copy of the value.
+ */
+export const applyPatch = (value, ops) => {
+  if (Array.isArray(value)) {
+    const result = [...value];
+    for (const { op, path, value: item } of ops) {
+      if (op === "remove") {
+        result.splice(path, 1);
+      } else if (op === "replace") {
+        result[path] = item;
+      } else if (path === "-") {
+        result.push(item);
+      } else {
+        result.splice(path, 0, item);
+      }
+    }
+    return result;
+  }
+  const result = { ...value };
+  for (const { op, path, value: item } of ops) {
+    if (op === "remove") {
+      delete result[path];
+    } else {
+      result[path] = item;
+    }
+  }
+  return result;
+};
+
 /**
  * Apply a delta to the state.
  * @param state The state to apply the delta to.
  * @param delta The delta to apply.
  */
 export const applyDelta = (state, delta) => {
-  return { ...state, ...delta };
+  const next = { ...state, ...delta };
+  for (const key in delta) {
+    if (key.endsWith(PATCH_MARKER)) {
+      const field = key.slice(0, -PATCH_MARKER.length) + "_rx_state_";
+      if (!(field in delta)) {
+        // A full value in the same delta supersedes the patch.
+        next[field] = applyPatch(state[field], delta[key]);
+      }
+      delete next[key];
+    } else if (key.endsWith(COLUMNAR_MARKER)) {
+      const field = key.slice(0, -COLUMNAR_MARKER.length) + "_rx_state_";
+      next[field] = decodeColumnarDataFrame(delta[key]);
+      delete next[key];
+    }
+  }
+  return next;
 };
 
 /**
@@ -510,6 +611,35 @@ export const processEvent = async (socket, navigate, params) => {
   }
 };
 
+/**
+ * Get the query parameters sent when connecting the websocket.
+ * @returns The query object including the token and supported update encoding.
+ */
+const connectQuery = () => ({
+  token: getToken(),
+  update_encoding:
+    typeof DecompressionStream === "undefined" ? "binary" : "deflate",
+});
+
+/**
+ * Decode a binary state update frame sent by the backend.
+ *
+ * The first byte is 0 for plain UTF-8 JSON, or 1 for zlib compressed JSON.
+ * @param frame The binary frame.
+ * @returns The decoded JSON text.
+ */
+const decodeBinaryUpdate = async (frame) => {
+  const bytes = new Uint8Array(frame);
+  const body = bytes.subarray(1);
+  if (bytes[0] === 1) {
+    const stream = new Blob([body])
+      .stream()
+      .pipeThrough(new DecompressionStream("deflate"));
+    return await new Response(stream).text();
+  }
+  return new TextDecoder().decode(body);
+};
+
 /**
  * Connect to a websocket and set the handlers.
  * @param socket The socket object to connect.
@@ -547,7 +677,7 @@ export const connect = async (
     transports: transports,
     protocols: [reflexEnvironment.version],
     autoUnref: false,
-    query: { token: getToken() },
+    query: connectQuery(),
     reconnection: false, // Reconnection will be handled manually.
   });
   socket.current.wait_connect = !socket.current.connected;
@@ -569,7 +699,7 @@ export const connect = async (
     ) {
       socket.current.wait_connect = true;
       socket.current.rehydrate = true;
-      socket.current.io.opts.query = { token: getToken() }; // Update token for reconnect.
+      socket.current.io.opts.query = connectQuery(); // Update token for reconnect.
       socket.current.connect();
     }
   };
@@ -662,8 +792,8 @@ export const connect = async (
     }
   });
 
-  // On each received message, queue the updates and events.
-  socket.current.on("event", async (update) => {
+  // Apply a state update and queue its events.
+  const applyUpdate = (update) => {
     for (const substate in update.delta) {
       dispatch[substate](update.delta[substate]);
       // handle events waiting for `is_hydrated`
@@ -682,6 +812,20 @@ export const connect = async (
     if (update.events) {
       queueEvents(update.events, socket, false, navigate, params);
     }
+  };
+  // Binary updates may need asynchronous decompression, so all updates are
+  // applied through a promise chain to preserve their order.
+  let pending_updates = Promise.resolve();
+  socket.current.on("event", (update) => {
+    pending_updates = pending_updates
+      .then(() => applyUpdate(update))
+      .catch((e) => console.error("Failed to apply update", e));
+  });
+  socket.current.on("event_binary", (frame) => {
+    const decoded = decodeBinaryUpdate(frame);
+    pending_updates = pending_updates
+      .then(async () => applyUpdate(JSON5.parse(await decoded)))
+      .catch((e) => console.error("Failed to apply binary update", e));
   });
   socket.current.on("reload", async (event) => {
     event_processing = false;
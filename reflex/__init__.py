@@ -289,6 +289,7 @@ _MAPPING: dict = {
         "data_editor",
         "data_editor_theme",
     ],
+    "components.datadisplay.datasource": ["DataSourceState"],
     "components.sonner.toast": ["toast"],
     "components.props": ["PropsBase"],
     "components.datadisplay.logo": ["logo"],
@@ -328,7 +329,7 @@ _MAPPING: dict = {
         "SessionStorage",
     ],
     "middleware": ["middleware", "Middleware"],
-    "model": ["asession", "session", "Model", "ModelRegistry"],
+    "model": ["asession", "event_asession", "session", "Model", "ModelRegistry"],
     "page": ["page"],
     "state": [
         "var",
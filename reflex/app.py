@@ -8,19 +8,23 @@ import contextlib
 import copy
 import dataclasses
 import functools
+import gc
+import hashlib
 import inspect
-import io
 import json
 import operator
 import sys
+import tempfile
 import time
 import traceback
 import urllib.parse
+import zlib
 from collections.abc import (
     AsyncGenerator,
     AsyncIterator,
     Callable,
     Coroutine,
+    Iterable,
     Mapping,
     Sequence,
 )
@@ -29,18 +33,34 @@ from itertools import chain
 from pathlib import Path
 from timeit import default_timer as timer
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, BinaryIO, ParamSpec, get_args, get_type_hints
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    ParamSpec,
+    TypedDict,
+    cast,
+    get_args,
+    get_type_hints,
+)
 
 from rich.progress import MofNCompleteColumn, Progress, TimeElapsedColumn
 from socketio import ASGIApp as EngineIOApp
 from socketio import AsyncNamespace, AsyncServer
+from socketio.exceptions import ConnectionRefusedError as SocketConnectionRefusedError
 from starlette.applications import Starlette
-from starlette.datastructures import Headers
+from starlette.datastructures import FormData, Headers
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from starlette.exceptions import HTTPException
+from starlette.formparsers import MultiPartException, MultiPartParser
 from starlette.middleware import cors
 from starlette.requests import ClientDisconnect, Request
-from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.staticfiles import StaticFiles
 
 from reflex import constants
@@ -84,6 +104,9 @@ from reflex.event import (
     get_hydrate_event,
     noop,
 )
+from reflex.istate.manager import DEFAULT_BATCH_SIZE, StateModificationContext
+from reflex.istate.proxy import ReadOnlyStateProxy, StateProxy
+from reflex.istate.scheduler import BackgroundTaskInfo, BackgroundTaskScheduler
 from reflex.page import DECORATED_PAGES
 from reflex.route import (
     get_route_args,
@@ -108,6 +131,7 @@ from reflex.utils import (
     format,
     frontend_skeleton,
     js_runtimes,
+    metrics,
     path_ops,
     prerequisites,
     types,
@@ -119,7 +143,9 @@ from reflex.utils.exec import (
     should_prerender_routes,
 )
 from reflex.utils.imports import ImportVar
+from reflex.utils.metrics import EventPhase
 from reflex.utils.misc import run_in_thread
+from reflex.utils.staticfiles import PrecompressedStaticFiles
 from reflex.utils.token_manager import RedisTokenManager, TokenManager
 from reflex.utils.types import ASGIApp, Message, Receive, Scope, Send
 
@@ -245,6 +271,10 @@ def default_error_boundary(*children: Component, **props) -> Component:
     )
 
 
+# The size of the chunks uploaded files are copied and iterated in (bytes).
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
 @dataclasses.dataclass(frozen=True)
 class UploadFile(StarletteUploadFile):
     """A file uploaded to the server.
@@ -284,6 +314,20 @@ class UploadFile(StarletteUploadFile):
             return self.path.name
         return None
 
+    async def iter_chunks(
+        self, chunk_size: int = UPLOAD_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Read the file chunk by chunk, without loading it in memory at once.
+
+        Args:
+            chunk_size: The maximum size of each chunk in bytes.
+
+        Yields:
+            The consecutive chunks of the file.
+        """
+        while chunk := await self.read(chunk_size):
+            yield chunk
+
 
 @dataclasses.dataclass(
     frozen=True,
@@ -409,6 +453,9 @@ class App(MiddlewareMixin, LifespanMixin):
     # A mapping of pages which created states as they were being evaluated.
     _stateful_pages: dict[str, None] = dataclasses.field(default_factory=dict)
 
+    # A mapping of page routes to the full names of the states they render.
+    _route_states: dict[str, frozenset[str]] = dataclasses.field(default_factory=dict)
+
     # The backend API object.
     _api: Starlette | None = None
 
@@ -435,6 +482,13 @@ class App(MiddlewareMixin, LifespanMixin):
     # Background tasks that are currently running.
     _background_tasks: set[asyncio.Task] = dataclasses.field(default_factory=set)
 
+    # Starts background tasks within their concurrency limits.
+    _background_task_scheduler: BackgroundTaskScheduler = dataclasses.field(
+        default_factory=lambda: BackgroundTaskScheduler(
+            max_tasks=environment.REFLEX_BACKGROUND_TASK_LIMIT.get()
+        )
+    )
+
     # Frontend Error Handler Function
     frontend_exception_handler: Callable[[Exception], None] = (
         default_frontend_exception_handler
@@ -518,10 +572,20 @@ class App(MiddlewareMixin, LifespanMixin):
 
         Raises:
             RuntimeError: If the socket server is invalid.
+            ConfigError: If patch deltas are combined with route scoped hydration.
         """
         if not self._state:
             return
 
+        if (
+            environment.REFLEX_STATE_PATCH_DELTAS.get()
+            and environment.REFLEX_ROUTE_SCOPED_HYDRATION.get()
+        ):
+            # Patches are applied to the frontend value, which is only the initial
+            # value for states that were not hydrated yet.
+            msg = "REFLEX_STATE_PATCH_DELTAS cannot be combined with REFLEX_ROUTE_SCOPED_HYDRATION."
+            raise exceptions.ConfigError(msg)
+
         config = get_config()
 
         # Set up the state manager.
@@ -636,7 +700,7 @@ class App(MiddlewareMixin, LifespanMixin):
         if environment.REFLEX_MOUNT_FRONTEND_COMPILED_APP.get():
             asgi_app.mount(
                 "/" + config.frontend_path.strip("/"),
-                StaticFiles(
+                PrecompressedStaticFiles(
                     directory=prerequisites.get_web_dir()
                     / constants.Dirs.STATIC
                     / config.frontend_path.strip("/"),
@@ -666,6 +730,13 @@ class App(MiddlewareMixin, LifespanMixin):
         top_asgi_app.mount("", asgi_app)
         App._add_cors(top_asgi_app)
 
+        if environment.REFLEX_BACKEND_PRELOADED.get():
+            # The workers are forked from this process. Move the objects of the
+            # loaded app out of reach of the garbage collector, so that collections
+            # in the workers do not write to (and copy) the memory pages they share.
+            gc.collect()
+            gc.freeze()
+
         return top_asgi_app
 
     def _add_default_endpoints(self):
@@ -684,6 +755,13 @@ class App(MiddlewareMixin, LifespanMixin):
             health,
             methods=["GET"],
         )
+        if environment.REFLEX_EVENT_METRICS.get():
+            # To export the event timings.
+            self._api.add_route(
+                str(constants.Endpoint.METRICS),
+                event_metrics,
+                methods=["GET"],
+            )
 
     def _add_optional_endpoints(self):
         """Add optional api endpoints (_upload)."""
@@ -702,7 +780,8 @@ class App(MiddlewareMixin, LifespanMixin):
                 methods=["POST"],
             )
 
-            # To access uploaded files.
+            # To access uploaded files, as they are: a file uploaded as X.gz is
+            # not a variant of X, and uploads are not cached as immutable.
             self._api.mount(
                 str(constants.Endpoint.UPLOAD),
                 StaticFiles(directory=get_upload_dir()),
@@ -1169,12 +1248,19 @@ class App(MiddlewareMixin, LifespanMixin):
         backend_dir = prerequisites.get_backend_dir()
         if not dry_run and not should_compile and backend_dir.exists():
             stateful_pages_marker = backend_dir / constants.Dirs.STATEFUL_PAGES
-            if stateful_pages_marker.exists():
+            manifest = self._read_backend_manifest()
+            stateful_pages = []
+            if manifest is not None:
+                stateful_pages = manifest["stateful_pages"]
+            elif stateful_pages_marker.exists():
                 with stateful_pages_marker.open("r") as f:
                     stateful_pages = json.load(f)
-                for route in stateful_pages:
-                    console.debug(f"BE Evaluating stateful page: {route}")
-                    self._compile_page(route, save_page=False)
+            for route in stateful_pages:
+                console.debug(f"BE Evaluating stateful page: {route}")
+                self._compile_page(route, save_page=False)
+            if manifest is not None:
+                self._check_backend_manifest(manifest, evaluated_pages=stateful_pages)
+            self._read_route_states()
             self._add_optional_endpoints()
             return
 
@@ -1209,6 +1295,7 @@ class App(MiddlewareMixin, LifespanMixin):
 
             # Save the pages which created new states at eval time.
             self._write_stateful_pages_marker()
+            self._read_route_states()
 
             # Add the optional endpoints (_upload)
             self._add_optional_endpoints()
@@ -1260,6 +1347,8 @@ class App(MiddlewareMixin, LifespanMixin):
             )
             # Save the pages which created new states at eval time.
             self._write_stateful_pages_marker()
+            if not dry_run:
+                self._write_backend_manifest()
 
         # Add the optional endpoints (_upload)
         self._add_optional_endpoints()
@@ -1331,6 +1420,12 @@ class App(MiddlewareMixin, LifespanMixin):
 
                 progress.advance(task)
 
+        if environment.REFLEX_ROUTE_SCOPED_HYDRATION.get():
+            with console.timing("Collect route states"):
+                self._collect_route_states(app_wrappers, memo_components_result)
+                if not dry_run:
+                    self._write_route_states()
+
         # Perform auto-memoization of stateful components.
         with console.timing("Auto-memoize StatefulComponents"):
             (
@@ -1548,6 +1643,169 @@ class App(MiddlewareMixin, LifespanMixin):
             with stateful_pages_marker.open("w") as f:
                 json.dump(list(self._stateful_pages), f)
 
+    def _get_backend_manifest(self) -> BackendManifest:
+        """Describe the evaluated app for the backend workers.
+
+        Returns:
+            The manifest of the app.
+        """
+        return {
+            "reflex_version": constants.Reflex.VERSION,
+            "routes": {
+                route: [
+                    _get_load_event_name(event)
+                    for event in self._load_events.get(route, [])
+                ]
+                for route in sorted(self._unevaluated_pages)
+                if route != constants.Page404.SLUG
+            },
+            "stateful_pages": list(self._stateful_pages),
+            "state_schemas": _get_state_schema_hashes(self._state),
+        }
+
+    def _write_backend_manifest(self):
+        """Write the manifest of the app for the backend workers to use later."""
+        manifest_path = (
+            prerequisites.get_backend_dir() / constants.Dirs.BACKEND_MANIFEST
+        )
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with manifest_path.open("w") as f:
+            json.dump(self._get_backend_manifest(), f)
+
+    def _read_backend_manifest(self) -> BackendManifest | None:
+        """Read the manifest of the app written by the last compile.
+
+        Returns:
+            The manifest, or None if it is missing or was written by another version of reflex.
+        """
+        manifest_path = (
+            prerequisites.get_backend_dir() / constants.Dirs.BACKEND_MANIFEST
+        )
+        if not manifest_path.exists():
+            return None
+        with manifest_path.open("r") as f:
+            manifest = json.load(f)
+        if manifest.get("reflex_version") != constants.Reflex.VERSION:
+            return None
+        return manifest
+
+    def _check_backend_manifest(
+        self, manifest: BackendManifest, evaluated_pages: list[str]
+    ):
+        """Check that the app still matches the manifest it was compiled with.
+
+        When the pages changed, the remaining pages are evaluated so that the
+        states they define exist. Nothing is written to the web directory.
+
+        Args:
+            manifest: The manifest written by the last compile.
+            evaluated_pages: The routes evaluated from the manifest.
+        """
+        current = self._get_backend_manifest()
+        if current["routes"] != manifest["routes"]:
+            console.warn(
+                "The pages of the app changed since it was compiled, evaluating all pages. "
+                "Compile the app again (e.g. with `reflex export`) to speed up the backend startup."
+            )
+            for route in self._unevaluated_pages:
+                if route not in evaluated_pages:
+                    self._compile_page(route, save_page=False)
+            current["state_schemas"] = _get_state_schema_hashes(self._state)
+        if changed_states := sorted(
+            name
+            for name in current["state_schemas"].keys() | manifest["state_schemas"]
+            if current["state_schemas"].get(name) != manifest["state_schemas"].get(name)
+        ):
+            console.warn(
+                "The following states changed since the frontend was compiled, "
+                f"compile the app again to update it: {', '.join(changed_states)}"
+            )
+
+    def _collect_route_states(
+        self, app_wrappers: dict[tuple[int, str], Component], memo_components_code: str
+    ):
+        """Determine the states rendered by each page.
+
+        States rendered by the app wrappers and custom components are rendered on every page.
+
+        Args:
+            app_wrappers: The app wrapper components.
+            memo_components_code: The compiled code of the custom components.
+        """
+        global_states = compiler_utils.get_rendered_state_names(
+            "\n".join([
+                memo_components_code,
+                *(
+                    hook
+                    for app_wrap in app_wrappers.values()
+                    for hook in app_wrap._get_all_hooks()
+                ),
+            ])
+        )
+        self._route_states = {
+            route: frozenset(
+                global_states
+                | compiler_utils.get_rendered_state_names(
+                    "\n".join(component._get_all_hooks())
+                )
+            )
+            for route, component in self._pages.items()
+        }
+
+    def _write_route_states(self):
+        """Write the states rendered by each page for the backend to use later."""
+        route_states_path = compiler_utils.get_route_states_path()
+        route_states_path.parent.mkdir(parents=True, exist_ok=True)
+        with route_states_path.open("w") as f:
+            json.dump(
+                {
+                    route: sorted(state_names)
+                    for route, state_names in self._route_states.items()
+                },
+                f,
+            )
+
+    def _read_route_states(self):
+        """Read the states rendered by each page, as written by the last compile."""
+        if not environment.REFLEX_ROUTE_SCOPED_HYDRATION.get():
+            return
+        route_states_path = compiler_utils.get_route_states_path()
+        if route_states_path.exists():
+            with route_states_path.open("r") as f:
+                self._route_states = {
+                    route: frozenset(state_names)
+                    for route, state_names in json.load(f).items()
+                }
+
+    def get_route_state_names(self, path: str) -> frozenset[str] | None:
+        """Get the full names of the states rendered by the page for a path.
+
+        Args:
+            path: The path of the page.
+
+        Returns:
+            The state names, or None if hydration is not scoped to the page.
+        """
+        if not self._route_states:
+            return None
+        return self._route_states.get(self.router(path) or constants.Page404.SLUG)
+
+    @functools.cached_property
+    def _client_storage_state_names(self) -> frozenset[str]:
+        """Get the full names of the states with vars synced to client storage.
+
+        Returns:
+            The state names.
+        """
+        state_names = set()
+        state_classes = [self._state] if self._state is not None else []
+        while state_classes:
+            state_cls = state_classes.pop()
+            state_classes.extend(state_cls.get_substates())
+            if any(state_cls._is_client_storage(name) for name in state_cls.base_vars):
+                state_names.add(state_cls.get_full_name())
+        return frozenset(state_names)
+
     def add_all_routes_endpoint(self):
         """Add an endpoint to the app that returns all the routes."""
         if not self._api:
@@ -1596,6 +1854,52 @@ class App(MiddlewareMixin, LifespanMixin):
                     token=token,
                 )
 
+    async def modify_states(
+        self,
+        tokens: Iterable[str],
+        background: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[tuple[str, BaseState]]:
+        """Modify the states of many tokens out of band.
+
+        The state manager processes the tokens in batches, which is much faster
+        than calling `modify_state` for each token when broadcasting a change.
+
+        Args:
+            tokens: The tokens to modify the states for.
+            background: Whether the modification is happening in a background task.
+            batch_size: The number of tokens locked and fetched together.
+
+        Yields:
+            Each token and its state to modify.
+
+        Raises:
+            RuntimeError: If the app has not been initialized yet.
+        """
+        if self.event_namespace is None:
+            msg = "App has not been initialized yet."
+            raise RuntimeError(msg)
+
+        async with contextlib.aclosing(
+            self.state_manager.modify_states(tokens, batch_size=batch_size)
+        ) as states:
+            async for token, state in states:
+                try:
+                    yield token, state
+                finally:
+                    # Also emitted for the last state when the caller leaves the loop early.
+                    delta = await state._get_resolved_delta()
+                    state._clean()
+                    if delta:
+                        # When the frontend vars are modified emit the delta to the frontend.
+                        await self.event_namespace.emit_update(
+                            update=StateUpdate(
+                                delta=delta,
+                                final=True if not background else None,
+                            ),
+                            token=token,
+                        )
+
     def _process_background(
         self, state: BaseState, event: Event
     ) -> asyncio.Task | None:
@@ -1623,28 +1927,64 @@ class App(MiddlewareMixin, LifespanMixin):
                 msg = "App has not been initialized yet."
                 raise RuntimeError(msg)
 
-            # Process the event.
-            async for update in state._process_event(
-                handler=handler, state=substate, payload=event.payload
-            ):
-                # Postprocess the event.
-                update = await self._postprocess(state, event, update)
-
-                # Send the update to the client.
-                await self.event_namespace.emit_update(
-                    update=update,
-                    token=event.token,
-                )
-
-        task = asyncio.create_task(
-            _coro(),
-            name=f"reflex_background_task|{event.name}|{time.time()}|{event.token}",
+            with metrics.event_scope(event.name):
+                try:
+                    # Process the event.
+                    async for update in state._process_event(
+                        handler=handler, state=substate, payload=event.payload
+                    ):
+                        # Postprocess the event.
+                        update = await self._postprocess(state, event, update)
+
+                        # Send the update to the client.
+                        await self.event_namespace.emit_update(
+                            update=update,
+                            token=event.token,
+                        )
+                finally:
+                    if isinstance(substate, StateProxy):
+                        # Write the changes still kept by a flush interval.
+                        await substate._flush()
+
+        task = self._background_task_scheduler.submit(
+            handler=event.name,
+            token=event.token,
+            coro_fn=_coro,
+            limits=handler.background_task_limits,
         )
         self._background_tasks.add(task)
         # Clean up task from background_tasks set when complete.
         task.add_done_callback(self._background_tasks.discard)
         return task
 
+    def get_background_tasks(
+        self, token: str | None = None, handler: str | None = None
+    ) -> list[BackgroundTaskInfo]:
+        """Get the queued and running background tasks.
+
+        Args:
+            token: Only include the tasks of this client token.
+            handler: Only include the tasks of this event handler (full name).
+
+        Returns:
+            The matching tasks, in the order they were submitted.
+        """
+        return self._background_task_scheduler.get_tasks(token=token, handler=handler)
+
+    def cancel_background_tasks(
+        self, token: str | None = None, handler: str | None = None
+    ) -> int:
+        """Cancel the queued and running background tasks.
+
+        Args:
+            token: Only cancel the tasks of this client token.
+            handler: Only cancel the tasks of this event handler (full name).
+
+        Returns:
+            The number of cancelled tasks.
+        """
+        return self._background_task_scheduler.cancel(token=token, handler=handler)
+
     def _validate_exception_handlers(self):
         """Validate the custom event exception handlers for front- and backend.
 
@@ -1738,6 +2078,56 @@ class App(MiddlewareMixin, LifespanMixin):
                     raise ValueError(msg)
 
 
+def _is_read_only_event(app: App, event: Event) -> bool:
+    """Check whether an event is handled by a read-only event handler.
+
+    Args:
+        app: The app to process the event for.
+        event: The event to check.
+
+    Returns:
+        Whether the event handler is declared with `read_only=True`.
+    """
+    state_path, _, name = event.name.rpartition(".")
+    try:
+        state_cls = app.state_manager.state.get_class_substate(state_path)
+    except ValueError:
+        return False
+    handler = state_cls.event_handlers.get(name)
+    return handler is not None and handler.is_read_only
+
+
+async def _process_read_only(
+    app: App, state: BaseState, event: Event
+) -> AsyncGenerator[StateUpdate]:
+    """Process an event for a read-only handler.
+
+    The handler and middleware receive read-only proxies of a state snapshot, so
+    the updates only carry events and the state is never written back. Router data
+    reflects the last event that was processed with the lock held.
+
+    Args:
+        app: The app to process the event for.
+        state: The state snapshot.
+        event: The event to process.
+
+    Yields:
+        The state updates after processing the event.
+    """
+    root_proxy = ReadOnlyStateProxy(state)
+    update = await app._preprocess(root_proxy, event)  # pyright: ignore [reportArgumentType]
+    if update is not None:
+        yield update
+        return
+    substate, handler = state._get_event_handler(event)
+    async for update in state._process_event(
+        handler=handler,
+        state=ReadOnlyStateProxy(substate),
+        payload=event.payload,
+    ):
+        yield await app._postprocess(root_proxy, event, update)  # pyright: ignore [reportArgumentType]
+
+
 async def process(
     app: App, event: Event, sid: str, headers: dict, client_ip: str
 ) -> AsyncGenerator[StateUpdate]:
@@ -1768,9 +2158,32 @@ async def process(
             constants.RouteVar.HEADERS: headers,
             constants.RouteVar.CLIENT_IP: client_ip,
         })
+        if _is_read_only_event(app, event):
+            # Read-only handlers run against a snapshot without taking the lock.
+            state = await app.state_manager.get_state_snapshot(event.substate_token)
+            # A brand new state is handled below, which signals a reload.
+            if state.router_data:
+                async for update in _process_read_only(app, state, event):
+                    yield update
+                return
+        modify_context: StateModificationContext = {"event": event}
+        route_state_names = app.get_route_state_names(
+            router_data.get(constants.RouteVar.PATH, "")
+        )
+        if route_state_names is not None:
+            root_state_name = app.state_manager.state.get_name()
+            if event.name == f"{root_state_name}.{constants.CompileVars.HYDRATE}":
+                # Hydration only sends the root state, but resets client storage in all states.
+                modify_context["states"] = app._client_storage_state_names
+            elif (
+                event.name
+                == f"{root_state_name}.{constants.CompileVars.ON_LOAD_INTERNAL}"
+            ):
+                # on_load_internal sends the states rendered by the page (see HydrateMiddleware).
+                modify_context["states"] = route_state_names
         # Get the state for the session exclusively.
         async with app.state_manager.modify_state(
-            event.substate_token, event=event
+            event.substate_token, **modify_context
         ) as state:
             # When this is a brand new instance of the state, signal the
             # frontend to reload before processing it.
@@ -1827,6 +2240,64 @@ async def process(
         raise
 
 
+class BackendManifest(TypedDict):
+    """The description of a compiled app read by the backend workers."""
+
+    # The version of reflex which compiled the app.
+    reflex_version: str
+
+    # The names of the load events of each route.
+    routes: dict[str, list[str]]
+
+    # The routes of the pages defining states when they are evaluated.
+    stateful_pages: list[str]
+
+    # The hash of the vars and event handlers of each state, by full name.
+    state_schemas: dict[str, str]
+
+
+def _get_load_event_name(event: Any) -> str:
+    """Get a name identifying a load event across processes.
+
+    Args:
+        event: The load event.
+
+    Returns:
+        The qualified name of the function handling the event.
+    """
+    if isinstance(event, EventSpec):
+        event = event.handler
+    if isinstance(event, EventHandler):
+        event = event.fn
+    return getattr(event, "__qualname__", type(event).__name__)
+
+
+def _get_state_schema_hashes(state: type[BaseState] | None) -> dict[str, str]:
+    """Hash the vars and event handlers of a state and its substates.
+
+    Args:
+        state: The root state.
+
+    Returns:
+        The hash of each state, by full name.
+    """
+    hashes = {}
+    states = [state] if state is not None else []
+    while states:
+        state = states.pop()
+        states.extend(state.class_subclasses)
+        schema = {
+            "vars": {name: str(var._var_type) for name, var in state.base_vars.items()},
+            "backend_vars": sorted(state.backend_vars),
+            "computed_vars": sorted(state.computed_vars),
+            "event_handlers": sorted(state.event_handlers),
+        }
+        hashes[state.get_full_name()] = hashlib.sha256(
+            json.dumps(schema, sort_keys=True).encode()
+        ).hexdigest()
+    return hashes
+
+
 def ping(_request: Request) -> Response:
     """Test API endpoint.
 
@@ -1839,6 +2310,20 @@ def ping(_request: Request) -> Response:
     return JSONResponse("pong")
 
 
+def event_metrics(_request: Request) -> Response:
+    """Export the event timing histograms in the Prometheus text format.
+
+    Args:
+        _request: The Starlette request object.
+
+    Returns:
+        The response.
+    """
+    return PlainTextResponse(
+        metrics.export_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
 async def health(_request: Request) -> JSONResponse:
     """Health check endpoint to assess the status of the database and Redis services.
 
@@ -1857,9 +2342,12 @@ async def health(_request: Request) -> JSONResponse:
     tasks = []
 
     if prerequisites.check_db_used():
-        from reflex.model import get_db_status
+        from reflex.model import get_async_db_status, get_db_status
 
-        tasks.append(run_in_thread(get_db_status))
+        if get_config().async_db_url is not None:
+            tasks.append(get_async_db_status())
+        else:
+            tasks.append(run_in_thread(get_db_status))
     if prerequisites.check_redis_used():
         tasks.append(prerequisites.get_redis_status())
 
@@ -1878,6 +2366,103 @@ async def health(_request: Request) -> JSONResponse:
     return JSONResponse(content=health_status, status_code=status_code)
 
 
+class _SizeLimitedRequest(Request):
+    """A request failing with 413 as soon as its body grows past a limit."""
+
+    def __init__(self, request: Request, max_bytes: int):
+        """Wrap a request whose body has not been read yet.
+
+        Args:
+            request: The request to wrap.
+            max_bytes: The maximum size of the body.
+        """
+        super().__init__(request.scope, request.receive)
+        self.max_bytes = max_bytes
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        """Read the body chunk by chunk, checking its size so far.
+
+        Yields:
+            The chunks of the body.
+
+        Raises:
+            HTTPException: when the body is larger than max_bytes.
+        """
+        size = 0
+        async for chunk in super().stream():
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise HTTPException(
+                    status_code=413, detail="The uploaded files are too large."
+                )
+            yield chunk
+
+
+class _UploadMultiPartParser(MultiPartParser):
+    """A multipart parser spooling the uploaded files under REFLEX_UPLOADED_FILES_DIR."""
+
+    def __init__(self, headers: Headers, stream: AsyncGenerator[bytes, None]):
+        """Create the parser.
+
+        Args:
+            headers: The headers of the request.
+            stream: The body of the request.
+        """
+        super().__init__(headers, stream)
+        self.spool_max_size = environment.REFLEX_UPLOAD_SPOOL_MAX_SIZE.get()
+        self.spool_dir = environment.REFLEX_UPLOADED_FILES_DIR.get()
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+    def on_headers_finished(self) -> None:
+        """Start a part, spooling its file (if any) under the spool directory."""
+        super().on_headers_finished()
+        upload_file = self._current_part.file
+        if upload_file is not None:
+            # Closed with the form, once the upload handler is done with it.
+            spooled = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+                max_size=self.spool_max_size, dir=self.spool_dir
+            )
+            upload_file.file.close()
+            self._files_to_close_on_error[-1] = spooled
+            upload_file.file = cast(BinaryIO, spooled)
+
+    async def parse(self) -> FormData:
+        """Parse the body, closing the files opened so far when it fails.
+
+        Returns:
+            The parsed form.
+        """
+        try:
+            return await super().parse()
+        except BaseException:
+            # Also covers a body rejected mid-parse with 413.
+            for file in self._files_to_close_on_error:
+                file.close()
+            raise
+
+
+async def _parse_upload_form(request: Request) -> FormData:
+    """Parse the form of an upload request, spooling large files to disk.
+
+    Args:
+        request: The upload request.
+
+    Returns:
+        The parsed form (empty when the request is not multipart).
+
+    Raises:
+        HTTPException: when the body is not valid multipart data.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.partition(";")[0].strip().lower() != "multipart/form-data":
+        return FormData()
+    try:
+        async with contextlib.aclosing(request.stream()) as stream:
+            return await _UploadMultiPartParser(request.headers, stream).parse()
+    except MultiPartException as err:
+        raise HTTPException(status_code=400, detail=err.message) from err
+
+
 def upload(app: App):
     """Upload a file.
 
@@ -1899,18 +2484,57 @@ def upload(app: App):
             emitted by the upload handler.
 
         Raises:
-            UploadValueError: if there are no args with supported annotation.
-            UploadTypeError: if a background task is used as the handler.
-            HTTPException: when the request does not include token / handler headers.
+            HTTPException: when the uploaded files are larger than REFLEX_UPLOAD_MAX_BYTES.
         """
-        from reflex.utils.exceptions import UploadTypeError, UploadValueError
+        max_bytes = environment.REFLEX_UPLOAD_MAX_BYTES.get()
+        content_length = request.headers.get("content-length")
+        if (
+            max_bytes is not None
+            and content_length is not None
+            and content_length.isdigit()
+            and int(content_length) > max_bytes
+        ):
+            raise HTTPException(
+                status_code=413, detail="The uploaded files are too large."
+            )
 
         # Get the files from the request.
+        # Each file is spooled to a temporary file under REFLEX_UPLOADED_FILES_DIR
+        # once it is larger than REFLEX_UPLOAD_SPOOL_MAX_SIZE, so uploads do not
+        # have to fit in memory.
+        if max_bytes is not None:
+            request = _SizeLimitedRequest(request, max_bytes)
         try:
-            files = await request.form()
+            form = await _parse_upload_form(request)
         except ClientDisconnect:
             return Response()  # user cancelled
-        files = files.getlist("files")
+        try:
+            return await _process_upload(request, form)
+        except BaseException:
+            await form.close()
+            raise
+
+    async def _process_upload(request: Request, form: FormData) -> StreamingResponse:
+        """Process the upload event with the files of a parsed form.
+
+        The files are closed once the upload handler is done with them.
+
+        Args:
+            request: The Starlette request object.
+            form: The parsed form of the request.
+
+        Returns:
+            StreamingResponse yielding newline-delimited JSON of StateUpdate
+            emitted by the upload handler.
+
+        Raises:
+            UploadValueError: if there are no args with supported annotation.
+            UploadTypeError: if a background task is used as the handler.
+            HTTPException: when the request does not include token / handler headers.
+        """
+        from reflex.utils.exceptions import UploadTypeError, UploadValueError
+
+        files = form.getlist("files")
         if not files:
             msg = "No files were uploaded."
             raise UploadValueError(msg)
@@ -1960,36 +2584,23 @@ def upload(app: App):
             )
             raise UploadValueError(msg)
 
-        # Make a copy of the files as they are closed after the request.
-        # This behaviour changed from fastapi 0.103.0 to 0.103.1 as the
-        # AsyncExitStack was removed from the request scope and is now
-        # part of the routing function which closes this before the
-        # event is handled.
+        # The handler reads the files spooled by the multipart parser, they
+        # are not closed before the response is done streaming.
         file_copies = []
         for file in files:
             if not isinstance(file, StarletteUploadFile):
                 raise UploadValueError(
                     "Uploaded file is not an UploadFile." + str(file)
                 )
-            content_copy = io.BytesIO()
-            content_copy.write(await file.read())
-            content_copy.seek(0)
             file_copies.append(
                 UploadFile(
-                    file=content_copy,
+                    file=file.file,
                     path=Path(file.filename.lstrip("/")) if file.filename else None,
                     size=file.size,
                     headers=file.headers,
                 )
             )
 
-        for file in files:
-            if not isinstance(file, StarletteUploadFile):
-                raise UploadValueError(
-                    "Uploaded file is not an UploadFile." + str(file)
-                )
-            await file.close()
-
         event = Event(
             token=token,
             name=handler,
@@ -2002,12 +2613,18 @@ def upload(app: App):
             Yields:
                 Each state update as JSON followed by a new line.
             """
-            # Process the event.
-            async with app.state_manager.modify_state(event.substate_token) as state:
-                async for update in state._process(event):
-                    # Postprocess the event.
-                    update = await app._postprocess(state, event, update)
-                    yield update.json() + "\n"
+            try:
+                # Process the event.
+                async with app.state_manager.modify_state(
+                    event.substate_token
+                ) as state:
+                    async for update in state._process(event):
+                        # Postprocess the event.
+                        update = await app._postprocess(state, event, update)
+                        yield update.json() + "\n"
+            finally:
+                # Remove the spooled files once the handler is done with them.
+                await form.close()
 
         # Stream updates to client
         return StreamingResponse(
@@ -2018,12 +2635,32 @@ def upload(app: App):
     return upload_file
 
 
+@dataclasses.dataclass
+class EmitStats:
+    """Byte counters for state updates sent as binary frames."""
+
+    # The number of binary updates sent.
+    messages: int = 0
+
+    # The number of binary updates that were compressed.
+    compressed_messages: int = 0
+
+    # The size of the JSON encoded updates.
+    bytes_before: int = 0
+
+    # The size of the frames sent over the socket.
+    bytes_after: int = 0
+
+
 class EventNamespace(AsyncNamespace):
     """The event namespace."""
 
     # The application object.
     app: App
 
+    # Byte counters for binary state updates.
+    emit_stats: EmitStats
+
     def __init__(self, namespace: str, app: App):
         """Initialize the event namespace.
 
@@ -2037,6 +2674,26 @@ class EventNamespace(AsyncNamespace):
         # Use TokenManager for distributed duplicate tab prevention
         self._token_manager = TokenManager.create()
 
+        # The update encoding negotiated with each client that supports binary updates.
+        self._update_encodings: dict[str, str] = {}
+        self._binary_updates = environment.REFLEX_SOCKET_BINARY_UPDATES.get()
+        self._compression_threshold = (
+            environment.REFLEX_SOCKET_COMPRESSION_THRESHOLD.get()
+        )
+        self._fast_json = environment.REFLEX_SOCKET_FAST_JSON.get()
+        self.emit_stats = EmitStats()
+
+        # Per worker caps on the connections and the events being processed.
+        config = get_config()
+        self._max_connections = config.max_connections_per_worker
+        self._connected_sids: set[str] = set()
+        self._event_slots = (
+            asyncio.Semaphore(config.max_events_per_worker)
+            if config.max_events_per_worker is not None
+            else None
+        )
+        self._reject_events = config.event_backpressure == "reject"
+
     @property
     def token_to_sid(self) -> Mapping[str, str]:
         """Get token to SID mapping for backward compatibility.
@@ -2065,16 +2722,41 @@ class EventNamespace(AsyncNamespace):
         Args:
             sid: The Socket.IO session id.
             environ: The request information, including HTTP headers.
+
+        Raises:
+            SocketConnectionRefusedError: If the worker has max_connections_per_worker connections.
         """
-        if isinstance(self._token_manager, RedisTokenManager):
-            # Make sure this instance is watching for updates from other instances.
-            self._token_manager.ensure_lost_and_found_task(self.emit_update)
-        query_params = urllib.parse.parse_qs(environ.get("QUERY_STRING", ""))
-        token_list = query_params.get("token", [])
-        if token_list:
-            await self.link_token_to_sid(sid, token_list[0])
-        else:
-            console.warn(f"No token provided in connection for session {sid}")
+        if (
+            self._max_connections is not None
+            and len(self._connected_sids) >= self._max_connections
+        ):
+            console.warn(
+                f"Refusing connection {sid}: the worker has {len(self._connected_sids)} connections."
+            )
+            # The client retries connecting with an incremental backoff.
+            msg = "Too many connections, retry later."
+            raise SocketConnectionRefusedError(msg)
+        # Counted before linking the token, so concurrent connections see the cap.
+        self._connected_sids.add(sid)
+        try:
+            if isinstance(self._token_manager, RedisTokenManager):
+                # Make sure this instance is watching for updates from other instances.
+                self._token_manager.ensure_lost_and_found_task(self.emit_update)
+            query_params = urllib.parse.parse_qs(environ.get("QUERY_STRING", ""))
+            token_list = query_params.get("token", [])
+            if token_list:
+                await self.link_token_to_sid(sid, token_list[0])
+            else:
+                console.warn(f"No token provided in connection for session {sid}")
+        except BaseException:
+            # A failed connection is never disconnected, release its slot here.
+            self._connected_sids.discard(sid)
+            raise
+
+        if self._binary_updates and (
+            encoding := query_params.get(constants.UpdateEncoding.QUERY_PARAM, [""])[0]
+        ) in (constants.UpdateEncoding.BINARY, constants.UpdateEncoding.DEFLATE):
+            self._update_encodings[sid] = encoding
 
         subprotocol = environ.get("HTTP_SEC_WEBSOCKET_PROTOCOL")
         if subprotocol and subprotocol != constants.Reflex.VERSION:
@@ -2091,9 +2773,13 @@ class EventNamespace(AsyncNamespace):
         Returns:
             An asyncio Task for cleaning up the token, or None.
         """
+        self._update_encodings.pop(sid, None)
+        self._connected_sids.discard(sid)
         # Get token before cleaning up
         disconnect_token = self.sid_to_token.get(sid)
         if disconnect_token:
+            if environment.REFLEX_CANCEL_BACKGROUND_TASKS_ON_DISCONNECT.get():
+                self.app.cancel_background_tasks(token=disconnect_token)
             # Use async cleanup through token manager
             task = asyncio.create_task(
                 self._token_manager.disconnect_token(disconnect_token, sid),
@@ -2135,11 +2821,55 @@ class EventNamespace(AsyncNamespace):
                     f"Attempting to send delta to disconnected client {token!r}"
                 )
             return
+        if (encoding := self._update_encodings.get(socket_record.sid)) is not None:
+            with metrics.measure(EventPhase.SERIALIZE):
+                frame = self._encode_update(update, encoding)
+            emit = self.emit(
+                str(constants.SocketEvent.EVENT_BINARY), frame, to=socket_record.sid
+            )
+        else:
+            emit = self.emit(
+                str(constants.SocketEvent.EVENT), update, to=socket_record.sid
+            )
         # Creating a task prevents the update from being blocked behind other coroutines.
-        await asyncio.create_task(
-            self.emit(str(constants.SocketEvent.EVENT), update, to=socket_record.sid),
-            name=f"reflex_emit_event|{token}|{socket_record.sid}|{time.time()}",
+        with metrics.measure(EventPhase.EMIT):
+            await asyncio.create_task(
+                emit,
+                name=f"reflex_emit_event|{token}|{socket_record.sid}|{time.time()}",
+            )
+
+    def _encode_update(self, update: StateUpdate, encoding: str) -> bytes:
+        """Encode a state update as a binary frame.
+
+        The first byte of the frame is a flag describing the encoding of the
+        rest of the frame, which is UTF-8 JSON, optionally zlib compressed.
+
+        Args:
+            update: The state update to encode.
+            encoding: The encoding negotiated with the client.
+
+        Returns:
+            The binary frame.
+        """
+        payload = format.json_dumps_bytes(
+            {"delta": update.delta, "events": update.events, "final": update.final},
+            fast=self._fast_json,
         )
+        self.emit_stats.messages += 1
+        self.emit_stats.bytes_before += len(payload)
+        if (
+            encoding == constants.UpdateEncoding.DEFLATE
+            and self._compression_threshold is not None
+            and len(payload) > self._compression_threshold
+        ):
+            frame = bytes((constants.UpdateEncoding.FLAG_DEFLATE,)) + zlib.compress(
+                payload, level=1
+            )
+            self.emit_stats.compressed_messages += 1
+        else:
+            frame = bytes((constants.UpdateEncoding.FLAG_RAW,)) + payload
+        self.emit_stats.bytes_after += len(frame)
+        return frame
 
     async def on_event(self, sid: str, data: Any):
         """Event for receiving front-end websocket events.
@@ -2218,13 +2948,38 @@ class EventNamespace(AsyncNamespace):
             .strip()
         )
 
-        async with contextlib.aclosing(
-            process(self.app, event, sid, headers, client_ip)
-        ) as updates_gen:
-            # Process the events.
-            async for update in updates_gen:
-                # Emit the update from processing the event.
-                await self.emit_update(update=update, token=event.token)
+        if self._event_slots is None:
+            await self._process_event(event, sid, headers, client_ip)
+        elif self._reject_events and self._event_slots.locked():
+            console.warn(
+                f"Rejecting event {event.name} for {event.token}: the worker is processing max_events_per_worker events."
+            )
+            # The final update lets the client send its next events.
+            await self.emit_update(update=StateUpdate(), token=event.token)
+        else:
+            async with self._event_slots:
+                await self._process_event(event, sid, headers, client_ip)
+
+    async def _process_event(
+        self, event: Event, sid: str, headers: dict[str, str], client_ip: str
+    ):
+        """Process an event and emit its updates.
+
+        Args:
+            event: The event to process.
+            sid: The Socket.IO session id.
+            headers: The client headers.
+            client_ip: The client ip.
+        """
+        # The event is named once its handler is found.
+        with metrics.event_scope():
+            async with contextlib.aclosing(
+                process(self.app, event, sid, headers, client_ip)
+            ) as updates_gen:
+                # Process the events.
+                async for update in updates_gen:
+                    # Emit the update from processing the event.
+                    await self.emit_update(update=update, token=event.token)
 
     async def on_ping(self, sid: str):
         """Event for testing the API endpoint.
@@ -12,6 +12,7 @@ from collections.abc import Callable, Coroutine
 
 from starlette.applications import Starlette
 
+from reflex.istate.executor import shutdown_sync_handler_executor
 from reflex.utils import console
 from reflex.utils.exceptions import InvalidLifespanTaskTypeError
 
@@ -78,6 +79,8 @@ class LifespanMixin(AppMixin):
             pass
         else:
             await state_manager.close()
+        # Wait for threaded event handlers still running.
+        await asyncio.to_thread(shutdown_sync_handler_executor)
 
     def register_lifespan_task(self, task: Callable | asyncio.Task, **task_kwargs):
         """Register a task to run during the lifespan of the app.
@@ -17,6 +17,7 @@ from reflex.components.component import (
     ComponentStyle,
     CustomComponent,
     StatefulComponent,
+    memoize_tree_aggregates,
 )
 from reflex.config import get_config
 from reflex.constants.compiler import PageNames, ResetStylesheet
@@ -90,17 +91,18 @@ def _compile_app(app_root: Component) -> str:
 
     window_libraries_deduped = list(dict.fromkeys(window_libraries))
 
-    app_root_imports = app_root._get_all_imports()
-    _apply_common_imports(app_root_imports)
-
-    return templates.app_root_template(
-        imports=utils.compile_imports(app_root_imports),
-        custom_codes=app_root._get_all_custom_code(),
-        hooks=app_root._get_all_hooks(),
-        window_libraries=window_libraries_deduped,
-        render=app_root.render(),
-        dynamic_imports=app_root._get_all_dynamic_imports(),
-    )
+    with memoize_tree_aggregates():
+        app_root_imports = app_root._get_all_imports()
+        _apply_common_imports(app_root_imports)
+
+        return templates.app_root_template(
+            imports=utils.compile_imports(app_root_imports),
+            custom_codes=app_root._get_all_custom_code(),
+            hooks=app_root._get_all_hooks(),
+            window_libraries=window_libraries_deduped,
+            render=app_root.render(),
+            dynamic_imports=app_root._get_all_dynamic_imports(),
+        )
 
 
 def _compile_theme(theme: str) -> str:
@@ -154,18 +156,19 @@ def _compile_page(component: BaseComponent) -> str:
     Returns:
         The compiled component.
     """
-    imports = component._get_all_imports()
-    _apply_common_imports(imports)
-    imports = utils.compile_imports(imports)
-
-    # Compile the code to render the component.
-    return templates.page_template(
-        imports=imports,
-        dynamic_imports=sorted(component._get_all_dynamic_imports()),
-        custom_codes=component._get_all_custom_code(),
-        hooks=component._get_all_hooks(),
-        render=component.render(),
-    )
+    with memoize_tree_aggregates():
+        imports = component._get_all_imports()
+        _apply_common_imports(imports)
+        imports = utils.compile_imports(imports)
+
+        # Compile the code to render the component.
+        return templates.page_template(
+            imports=imports,
+            dynamic_imports=sorted(component._get_all_dynamic_imports()),
+            custom_codes=component._get_all_custom_code(),
+            hooks=component._get_all_hooks(),
+            render=component.render(),
+        )
 
 
 def compile_root_stylesheet(
@@ -443,8 +446,11 @@ def _compile_stateful_components(
             # Indicate that this component now imports from the shared file.
             component.rendered_as_shared = True
 
-    for page_component in page_components:
-        get_shared_components_recursive(page_component)
+    # Shared components are marked depth-first, so every memoized aggregate
+    # already sees the final rendered_as_shared flags of its descendants.
+    with memoize_tree_aggregates():
+        for page_component in page_components:
+            get_shared_components_recursive(page_component)
 
     # Don't import from the file that we're about to create.
     all_imports = utils.merge_imports(*all_import_dicts)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 import operator
+import re
 import traceback
 from collections.abc import Mapping, Sequence
 from datetime import datetime
@@ -16,17 +17,22 @@ from reflex import constants
 from reflex.components.base import Description, Image, Scripts
 from reflex.components.base.document import Links, ScrollRestoration
 from reflex.components.base.document import Meta as ReactMeta
-from reflex.components.component import Component, ComponentStyle, CustomComponent
+from reflex.components.component import (
+    Component,
+    ComponentStyle,
+    CustomComponent,
+    memoize_tree_aggregates,
+)
 from reflex.components.el.elements.metadata import Head, Link, Meta, Title
 from reflex.components.el.elements.other import Html
 from reflex.components.el.elements.sectioning import Body
 from reflex.constants.state import FIELD_MARKER
 from reflex.istate.storage import Cookie, LocalStorage, SessionStorage
-from reflex.state import BaseState, _resolve_delta
+from reflex.state import BaseState, _resolve_delta, all_base_state_classes
 from reflex.style import Style
 from reflex.utils import format, imports, path_ops
 from reflex.utils.imports import ImportVar, ParsedImportDict
-from reflex.utils.prerequisites import get_web_dir
+from reflex.utils.prerequisites import get_backend_dir, get_web_dir
 from reflex.vars.base import Field, Var, VarData
 
 # To re-export this function.
@@ -325,30 +331,31 @@ def compile_custom_component(
     # Render the component.
     render = component.get_component()
 
-    # Get the imports.
-    imports: ParsedImportDict = {
-        lib: fields
-        for lib, fields in render._get_all_imports().items()
-        if lib != component.library
-    }
+    with memoize_tree_aggregates():
+        # Get the imports.
+        imports: ParsedImportDict = {
+            lib: fields
+            for lib, fields in render._get_all_imports().items()
+            if lib != component.library
+        }
 
-    imports.setdefault("@emotion/react", []).append(ImportVar("jsx"))
-
-    # Concatenate the props.
-    props = list(component.props)
-
-    # Compile the component.
-    return (
-        {
-            "name": component.tag,
-            "props": props,
-            "render": render.render(),
-            "hooks": render._get_all_hooks(),
-            "custom_code": render._get_all_custom_code(),
-            "dynamic_imports": render._get_all_dynamic_imports(),
-        },
-        imports,
-    )
+        imports.setdefault("@emotion/react", []).append(ImportVar("jsx"))
+
+        # Concatenate the props.
+        props = list(component.props)
+
+        # Compile the component.
+        return (
+            {
+                "name": component.tag,
+                "props": props,
+                "render": render.render(),
+                "hooks": render._get_all_hooks(),
+                "custom_code": render._get_all_custom_code(),
+                "dynamic_imports": render._get_all_dynamic_imports(),
+            },
+            imports,
+        )
 
 
 def create_document_root(
@@ -497,6 +504,40 @@ def get_page_path(path: str) -> str:
     )
 
 
+def get_rendered_state_names(code: str) -> set[str]:
+    """Get the full names of the states whose contexts are used by compiled code.
+
+    The parents of each state are included, since a substate is only sent to the
+    frontend along with its ancestors.
+
+    Args:
+        code: The compiled code (or hooks) to scan.
+
+    Returns:
+        The full names of the rendered states.
+    """
+    state_names = {
+        format.format_state_name(state_name): state_name
+        for state_name in all_base_state_classes
+    }
+    rendered = set()
+    for formatted_name in re.findall(r"StateContexts\.(\w+)", code):
+        state_name = state_names.get(formatted_name)
+        while state_name and state_name not in rendered:
+            rendered.add(state_name)
+            state_name = state_name.rpartition(".")[0]
+    return rendered
+
+
+def get_route_states_path() -> Path:
+    """Get the path of the file mapping each route to the states it renders.
+
+    Returns:
+        The path of the route states file.
+    """
+    return get_backend_dir() / constants.Dirs.ROUTE_STATES
+
+
 def get_theme_path() -> str:
     """Get the path of the base theme style.
 
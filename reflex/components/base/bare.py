@@ -5,7 +5,12 @@ from __future__ import annotations
 from collections.abc import Iterator, Sequence
 from typing import Any
 
-from reflex.components.component import BaseComponent, Component, ComponentStyle
+from reflex.components.component import (
+    BaseComponent,
+    Component,
+    ComponentStyle,
+    _memoized_tree_aggregate,
+)
 from reflex.components.tags import Tag
 from reflex.components.tags.tagless import Tagless
 from reflex.environment import PerformanceMode, environment
@@ -77,6 +82,7 @@ class Bare(Component):
 
         return cls._unsafe_create(children=[], contents=contents)
 
+    @_memoized_tree_aggregate
     def _get_all_hooks_internal(self) -> dict[str, VarData | None]:
         """Include the hooks for the component.
 
@@ -89,6 +95,7 @@ class Bare(Component):
                 hooks |= component._get_all_hooks_internal()
         return hooks
 
+    @_memoized_tree_aggregate
     def _get_all_hooks(self) -> dict[str, VarData | None]:
         """Include the hooks for the component.
 
@@ -101,6 +108,7 @@ class Bare(Component):
                 hooks |= component._get_all_hooks()
         return hooks
 
+    @_memoized_tree_aggregate
     def _get_all_imports(self, collapse: bool = False) -> ParsedImportDict:
         """Include the imports for the component.
 
@@ -117,6 +125,7 @@ class Bare(Component):
                 imports |= {k: list(v) for k, v in var_data.imports}
         return imports
 
+    @_memoized_tree_aggregate
     def _get_all_dynamic_imports(self) -> set[str]:
         """Get dynamic imports for the component.
 
@@ -129,6 +138,7 @@ class Bare(Component):
                 dynamic_imports |= component._get_all_dynamic_imports()
         return dynamic_imports
 
+    @_memoized_tree_aggregate
     def _get_all_custom_code(self) -> dict[str, None]:
         """Get custom code for the component.
 
@@ -166,6 +176,7 @@ class Bare(Component):
                     )
         return app_wrap_components
 
+    @_memoized_tree_aggregate
     def _get_all_refs(self) -> dict[str, None]:
         """Get the refs for the children of the component.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import contextvars
 import copy
 import dataclasses
 import enum
@@ -67,6 +68,76 @@ from reflex.vars.object import ObjectVar
 from reflex.vars.sequence import LiteralArrayVar, LiteralStringVar, StringVar
 
 FIELD_TYPE = TypeVar("FIELD_TYPE")
+AGGREGATE = TypeVar("AGGREGATE", bound=Callable[..., Any])
+
+# The memoized `_get_all_*` results of the tree being compiled, keyed by component id and method.
+_tree_aggregates: contextvars.ContextVar[dict[tuple, tuple[Any, Any]] | None] = (
+    contextvars.ContextVar("_tree_aggregates", default=None)
+)
+
+
+@contextlib.contextmanager
+def memoize_tree_aggregates() -> Iterator[None]:
+    """Compute each `_get_all_*` aggregate at most once per component within the block.
+
+    Nested and var-embedded subtrees are otherwise walked again at every level
+    that aggregates them. The component tree must not be modified while the
+    block is active; the memoized results are discarded when it exits.
+
+    Yields:
+        None
+    """
+    if _tree_aggregates.get() is not None:
+        yield
+        return
+    token = _tree_aggregates.set({})
+    try:
+        yield
+    finally:
+        _tree_aggregates.reset(token)
+
+
+def _copy_aggregate(value: Any) -> Any:
+    """Copy a memoized aggregate so callers can merge into it freely.
+
+    Args:
+        value: The aggregate (a dict of hooks, code, refs or imports, or a set).
+
+    Returns:
+        A copy of the aggregate.
+    """
+    if isinstance(value, set):
+        return set(value)
+    return {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+
+
+def _memoized_tree_aggregate(fn: AGGREGATE) -> AGGREGATE:
+    """Memoize a `_get_all_*` method while `memoize_tree_aggregates` is active.
+
+    Args:
+        fn: The method to memoize.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @wraps(fn)
+    def wrapper(self: BaseComponent, *args, **kwargs):
+        cache = _tree_aggregates.get()
+        if cache is None:
+            return fn(self, *args, **kwargs)
+        key = (id(self), fn, *args, *kwargs.items())
+        entry = cache.get(key)
+        if entry is None:
+            # Keep a reference to the component so its id is not reused.
+            result = fn(self, *args, **kwargs)
+            cache[key] = (self, result)
+        else:
+            result = entry[1]
+        # Callers get a copy they may merge into without affecting the memoized value.
+        return _copy_aggregate(result)
+
+    return cast("AGGREGATE", wrapper)
 
 
 class ComponentField(BaseField[FIELD_TYPE]):
@@ -1486,6 +1557,7 @@ class Component(BaseComponent, ABC):
         """
         return None
 
+    @_memoized_tree_aggregate
     def _get_all_custom_code(self) -> dict[str, None]:
         """Get custom code for the component and its children.
 
@@ -1523,6 +1595,7 @@ class Component(BaseComponent, ABC):
         """
         return None
 
+    @_memoized_tree_aggregate
     def _get_all_dynamic_imports(self) -> set[str]:
         """Get dynamic imports for the component and its children.
 
@@ -1635,6 +1708,7 @@ class Component(BaseComponent, ABC):
             *added_import_dicts,
         )
 
+    @_memoized_tree_aggregate
     def _get_all_imports(self, collapse: bool = False) -> ParsedImportDict:
         """Get all the libraries and fields that are used by the component and its children.
 
@@ -1780,6 +1854,7 @@ class Component(BaseComponent, ABC):
         """
         return
 
+    @_memoized_tree_aggregate
     def _get_all_hooks_internal(self) -> dict[str, VarData | None]:
         """Get the reflex internal hooks for the component and its children.
 
@@ -1795,6 +1870,7 @@ class Component(BaseComponent, ABC):
 
         return code
 
+    @_memoized_tree_aggregate
     def _get_all_hooks(self) -> dict[str, VarData | None]:
         """Get the React hooks for this component and its children.
 
@@ -1830,6 +1906,7 @@ class Component(BaseComponent, ABC):
             return None
         return format.format_ref(self.id)
 
+    @_memoized_tree_aggregate
     def _get_all_refs(self) -> dict[str, None]:
         """Get the refs for the children of the component.
 
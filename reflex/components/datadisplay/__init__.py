@@ -11,6 +11,14 @@ _SUBMOD_ATTRS: dict[str, list[str]] = {
         "LiteralCodeLanguage",
     ],
     "dataeditor": ["data_editor", "data_editor_theme", "DataEditorTheme"],
+    "datasource": [
+        "DataFrameDataSource",
+        "DataQuery",
+        "DataSource",
+        "DataSourceState",
+        "ModelDataSource",
+        "SequenceDataSource",
+    ],
     "logo": ["logo"],
 }
 
@@ -194,6 +194,9 @@ class DataEditor(NoSSRComponent):
     # The data.
     data: Var[Sequence[Sequence[Any]]]
 
+    # The index of the row of the first item of data, when data only holds a window of the rows.
+    data_offset: Var[int]
+
     # The name of the callback used to find the data to display.
     get_cell_content: Var[str]
 
@@ -332,6 +335,9 @@ class DataEditor(NoSSRComponent):
     # Fired when a column is resized.
     on_column_resize: EventHandler[passthrough_event_spec(GridColumn, int)]
 
+    # Fired when the visible region of the grid changes, e.g. when scrolling.
+    on_visible_region_changed: EventHandler[passthrough_event_spec(Rectangle)]
+
     def add_imports(self) -> ImportDict:
         """Add imports for the component.
 
@@ -368,9 +374,10 @@ class DataEditor(NoSSRComponent):
 
         columns_path = str(self.columns)
         data_path = str(self.data)
+        offset = f", {self.data_offset!s}" if self.data_offset is not None else ""
 
         code.extend([
-            f"    return formatDataEditorCells(col, row, {columns_path}, {data_path});",
+            f"    return formatDataEditorCells(col, row, {columns_path}, {data_path}{offset});",
             "  }",
         ])
 
@@ -436,6 +443,14 @@ class DataEditor(NoSSRComponent):
             height=props.pop("height", "100%"),
         )
 
+    def _exclude_props(self) -> list[str]:
+        """Props only used to build the getData callback.
+
+        Returns:
+            The props not passed to the grid.
+        """
+        return [*super()._exclude_props(), "data_offset"]
+
     @staticmethod
     def _get_app_wrap_components() -> dict[tuple[int, str], Component]:
         """Get the app wrap components for the component.
@@ -0,0 +1,612 @@
+"""Server side data sources serving windows of rows to the data editor."""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import functools
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from reflex.components.datadisplay.dataeditor import DataEditor, Rectangle
+from reflex.event import event
+from reflex.state import State
+from reflex.utils import format
+from reflex.utils.misc import run_in_thread
+from reflex.vars.base import computed_var
+
+if TYPE_CHECKING:
+    from reflex.components.component import Component
+    from reflex.model import Model
+
+
+@dataclasses.dataclass(frozen=True)
+class DataQuery:
+    """The ordering and filtering of the rows of a data source."""
+
+    # The column to sort the rows by, None to keep the source order.
+    sort_column: str | None = None
+
+    # Whether to sort in descending order.
+    sort_descending: bool = False
+
+    # Keep the rows whose column contains the value (case insensitive), by column.
+    filters: tuple[tuple[str, str], ...] = ()
+
+
+class DataSource(abc.ABC):
+    """A dataset kept on the server, serving windows of rows on demand."""
+
+    @property
+    @abc.abstractmethod
+    def columns(self) -> list[str]:
+        """The names of the columns.
+
+        Returns:
+            The names of the columns, in display order.
+        """
+
+    @abc.abstractmethod
+    async def count(self, query: DataQuery) -> int:
+        """Count the rows matching a query.
+
+        Args:
+            query: The filters to apply.
+
+        Returns:
+            The number of matching rows.
+        """
+
+    @abc.abstractmethod
+    async def fetch(self, query: DataQuery, offset: int, limit: int) -> list[list]:
+        """Get a window of the rows matching a query.
+
+        Args:
+            query: The ordering and filters to apply.
+            offset: The index of the first row of the window.
+            limit: The maximum number of rows in the window.
+
+        Returns:
+            The values of each row, in column order.
+        """
+
+    def invalidate(self):  # noqa: B027
+        """Forget what was cached about the rows, after the data changed."""
+
+
+class _CachedDataSource(DataSource):
+    """A data source keeping the rows matching its last queries."""
+
+    # The number of queries whose matching rows are kept, so clients with
+    # different orderings do not filter and sort the rows again on every scroll.
+    max_cached_queries: ClassVar[int] = 8
+
+    def __init__(self):
+        """Create a data source with an empty cache."""
+        # The rows matching the last queries, least recently used first.
+        self._matches: dict[DataQuery, Any] = {}
+
+    @abc.abstractmethod
+    def _match(self, query: DataQuery) -> Any:
+        """Filter and sort the rows for a query.
+
+        Args:
+            query: The ordering and filters to apply.
+
+        Returns:
+            The matching rows, in order.
+        """
+
+    async def _get_matches(self, query: DataQuery) -> Any:
+        """Get the rows matching a query, filtering and sorting them on a cache miss.
+
+        The rows are filtered and sorted in a thread, so that large datasets do
+        not block the event loop.
+
+        Args:
+            query: The ordering and filters to apply.
+
+        Returns:
+            The matching rows, in order.
+        """
+        matches = self._matches.pop(query, None)
+        if matches is None:
+            matches = await run_in_thread(functools.partial(self._match, query))
+            if len(self._matches) >= self.max_cached_queries:
+                del self._matches[next(iter(self._matches))]
+        self._matches[query] = matches
+        return matches
+
+    def invalidate(self):
+        """Forget the rows matching the last queries, after the data changed."""
+        self._matches.clear()
+
+
+def _contains(value: Any, text: str) -> bool:
+    """Check whether the string form of a value contains a text, ignoring case.
+
+    Args:
+        value: The value of the cell.
+        text: The text to look for.
+
+    Returns:
+        Whether the value matches the filter.
+    """
+    return text.casefold() in str(value).casefold()
+
+
+class SequenceDataSource(_CachedDataSource):
+    """Rows held in memory: sequences, mappings or objects such as `rx.Model` instances.
+
+    Call `invalidate` (or the `refresh` event of the state) after modifying the rows in place.
+    """
+
+    def __init__(self, rows: Sequence[Any], columns: Sequence[str]):
+        """Create a data source over rows held in memory.
+
+        Args:
+            rows: The rows, as sequences of values in column order, mappings or objects.
+            columns: The names of the columns (keys or attribute names for mappings and objects).
+        """
+        super().__init__()
+        self._rows = rows
+        self._columns = list(columns)
+
+    @property
+    def rows(self) -> Sequence[Any]:
+        """The rows.
+
+        Returns:
+            The rows, in source order.
+        """
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows: Sequence[Any]):
+        """Replace the rows.
+
+        Args:
+            rows: The new rows.
+        """
+        self._rows = rows
+        self.invalidate()
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the columns.
+
+        Returns:
+            The names of the columns, in display order.
+        """
+        return self._columns
+
+    def _get_value(self, row: Any, column: str) -> Any:
+        """Get the value of a cell.
+
+        Args:
+            row: The row.
+            column: The name of the column.
+
+        Returns:
+            The value of the row in the column.
+        """
+        if isinstance(row, Mapping):
+            return row.get(column)
+        if isinstance(row, Sequence) and not isinstance(row, str):
+            return row[self._columns.index(column)]
+        return getattr(row, column, None)
+
+    def _match(self, query: DataQuery) -> list[int]:
+        """Get the indices of the rows matching a query, in order.
+
+        Args:
+            query: The ordering and filters to apply.
+
+        Returns:
+            The indices of the matching rows.
+        """
+        matches = [
+            index
+            for index, row in enumerate(self.rows)
+            if all(
+                _contains(self._get_value(row, column), text)
+                for column, text in query.filters
+            )
+        ]
+        if query.sort_column is not None:
+            column = query.sort_column
+            # Never compare missing values with the others.
+            matches.sort(
+                key=lambda index: (
+                    (value := self._get_value(self.rows[index], column)) is None,
+                    value,
+                ),
+                reverse=query.sort_descending,
+            )
+        return matches
+
+    async def count(self, query: DataQuery) -> int:
+        """Count the rows matching a query.
+
+        Args:
+            query: The filters to apply.
+
+        Returns:
+            The number of matching rows.
+        """
+        return len(await self._get_matches(query))
+
+    async def fetch(self, query: DataQuery, offset: int, limit: int) -> list[list]:
+        """Get a window of the rows matching a query.
+
+        Args:
+            query: The ordering and filters to apply.
+            offset: The index of the first row of the window.
+            limit: The maximum number of rows in the window.
+
+        Returns:
+            The values of each row, in column order.
+        """
+        return [
+            [self._get_value(self.rows[index], column) for column in self._columns]
+            for index in (await self._get_matches(query))[offset : offset + limit]
+        ]
+
+
+class DataFrameDataSource(_CachedDataSource):
+    """The rows of a pandas DataFrame.
+
+    Call `invalidate` (or the `refresh` event of the state) after modifying the DataFrame in place.
+    """
+
+    def __init__(self, df: Any):
+        """Create a data source over a pandas DataFrame.
+
+        Args:
+            df: The DataFrame.
+        """
+        super().__init__()
+        self._df = df
+
+    @property
+    def df(self) -> Any:
+        """The DataFrame.
+
+        Returns:
+            The DataFrame of the rows.
+        """
+        return self._df
+
+    @df.setter
+    def df(self, df: Any):
+        """Replace the DataFrame.
+
+        Args:
+            df: The new DataFrame.
+        """
+        self._df = df
+        self.invalidate()
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the columns.
+
+        Returns:
+            The names of the columns, in display order.
+        """
+        return [str(column) for column in self.df.columns]
+
+    def _match(self, query: DataQuery) -> Any:
+        """Get the rows matching a query, in order.
+
+        Args:
+            query: The ordering and filters to apply.
+
+        Returns:
+            A DataFrame of the matching rows.
+        """
+        df = self.df
+        for column, text in query.filters:
+            df = df[df[column].astype(str).str.contains(text, case=False, regex=False)]
+        if query.sort_column is not None:
+            df = df.sort_values(
+                query.sort_column, ascending=not query.sort_descending, kind="stable"
+            )
+        return df
+
+    async def count(self, query: DataQuery) -> int:
+        """Count the rows matching a query.
+
+        Args:
+            query: The filters to apply.
+
+        Returns:
+            The number of matching rows.
+        """
+        return len(await self._get_matches(query))
+
+    async def fetch(self, query: DataQuery, offset: int, limit: int) -> list[list]:
+        """Get a window of the rows matching a query.
+
+        Args:
+            query: The ordering and filters to apply.
+            offset: The index of the first row of the window.
+            limit: The maximum number of rows in the window.
+
+        Returns:
+            The values of each row, in column order.
+        """
+        from reflex.utils.serializers import format_dataframe_values
+
+        matches = await self._get_matches(query)
+        return format_dataframe_values(matches.iloc[offset : offset + limit])
+
+
+class ModelDataSource(DataSource):
+    """The rows of a database table, queried one window at a time."""
+
+    def __init__(self, model: type[Model], columns: Sequence[str] | None = None):
+        """Create a data source over a database table.
+
+        Queries run on the async session of the current event (see `rx.event_asession`).
+
+        Args:
+            model: The model of the table.
+            columns: The names of the columns, defaults to all the fields of the model.
+        """
+        self.model = model
+        self._columns = (
+            list(columns) if columns is not None else list(model.model_fields)
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the columns.
+
+        Returns:
+            The names of the columns, in display order.
+        """
+        return self._columns
+
+    def _apply_filters(self, statement: Any, query: DataQuery) -> Any:
+        """Add the filters of a query to a select statement.
+
+        Args:
+            statement: The select statement.
+            query: The filters to apply.
+
+        Returns:
+            The filtered select statement.
+        """
+        import sqlalchemy
+
+        for column, text in query.filters:
+            statement = statement.where(
+                sqlalchemy.cast(
+                    getattr(self.model, column), sqlalchemy.String
+                ).icontains(text, autoescape=True)
+            )
+        return statement
+
+    async def count(self, query: DataQuery) -> int:
+        """Count the rows matching a query.
+
+        Args:
+            query: The filters to apply.
+
+        Returns:
+            The number of matching rows.
+        """
+        import sqlalchemy
+
+        from reflex.model import _use_asession
+
+        statement = self._apply_filters(
+            sqlalchemy.select(sqlalchemy.func.count()).select_from(self.model), query
+        )
+        async with _use_asession(None) as session:
+            return (await session.exec(statement)).one()[0]
+
+    async def fetch(self, query: DataQuery, offset: int, limit: int) -> list[list]:
+        """Get a window of the rows matching a query.
+
+        Args:
+            query: The ordering and filters to apply.
+            offset: The index of the first row of the window.
+            limit: The maximum number of rows in the window.
+
+        Returns:
+            The values of each row, in column order.
+        """
+        import sqlalchemy
+
+        from reflex.model import _use_asession
+
+        statement = self._apply_filters(
+            sqlalchemy.select(
+                *(getattr(self.model, column) for column in self._columns)
+            ),
+            query,
+        )
+        if query.sort_column is not None:
+            sort_column = getattr(self.model, query.sort_column)
+            statement = statement.order_by(
+                sort_column.desc() if query.sort_descending else sort_column.asc()
+            )
+        # Keep the order of the rows stable across windows.
+        statement = statement.order_by(
+            *self.model.__table__.primary_key.columns  # pyright: ignore [reportAttributeAccessIssue]
+        )
+        async with _use_asession(None) as session:
+            result = await session.exec(statement.offset(offset).limit(limit))
+            return [list(row) for row in result.all()]
+
+
+class DataSourceState(State, mixin=True):
+    """Serve the rows of a data source to a data editor one window at a time.
+
+    The dataset stays on the server: the state only holds the rows around the
+    visible region of the grid, which are fetched again as the grid scrolls.
+    Use it as a mixin and override `get_data_source`.
+
+    ```python
+    from reflex.components.datadisplay import DataFrameDataSource
+
+
+    class Products(rx.DataSourceState, rx.State):
+        @classmethod
+        def get_data_source(cls):
+            return products
+
+
+    products = DataFrameDataSource(pd.read_parquet("products.parquet"))
+
+
+    def index():
+        return Products.data_editor(height="80vh")
+    ```
+    """
+
+    # The number of rows fetched before and after the visible region.
+    overscan: ClassVar[int] = 50
+
+    # The number of rows matching the filters.
+    total_rows: int = 0
+
+    # The fetched rows.
+    window: list[list[Any]] = []
+
+    # The index of the first fetched row.
+    window_offset: int = 0
+
+    # The column the rows are sorted by.
+    sort_column: str | None = None
+
+    # Whether the rows are sorted in descending order.
+    sort_descending: bool = False
+
+    # The filters of the rows, by column.
+    filters: dict[str, str] = {}
+
+    # The first row and the number of rows of the visible region.
+    _visible_rows: tuple[int, int] = (0, 0)
+
+    @computed_var
+    def data_columns(self) -> list[dict[str, Any]]:
+        """The columns of the data editor.
+
+        Returns:
+            The columns, formatted for the data editor.
+        """
+        return [
+            format.format_data_editor_column(column)
+            for column in self.get_data_source().columns
+        ]
+
+    @classmethod
+    def get_data_source(cls) -> DataSource:
+        """Get the data source, shared by all the clients.
+
+        Raises:
+            NotImplementedError: if the subclass does not override this method.
+        """
+        msg = (
+            f"{cls.__name__} must implement get_data_source to return the data source."
+        )
+        raise NotImplementedError(msg)
+
+    def _get_query(self) -> DataQuery:
+        """Get the query of the current ordering and filters.
+
+        Returns:
+            The query.
+        """
+        return DataQuery(
+            sort_column=self.sort_column,
+            sort_descending=self.sort_descending,
+            filters=tuple(sorted((k, v) for k, v in self.filters.items() if v)),
+        )
+
+    async def _fetch_window(self):
+        """Fetch the rows around the visible region."""
+        first, count = self._visible_rows
+        # The grid may still show rows past the end when the filters removed rows.
+        first = min(first, max(self.total_rows - count, 0))
+        offset = max(first - self.overscan, 0)
+        self.window = await self.get_data_source().fetch(
+            self._get_query(), offset, count + 2 * self.overscan
+        )
+        self.window_offset = offset
+
+    async def _refresh(self):
+        """Count the matching rows and fetch the rows around the visible region."""
+        self.total_rows = await self.get_data_source().count(self._get_query())
+        await self._fetch_window()
+
+    @event
+    async def load_rows(self):
+        """Fetch the rows of the current query, reusing the rows cached by the data source."""
+        await self._refresh()
+
+    @event
+    async def refresh(self):
+        """Fetch the rows again, after the data source changed."""
+        self.get_data_source().invalidate()
+        await self._refresh()
+
+    @event
+    async def load_visible_region(self, region: Rectangle):
+        """Fetch the rows of the visible region, unless they are already fetched.
+
+        Args:
+            region: The visible region of the grid.
+        """
+        self._visible_rows = (region["y"], region["height"])
+        if self.window_offset <= region["y"] and region["y"] + region["height"] <= min(
+            self.window_offset + len(self.window), self.total_rows
+        ):
+            return
+        await self._fetch_window()
+
+    @event
+    async def set_sort(self, column: str | None, descending: bool = False):
+        """Sort the rows by a column.
+
+        Args:
+            column: The column to sort by, None to keep the source order.
+            descending: Whether to sort in descending order.
+        """
+        self.sort_column = column
+        self.sort_descending = descending
+        await self._fetch_window()
+
+    @event
+    async def set_filter(self, column: str, text: str):
+        """Only show the rows whose column contains a text.
+
+        Args:
+            column: The column to filter.
+            text: The text to look for (case insensitive), empty to remove the filter.
+        """
+        self.filters[column] = text
+        await self._refresh()
+
+    @classmethod
+    def data_editor(cls, **props) -> Component:
+        """Create a data editor showing the rows of the data source.
+
+        Args:
+            **props: The props of the data editor.
+
+        Returns:
+            The data editor, fetching rows as it scrolls.
+        """
+        props.setdefault("on_mount", cls.load_rows)
+        return DataEditor.create(
+            columns=cls.data_columns,
+            data=cls.window,
+            data_offset=cls.window_offset,
+            rows=cls.total_rows,
+            on_visible_region_changed=cls.load_visible_region,
+            **props,
+        )
@@ -228,6 +228,27 @@ class BaseConfig:
     # Token expiration time for redis state manager
     redis_token_expiration: int = constants.Expiration.TOKEN
 
+    # The codec used to persist states in the disk and redis state managers ("pickle", or "compact" to store JSON native vars as JSON within the pickle).
+    state_codec: str = "pickle"
+
+    # Compress persisted states larger than this many bytes (None to disable compression).
+    state_codec_compression_threshold: int | None = None
+
+    # The number of backend worker processes in production (None to size it from the CPUs and memory available).
+    backend_workers: int | None = None
+
+    # The memory (MiB) to reserve for each backend worker when sizing the workers from a memory limit.
+    backend_worker_memory: int = 512
+
+    # The maximum number of websocket connections per backend worker, further connections are refused (None for no limit).
+    max_connections_per_worker: int | None = None
+
+    # The maximum number of events processed at once per backend worker (None for no limit).
+    max_events_per_worker: int | None = None
+
+    # What to do with events received while max_events_per_worker are processed: wait for one to finish ("queue") or skip them ("reject").
+    event_backpressure: Literal["queue", "reject"] = "queue"
+
     # Attributes that were explicitly set by the user.
     _non_default_attributes: set[str] = dataclasses.field(
         default_factory=set, init=False
@@ -45,7 +45,7 @@ from .config import (
     RequirementsTxt,
 )
 from .custom_components import CustomComponents
-from .event import Endpoint, EventTriggers, SocketEvent
+from .event import Endpoint, EventTriggers, SocketEvent, UpdateEncoding
 from .installer import Bun, Node, PackageJson
 from .route import (
     ROUTE_NOT_FOUND,
@@ -115,4 +115,5 @@ __all__ = [
     "SocketEvent",
     "StateManagerMode",
     "Templates",
+    "UpdateEncoding",
 ]
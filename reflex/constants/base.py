@@ -60,6 +60,10 @@ class Dirs(SimpleNamespace):
     BACKEND = "backend"
     # JSON-encoded list of page routes that need to be evaluated on the backend.
     STATEFUL_PAGES = "stateful_pages.json"
+    # JSON-encoded description of the compiled app, used by the backend workers to skip evaluating pages.
+    BACKEND_MANIFEST = "backend_manifest.json"
+    # JSON-encoded mapping of page routes to the full names of the states they render.
+    ROUTE_STATES = "route_states.json"
     # Marker file indicating that upload component was used in the frontend.
     UPLOAD_IS_USED = "upload_is_used"
 
@@ -13,6 +13,7 @@ class Endpoint(Enum):
     AUTH_CODESPACE = "auth-codespace"
     HEALTH = "_health"
     ALL_ROUTES = "_all_routes"
+    METRICS = "_reflex/metrics"
 
     def __str__(self) -> str:
         """Get the string representation of the endpoint.
@@ -49,6 +50,8 @@ class SocketEvent(SimpleNamespace):
 
     PING = "ping"
     EVENT = "event"
+    # A state update sent as a binary frame (see UpdateEncoding).
+    EVENT_BINARY = "event_binary"
 
     def __str__(self) -> str:
         """Get the string representation of the event name.
@@ -59,6 +62,21 @@ class SocketEvent(SimpleNamespace):
         return str(self.value)
 
 
+class UpdateEncoding(SimpleNamespace):
+    """Encodings for binary state updates, advertised by the frontend on connect."""
+
+    # The query parameter the frontend uses to advertise the encodings it supports.
+    QUERY_PARAM = "update_encoding"
+    # UTF-8 JSON without compression.
+    BINARY = "binary"
+    # UTF-8 JSON, zlib compressed when above the compression threshold.
+    DEFLATE = "deflate"
+
+    # The first byte of each binary frame describing how the body is encoded.
+    FLAG_RAW = 0
+    FLAG_DEFLATE = 1
+
+
 class EventTriggers(SimpleNamespace):
     """All trigger names used in Reflex."""
 
@@ -15,5 +15,9 @@ class StateManagerMode(str, Enum):
 FRONTEND_EVENT_STATE = "__reflex_internal_frontend_event_state"
 
 FIELD_MARKER = "_rx_state_"
+# Suffix of delta keys carrying a list of structural operations instead of a full value.
+PATCH_MARKER = "_rx_patch_"
+# Suffix of delta keys carrying a dataframe encoded column by column.
+COLUMNAR_MARKER = "_rx_columnar_"
 MEMO_MARKER = "_rx_memo_"
 CAMEL_CASE_MEMO_MARKER = "RxMemo"
@@ -571,6 +571,12 @@ class EnvironmentVariables:
     # Whether to use Granian for the backend. By default, the backend uses Uvicorn if available.
     REFLEX_USE_GRANIAN: EnvVar[bool] = env_var(False)
 
+    # Whether the production backend loads the app once and forks its workers from it (requires gunicorn).
+    REFLEX_BACKEND_PRELOAD: EnvVar[bool] = env_var(False)
+
+    # Set for the gunicorn process which loads the app before forking the backend workers.
+    REFLEX_BACKEND_PRELOADED: EnvVar[bool] = env_var(False, internal=True)
+
     # Whether to use the system installed bun. If set to false, bun will be bundled with the app.
     REFLEX_USE_SYSTEM_BUN: EnvVar[bool] = env_var(False)
 
@@ -591,6 +597,12 @@ class EnvironmentVariables:
         Path(constants.Dirs.UPLOADED_FILES)
     )
 
+    # The size (bytes) above which uploaded files are spooled to disk under REFLEX_UPLOADED_FILES_DIR instead of kept in memory.
+    REFLEX_UPLOAD_SPOOL_MAX_SIZE: EnvVar[int] = env_var(1024 * 1024)
+
+    # The maximum size (bytes) of the body of one upload request (None for unlimited).
+    REFLEX_UPLOAD_MAX_BYTES: EnvVar[int | None] = env_var(None)
+
     REFLEX_COMPILE_EXECUTOR: EnvVar[ExecutorType | None] = env_var(None)
 
     # Whether to use separate processes to compile the frontend and how many. If not set, defaults to thread executor.
@@ -694,6 +706,15 @@ class EnvironmentVariables:
     # The timeout to wait for a pong from the websocket server in seconds.
     REFLEX_SOCKET_TIMEOUT: EnvVar[int] = env_var(constants.Ping.TIMEOUT)
 
+    # Whether to send state updates as binary frames to frontends that support them.
+    REFLEX_SOCKET_BINARY_UPDATES: EnvVar[bool] = env_var(False)
+
+    # Compress binary state updates larger than this many bytes (when the frontend supports it).
+    REFLEX_SOCKET_COMPRESSION_THRESHOLD: EnvVar[int | None] = env_var(16 * 1024)
+
+    # Whether to encode binary state updates with orjson when it is installed.
+    REFLEX_SOCKET_FAST_JSON: EnvVar[bool] = env_var(False)
+
     # Whether to run Granian in a spawn process. This enables Reflex to pick up on environment variable changes between hot reloads.
     REFLEX_STRICT_HOT_RELOAD: EnvVar[bool] = env_var(False)
 
@@ -721,15 +742,57 @@ class EnvironmentVariables:
     # Whether to mount the compiled frontend app in the backend server in production.
     REFLEX_MOUNT_FRONTEND_COMPILED_APP: EnvVar[bool] = env_var(False, internal=True)
 
+    # Whether the production build writes gzip (and brotli, if installed) variants of the static files.
+    REFLEX_PRECOMPRESS_STATIC: EnvVar[bool] = env_var(True)
+
+    # Whether `reflex export` stores already compressed files (images, fonts, .gz/.br variants) without deflating them.
+    REFLEX_EXPORT_STORE_COMPRESSED: EnvVar[bool] = env_var(True)
+
+    # Whether `reflex export` reuses the unchanged members of the previous zip files instead of compressing them again.
+    REFLEX_EXPORT_INCREMENTAL: EnvVar[bool] = env_var(False)
+
     # How long to delay writing updated states to disk. (Higher values mean less writes, but more chance of lost data.)
     REFLEX_STATE_MANAGER_DISK_DEBOUNCE_SECONDS: EnvVar[float] = env_var(2.0)
 
+    # The maximum number of client states kept by the memory state manager before evicting the least recently used.
+    REFLEX_STATE_MANAGER_MEMORY_MAX_ENTRIES: EnvVar[int | None] = env_var(None)
+
+    # The maximum estimated size (bytes) of client states kept by the memory state manager before evicting the least recently used.
+    REFLEX_STATE_MANAGER_MEMORY_MAX_BYTES: EnvVar[int | None] = env_var(None)
+
     # How long to wait between automatic reload on frontend error to avoid reload loops.
     REFLEX_AUTO_RELOAD_COOLDOWN_TIME_MS: EnvVar[int] = env_var(10_000)
 
     # Whether to enable debug logging for the redis state manager.
     REFLEX_STATE_MANAGER_REDIS_DEBUG: EnvVar[bool] = env_var(False)
 
+    # Whether the redis state manager stores each substate as a hash and writes back only modified vars.
+    REFLEX_STATE_MANAGER_REDIS_FIELD_LAYOUT: EnvVar[bool] = env_var(False)
+
+    # Whether deltas describe in-place list/dict mutations as patch operations instead of the full value (not compatible with REFLEX_ROUTE_SCOPED_HYDRATION).
+    REFLEX_STATE_PATCH_DELTAS: EnvVar[bool] = env_var(False)
+
+    # Whether deltas send pandas DataFrames column by column, with numeric columns as base64 buffers.
+    REFLEX_COLUMNAR_DATAFRAMES: EnvVar[bool] = env_var(False)
+
+    # Whether to time the phases of each event, exported at /_reflex/metrics.
+    REFLEX_EVENT_METRICS: EnvVar[bool] = env_var(False)
+
+    # Whether hydration only sends the states rendered by the current page, sending others on navigation (not compatible with REFLEX_STATE_PATCH_DELTAS).
+    REFLEX_ROUTE_SCOPED_HYDRATION: EnvVar[bool] = env_var(False)
+
+    # The maximum number of background tasks running at once across all handlers (None for unlimited).
+    REFLEX_BACKGROUND_TASK_LIMIT: EnvVar[int | None] = env_var(None)
+
+    # Whether to cancel the background tasks of a client token when its websocket disconnects.
+    REFLEX_CANCEL_BACKGROUND_TASKS_ON_DISCONNECT: EnvVar[bool] = env_var(False)
+
+    # Whether synchronous event handlers run in a thread pool instead of on the event loop (overridable per handler with `@rx.event(threaded=...)`).
+    REFLEX_THREADED_SYNC_HANDLERS: EnvVar[bool] = env_var(False)
+
+    # The number of threads running synchronous event handlers. Defaults to `min(32, os.cpu_count() + 4)`.
+    REFLEX_SYNC_HANDLER_THREADS: EnvVar[int | None] = env_var(None)
+
     # Whether to opportunistically hold the redis lock to allow fast in-memory access while uncontended.
     REFLEX_OPLOCK_ENABLED: EnvVar[bool] = env_var(False)
 
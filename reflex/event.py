@@ -28,6 +28,7 @@ from reflex import constants
 from reflex.components.field import BaseField
 from reflex.constants.compiler import CompileVars, Hooks, Imports
 from reflex.constants.state import FRONTEND_EVENT_STATE
+from reflex.istate.scheduler import BackgroundTaskLimits, OverflowPolicy
 from reflex.utils import format
 from reflex.utils.decorator import once
 from reflex.utils.exceptions import (
@@ -89,6 +90,10 @@ class Event:
 _EVENT_FIELDS: set[str] = {f.name for f in dataclasses.fields(Event)}
 
 BACKGROUND_TASK_MARKER = "_reflex_background_task"
+READ_ONLY_EVENT_MARKER = "_reflex_read_only_event"
+THREADED_EVENT_MARKER = "_reflex_threaded_event"
+BACKGROUND_TASK_LIMITS_MARKER = "_reflex_background_task_limits"
+BACKGROUND_FLUSH_INTERVAL_MARKER = "_reflex_background_flush_interval"
 
 
 @dataclasses.dataclass(
@@ -233,6 +238,42 @@ class EventHandler(EventActionsMixin):
         """
         return getattr(self.fn, BACKGROUND_TASK_MARKER, False)
 
+    @property
+    def is_read_only(self) -> bool:
+        """Whether the event handler only reads the state.
+
+        Returns:
+            True if the event handler is marked as read-only.
+        """
+        return getattr(self.fn, READ_ONLY_EVENT_MARKER, False)
+
+    @property
+    def is_threaded(self) -> bool | None:
+        """Whether the event handler runs in the sync handler thread pool.
+
+        Returns:
+            The value passed to `@rx.event(threaded=...)`, or None if not set.
+        """
+        return getattr(self.fn, THREADED_EVENT_MARKER, None)
+
+    @property
+    def background_task_limits(self) -> BackgroundTaskLimits | None:
+        """The concurrency limits of the background task.
+
+        Returns:
+            The limits passed to `@rx.event(background=True, ...)`, or None if not set.
+        """
+        return getattr(self.fn, BACKGROUND_TASK_LIMITS_MARKER, None)
+
+    @property
+    def background_flush_interval(self) -> float | None:
+        """The minimum time between state writes of the background task.
+
+        Returns:
+            The interval passed to `@rx.event(background=True, flush_interval=...)` (s), or None if not set.
+        """
+        return getattr(self.fn, BACKGROUND_FLUSH_INTERVAL_MARKER, None)
+
     def __call__(self, *args: Any, **kwargs: Any) -> "EventSpec":
         """Pass arguments to the handler to get an event spec.
 
@@ -2310,6 +2351,10 @@ class EventNamespace:
 
     # Constants
     BACKGROUND_TASK_MARKER = BACKGROUND_TASK_MARKER
+    READ_ONLY_EVENT_MARKER = READ_ONLY_EVENT_MARKER
+    THREADED_EVENT_MARKER = THREADED_EVENT_MARKER
+    BACKGROUND_TASK_LIMITS_MARKER = BACKGROUND_TASK_LIMITS_MARKER
+    BACKGROUND_FLUSH_INTERVAL_MARKER = BACKGROUND_FLUSH_INTERVAL_MARKER
     _EVENT_FIELDS = _EVENT_FIELDS
     FORM_DATA = FORM_DATA
     upload_files = upload_files
@@ -2328,6 +2373,12 @@ class EventNamespace:
         func: None = None,
         *,
         background: bool | None = None,
+        read_only: bool | None = None,
+        threaded: bool | None = None,
+        max_concurrency: int | None = None,
+        max_concurrency_per_token: int | None = None,
+        overflow: OverflowPolicy | Literal["queue", "drop", "replace"] | None = None,
+        flush_interval: float | None = None,
         stop_propagation: bool | None = None,
         prevent_default: bool | None = None,
         throttle: int | None = None,
@@ -2343,6 +2394,12 @@ class EventNamespace:
         func: Callable[[BASE_STATE, Unpack[P]], Any],
         *,
         background: bool | None = None,
+        read_only: bool | None = None,
+        threaded: bool | None = None,
+        max_concurrency: int | None = None,
+        max_concurrency_per_token: int | None = None,
+        overflow: OverflowPolicy | Literal["queue", "drop", "replace"] | None = None,
+        flush_interval: float | None = None,
         stop_propagation: bool | None = None,
         prevent_default: bool | None = None,
         throttle: int | None = None,
@@ -2355,6 +2412,12 @@ class EventNamespace:
         func: Callable[[BASE_STATE, Unpack[P]], Any] | None = None,
         *,
         background: bool | None = None,
+        read_only: bool | None = None,
+        threaded: bool | None = None,
+        max_concurrency: int | None = None,
+        max_concurrency_per_token: int | None = None,
+        overflow: OverflowPolicy | Literal["queue", "drop", "replace"] | None = None,
+        flush_interval: float | None = None,
         stop_propagation: bool | None = None,
         prevent_default: bool | None = None,
         throttle: int | None = None,
@@ -2369,6 +2432,12 @@ class EventNamespace:
         Args:
             func: The function to wrap.
             background: Whether the event should be run in the background. Defaults to False.
+            read_only: Whether the event only reads the state. Read-only events run without taking the state lock, cannot modify the state and may only return events. With the redis state manager they read the state last written to redis; with the memory and disk state managers they read the live state, including partial changes of an event being processed concurrently. Defaults to False.
+            threaded: Whether the sync handler runs in a thread pool while holding the state lock. Defaults to REFLEX_THREADED_SYNC_HANDLERS.
+            max_concurrency: The maximum number of tasks of the background handler running at once across all clients.
+            max_concurrency_per_token: The maximum number of tasks of the background handler running at once for a client.
+            overflow: What to do with a background task started while a limit is reached: "queue" (default) waits, "drop" skips it, "replace" cancels the oldest task.
+            flush_interval: The minimum time between state writes of the background task (s). Changes made by `async with self` blocks within the interval are written and sent to the frontend together. The state lock is kept until the write, so other events of the client wait up to that long. Must be positive and less than the redis lock expiration.
             stop_propagation: Whether to stop the event from bubbling up the DOM tree.
             prevent_default: Whether to prevent the default behavior of the event.
             throttle: Throttle the event handler to limit calls (in milliseconds).
@@ -2377,6 +2446,11 @@ class EventNamespace:
 
         Raises:
             TypeError: If background is True and the function is not a coroutine or async generator. # noqa: DAR402
+            ValueError: If both background and read_only are True. # noqa: DAR402
+            TypeError: If threaded is True and the function is a coroutine or async generator. # noqa: DAR402
+            ValueError: If concurrency limits are given for a handler that is not a background task. # noqa: DAR402
+            ValueError: If flush_interval is given for a handler that is not a background task. # noqa: DAR402
+            ValueError: If flush_interval is not positive or not less than the lock expiration. # noqa: DAR402
 
         Returns:
             The wrapped function.
@@ -2413,6 +2487,9 @@ class EventNamespace:
         def wrapper(
             func: Callable[[BASE_STATE, Unpack[P]], T],
         ) -> EventCallback[Unpack[P]]:
+            if background is True and read_only is True:
+                msg = "Event handlers cannot be both background and read-only."
+                raise ValueError(msg)
             if background is True:
                 if not inspect.iscoroutinefunction(
                     func
@@ -2420,6 +2497,47 @@ class EventNamespace:
                     msg = "Background task must be async function or generator."
                     raise TypeError(msg)
                 setattr(func, BACKGROUND_TASK_MARKER, True)
+            if (
+                max_concurrency is not None
+                or max_concurrency_per_token is not None
+                or overflow is not None
+            ):
+                if background is not True:
+                    msg = "Concurrency limits are only supported for background tasks."
+                    raise ValueError(msg)
+                setattr(
+                    func,
+                    BACKGROUND_TASK_LIMITS_MARKER,
+                    BackgroundTaskLimits(
+                        max_concurrency=max_concurrency,
+                        max_concurrency_per_token=max_concurrency_per_token,
+                        overflow=OverflowPolicy(overflow or OverflowPolicy.QUEUE),
+                    ),
+                )
+            if flush_interval is not None:
+                from reflex.config import get_config
+
+                if background is not True:
+                    msg = "Flush interval is only supported for background tasks."
+                    raise ValueError(msg)
+                if flush_interval <= 0:
+                    msg = f"The flush interval({flush_interval}) must be positive."
+                    raise ValueError(msg)
+                lock_expiration = get_config().redis_lock_expiration
+                if flush_interval * 1000 >= lock_expiration:
+                    msg = f"The flush interval({flush_interval}s) must be less than the lock expiration time({lock_expiration}ms)."
+                    raise ValueError(msg)
+                setattr(func, BACKGROUND_FLUSH_INTERVAL_MARKER, flush_interval)
+            if read_only is True:
+                setattr(func, READ_ONLY_EVENT_MARKER, True)
+            if threaded is not None:
+                if threaded and (
+                    inspect.iscoroutinefunction(func)
+                    or inspect.isasyncgenfunction(func)
+                ):
+                    msg = "Threaded event handlers must be synchronous."
+                    raise TypeError(msg)
+                setattr(func, THREADED_EVENT_MARKER, threaded)
             if getattr(func, "__name__", "").startswith("_"):
                 msg = "Event handlers cannot be private."
                 raise ValueError(msg)
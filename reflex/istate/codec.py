@@ -0,0 +1,556 @@
+"""Codecs used by the state managers to persist state instances."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import json
+import pickle
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar, get_args, get_origin
+
+from reflex import constants
+from reflex.istate import HANDLED_PICKLE_ERRORS
+from reflex.utils import types
+from reflex.utils.exceptions import StateSchemaMismatchError, StateSerializationError
+
+if TYPE_CHECKING:
+    from reflex.state import BaseState
+
+# Prefix of payloads compressed by encode_state.
+COMPRESSED_MAGIC = b"RXZ1"
+
+# Tags of the single var values encoded by CompactStateCodec.
+_JSON_VALUE = b"J"
+_PICKLED_VALUE = b"P"
+
+# Scalar types that round trip through JSON unchanged.
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@functools.lru_cache
+def persisted_var_names(state_cls: type[BaseState]) -> tuple[str, ...]:
+    """Get the names of the vars that are persisted for a state class.
+
+    Args:
+        state_cls: The state class.
+
+    Returns:
+        The base vars and own backend vars, plus router_data for the root state.
+    """
+    names = [
+        *state_cls.base_vars,
+        *(
+            name
+            for name in state_cls.backend_vars
+            if name not in state_cls.inherited_backend_vars
+        ),
+    ]
+    if state_cls.get_parent_state() is None:
+        names.append(constants.ROUTER_DATA)
+    return tuple(names)
+
+
+def get_persisted_value(state: BaseState, name: str) -> Any:
+    """Get the raw (unproxied) value of a persisted var.
+
+    Args:
+        state: The state instance.
+        name: The name of the var.
+
+    Returns:
+        The value of the var.
+    """
+    if name in state._backend_vars:
+        return state._backend_vars[name]
+    return object.__getattribute__(state, name)
+
+
+def set_persisted_value(state: BaseState, name: str, value: Any):
+    """Set the value of a persisted var without marking it dirty.
+
+    Args:
+        state: The state instance.
+        name: The name of the var.
+        value: The value to set.
+    """
+    if name in type(state).backend_vars:
+        state._backend_vars[name] = value
+    else:
+        object.__setattr__(state, name, value)
+
+
+def pickle_value(state: BaseState, name: str, value: Any) -> bytes:
+    """Pickle a single var value, falling back to dill for exotic objects.
+
+    Args:
+        state: The state instance owning the var (for error messages).
+        name: The name of the var.
+        value: The value to pickle.
+
+    Returns:
+        The pickled value.
+
+    Raises:
+        StateSerializationError: If the value cannot be pickled.
+    """
+    try:
+        return pickle.dumps(value)
+    except HANDLED_PICKLE_ERRORS as og_pickle_error:
+        try:
+            import dill
+
+            return dill.dumps(value)
+        except (ImportError, *HANDLED_PICKLE_ERRORS):
+            msg = (
+                f"Failed to serialize var {name} of state {state.get_full_name()} "
+                f"due to unpicklable object: {og_pickle_error}"
+            )
+            raise StateSerializationError(msg) from og_pickle_error
+
+
+def _is_json_native(type_: Any) -> bool:
+    """Check whether values of a declared type round trip through JSON unchanged.
+
+    Args:
+        type_: The declared type.
+
+    Returns:
+        Whether the type only contains JSON scalars, lists and str-keyed dicts.
+    """
+    if type_ in _JSON_SCALAR_TYPES:
+        return True
+    if types.is_union(type_):
+        return all(_is_json_native(arg) for arg in get_args(type_))
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if origin is list and len(args) == 1:
+        return _is_json_native(args[0])
+    if origin is dict and len(args) == 2:
+        return args[0] is str and _is_json_native(args[1])
+    return False
+
+
+def _is_json_lossless(value: Any) -> bool:
+    """Check whether a value is restored unchanged after a JSON round trip.
+
+    Args:
+        value: The value.
+
+    Returns:
+        Whether the value only holds JSON scalars, lists and dicts with str keys
+        (exact types, so that e.g. tuples, int keys and enums are not converted).
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is list:
+        return all(_is_json_lossless(item) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_json_lossless(item) for key, item in value.items()
+        )
+    return False
+
+
+@functools.lru_cache
+def _json_native_vars(state_cls: type[BaseState]) -> frozenset[str]:
+    """Get the base vars of a state class whose declared type is JSON native.
+
+    Args:
+        state_cls: The state class.
+
+    Returns:
+        The names of the base vars that can be encoded as JSON.
+    """
+    fields = state_cls.get_fields()
+    return frozenset(
+        name
+        for name in state_cls.base_vars
+        if name in fields and _is_json_native(fields[name].outer_type_)
+    )
+
+
+@dataclasses.dataclass
+class CodecStats:
+    """Cumulative encode/decode timings of a state codec."""
+
+    encode_count: int = 0
+    encode_seconds: float = 0.0
+    encoded_bytes: int = 0
+    decode_count: int = 0
+    decode_seconds: float = 0.0
+
+
+class StateCodec(ABC):
+    """Encodes a single state instance (without substates) to bytes and back."""
+
+    # The name used to select the codec via `rx.Config(state_codec=...)`.
+    name: ClassVar[str]
+
+    # The prefix identifying payloads produced by this codec.
+    magic: ClassVar[bytes] = b""
+
+    @abstractmethod
+    def encode(self, state: BaseState) -> bytes:
+        """Encode a state instance.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The encoded state, starting with the codec magic.
+        """
+
+    @abstractmethod
+    def decode(self, data: bytes) -> BaseState:
+        """Decode a state instance.
+
+        Args:
+            data: The encoded state.
+
+        Returns:
+            The decoded state.
+
+        Raises:
+            StateSchemaMismatchError: If the state schema does not match the expected schema.
+        """
+
+    def encode_value(self, state: BaseState, name: str, value: Any) -> bytes:
+        """Encode the value of a single var (for the field layout of the redis state manager).
+
+        Args:
+            state: The state instance owning the var.
+            name: The name of the var.
+            value: The value to encode.
+
+        Returns:
+            The encoded value, starting with the codec magic.
+        """
+        return self.magic + pickle_value(state, name, value)
+
+    def decode_value(self, data: bytes) -> Any:
+        """Decode the value of a single var.
+
+        Args:
+            data: The encoded value.
+
+        Returns:
+            The decoded value.
+        """
+        return pickle.loads(data[len(self.magic) :])
+
+
+class PickleStateCodec(StateCodec):
+    """Pickles the whole state instance along with its schema hash."""
+
+    name = "pickle"
+
+    def encode(self, state: BaseState) -> bytes:
+        """Encode a state instance.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The pickled state.
+        """
+        return state._serialize()
+
+    def decode(self, data: bytes) -> BaseState:
+        """Decode a state instance.
+
+        Args:
+            data: The pickled state.
+
+        Returns:
+            The decoded state.
+        """
+        from reflex.state import BaseState
+
+        return BaseState._deserialize(data=data)
+
+
+class CompactStateCodec(StateCodec):
+    """Encodes vars declared with JSON-native types as one JSON document.
+
+    The payload is still a pickle of the state class, its schema, the JSON
+    document and the other vars, each pickled on its own: it is smaller and
+    faster to decode than pickling the whole state when most vars are JSON
+    native, but it is not a pickle-free format. Vars whose declared type may
+    not round trip through JSON (tuples, sets, models, dataframes, ...) and
+    values which would change in a JSON round trip (e.g. int keys in a
+    `dict[str, int]` var) are pickled. Computed var caches are not stored and
+    are recomputed on access.
+    """
+
+    name = "compact"
+    magic = b"RXC1"
+
+    def encode(self, state: BaseState) -> bytes:
+        """Encode a state instance.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The encoded state.
+        """
+        state_cls = type(state)
+        json_native_vars = _json_native_vars(state_cls)
+        json_values = {}
+        pickled_values = {}
+        for name in persisted_var_names(state_cls):
+            value = get_persisted_value(state, name)
+            if type(value) in _JSON_SCALAR_TYPES or (
+                name in json_native_vars and _is_json_lossless(value)
+            ):
+                json_values[name] = value
+            else:
+                pickled_values[name] = pickle_value(state, name, value)
+        json_payload = json.dumps(json_values, separators=(",", ":"))
+        return self.magic + pickle.dumps((
+            state_cls,
+            state._to_schema(),
+            json_payload.encode(),
+            pickled_values,
+        ))
+
+    def decode(self, data: bytes) -> BaseState:
+        """Decode a state instance.
+
+        Args:
+            data: The encoded state.
+
+        Returns:
+            The decoded state.
+
+        Raises:
+            StateSchemaMismatchError: If the state schema does not match the expected schema.
+        """
+        state_cls, schema, json_values, pickled_values = pickle.loads(
+            data[len(self.magic) :]
+        )
+        if schema != state_cls._to_schema():
+            raise StateSchemaMismatchError
+        state = state_cls(init_substates=False, _reflex_internal_init=True)
+        for name, value in json.loads(json_values).items():
+            set_persisted_value(state, name, value)
+        for name, value in pickled_values.items():
+            set_persisted_value(state, name, pickle.loads(value))
+        return state
+
+    def encode_value(self, state: BaseState, name: str, value: Any) -> bytes:
+        """Encode the value of a single var, as JSON when it round trips unchanged.
+
+        Args:
+            state: The state instance owning the var.
+            name: The name of the var.
+            value: The value to encode.
+
+        Returns:
+            The encoded value.
+        """
+        if _is_json_lossless(value):
+            return (
+                self.magic
+                + _JSON_VALUE
+                + json.dumps(value, separators=(",", ":")).encode()
+            )
+        return self.magic + _PICKLED_VALUE + pickle_value(state, name, value)
+
+    def decode_value(self, data: bytes) -> Any:
+        """Decode the value of a single var.
+
+        Args:
+            data: The encoded value.
+
+        Returns:
+            The decoded value.
+        """
+        tag_end = len(self.magic) + 1
+        if data[len(self.magic) : tag_end] == _JSON_VALUE:
+            return json.loads(data[tag_end:])
+        return pickle.loads(data[tag_end:])
+
+
+_CODECS: dict[str, StateCodec] = {}
+_CODEC_STATS: dict[str, CodecStats] = {}
+
+
+def register_state_codec(codec: StateCodec):
+    """Register a codec so it can be selected by name in the config.
+
+    Args:
+        codec: The codec instance.
+
+    Raises:
+        ValueError: If the codec magic collides with a registered codec.
+    """
+    for other in _CODECS.values():
+        if other.name != codec.name and other.magic == codec.magic:
+            msg = f"State codec {codec.name!r} reuses the magic of {other.name!r}."
+            raise ValueError(msg)
+    _CODECS[codec.name] = codec
+    _CODEC_STATS.setdefault(codec.name, CodecStats())
+
+
+register_state_codec(PickleStateCodec())
+register_state_codec(CompactStateCodec())
+
+
+def get_state_codec(name: str | None = None) -> StateCodec:
+    """Get a registered codec.
+
+    Args:
+        name: The name of the codec, defaults to the `state_codec` config value.
+
+    Returns:
+        The codec.
+
+    Raises:
+        ValueError: If no codec is registered under the name.
+    """
+    if name is None:
+        from reflex.config import get_config
+
+        name = get_config().state_codec
+    codec = _CODECS.get(name)
+    if codec is None:
+        msg = f"Unknown state codec {name!r}, expected one of {sorted(_CODECS)}."
+        raise ValueError(msg)
+    return codec
+
+
+def get_codec_stats() -> dict[str, CodecStats]:
+    """Get the cumulative timings of every registered codec.
+
+    Returns:
+        A mapping of codec name to its stats.
+    """
+    return dict(_CODEC_STATS)
+
+
+def _get_payload_codec(data: bytes) -> StateCodec:
+    """Get the codec that produced an uncompressed payload from its magic.
+
+    Args:
+        data: The encoded state or value.
+
+    Returns:
+        The codec, pickle for payloads without a known magic.
+    """
+    return next(
+        (
+            codec
+            for codec in _CODECS.values()
+            if codec.magic and data.startswith(codec.magic)
+        ),
+        _CODECS[PickleStateCodec.name],
+    )
+
+
+def _compress(data: bytes, compression_threshold: int | None) -> bytes:
+    """Compress a payload larger than the threshold.
+
+    Args:
+        data: The payload.
+        compression_threshold: Compress payloads larger than this many bytes (None to disable).
+
+    Returns:
+        The payload, compressed and prefixed with COMPRESSED_MAGIC when above the threshold.
+    """
+    if compression_threshold is not None and len(data) > compression_threshold:
+        return COMPRESSED_MAGIC + zlib.compress(data, level=1)
+    return data
+
+
+def encode_state(
+    state: BaseState,
+    codec: StateCodec,
+    compression_threshold: int | None = None,
+) -> bytes:
+    """Encode a state instance, compressing payloads above the threshold.
+
+    Args:
+        state: The state to encode.
+        codec: The codec to use.
+        compression_threshold: Compress payloads larger than this many bytes (None to disable).
+
+    Returns:
+        The encoded state.
+    """
+    start = time.perf_counter()
+    data = _compress(codec.encode(state), compression_threshold)
+    stats = _CODEC_STATS[codec.name]
+    stats.encode_count += 1
+    stats.encode_seconds += time.perf_counter() - start
+    stats.encoded_bytes += len(data)
+    return data
+
+
+def decode_state(data: bytes) -> BaseState:
+    """Decode a state instance with the codec that produced it.
+
+    The codec is detected from the payload magic, so states written with a
+    previously configured codec can still be read.
+
+    Args:
+        data: The encoded state.
+
+    Returns:
+        The decoded state.
+    """
+    start = time.perf_counter()
+    if data.startswith(COMPRESSED_MAGIC):
+        data = zlib.decompress(data[len(COMPRESSED_MAGIC) :])
+    codec = _get_payload_codec(data)
+    state = codec.decode(data)
+    stats = _CODEC_STATS[codec.name]
+    stats.decode_count += 1
+    stats.decode_seconds += time.perf_counter() - start
+    return state
+
+
+def encode_value(
+    state: BaseState,
+    name: str,
+    value: Any,
+    codec: StateCodec,
+    compression_threshold: int | None = None,
+) -> bytes:
+    """Encode the value of a single var, compressing payloads above the threshold.
+
+    Args:
+        state: The state instance owning the var.
+        name: The name of the var.
+        value: The value to encode.
+        codec: The codec to use.
+        compression_threshold: Compress payloads larger than this many bytes (None to disable).
+
+    Returns:
+        The encoded value.
+    """
+    return _compress(codec.encode_value(state, name, value), compression_threshold)
+
+
+def decode_value(data: bytes) -> Any:
+    """Decode the value of a single var with the codec that produced it.
+
+    Args:
+        data: The encoded value.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        StateSchemaMismatchError: If the value is corrupt or cannot be loaded by this version of the app.
+    """
+    try:
+        if data.startswith(COMPRESSED_MAGIC):
+            data = zlib.decompress(data[len(COMPRESSED_MAGIC) :])
+        return _get_payload_codec(data).decode_value(data)
+    except Exception as err:
+        raise StateSchemaMismatchError from err
@@ -0,0 +1,141 @@
+"""Thread pool running synchronous event handlers off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import dataclasses
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from reflex.environment import environment
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class SyncHandlerStats:
+    """Counters of the sync handler thread pool."""
+
+    # Number of calls waiting for a free thread.
+    queued: int = 0
+
+    # Number of calls currently running.
+    running: int = 0
+
+    # Highest number of calls waiting for a free thread at once.
+    max_queued: int = 0
+
+    # Number of finished calls.
+    completed: int = 0
+
+    # Total time spent running calls (s).
+    run_seconds: float = 0.0
+
+    # Total time calls spent waiting for a free thread (s).
+    wait_seconds: float = 0.0
+
+
+_executor: ThreadPoolExecutor | None = None
+_stats = SyncHandlerStats()
+_stats_lock = threading.Lock()
+
+
+def get_sync_handler_executor() -> ThreadPoolExecutor:
+    """Get the thread pool running synchronous event handlers, creating it on first use.
+
+    Returns:
+        The thread pool executor.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=environment.REFLEX_SYNC_HANDLER_THREADS.get(),
+            thread_name_prefix="reflex_sync_handler",
+        )
+    return _executor
+
+
+def shutdown_sync_handler_executor():
+    """Shut down the sync handler thread pool, waiting for running calls to finish."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def get_sync_handler_stats() -> SyncHandlerStats:
+    """Get a snapshot of the sync handler thread pool counters.
+
+    Returns:
+        A copy of the counters.
+    """
+    with _stats_lock:
+        return dataclasses.replace(_stats)
+
+
+def next_generator_step(generator: Generator) -> tuple[bool, Any]:
+    """Advance a generator, capturing its return value.
+
+    StopIteration cannot be raised into a future, so the end of the generator
+    is reported as a value instead.
+
+    Args:
+        generator: The generator to advance.
+
+    Returns:
+        Whether the generator is exhausted, and the yielded (or returned) value.
+    """
+    try:
+        return False, next(generator)
+    except StopIteration as si:
+        return True, si.value
+
+
+async def run_sync_handler(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous callable in the sync handler thread pool.
+
+    The callable runs in a copy of the current context. If the calling task is
+    cancelled, the call is still awaited before the cancellation propagates, so
+    the state lock held by the caller is never released while the handler runs.
+
+    Args:
+        fn: The callable to run.
+        *args: The positional arguments for the callable.
+        **kwargs: The keyword arguments for the callable.
+
+    Returns:
+        The return value of the callable.
+    """
+    context = contextvars.copy_context()
+    submitted = time.perf_counter()
+
+    def run() -> T:
+        start = time.perf_counter()
+        with _stats_lock:
+            _stats.queued -= 1
+            _stats.running += 1
+            _stats.wait_seconds += start - submitted
+        try:
+            return context.run(fn, *args, **kwargs)
+        finally:
+            with _stats_lock:
+                _stats.running -= 1
+                _stats.completed += 1
+                _stats.run_seconds += time.perf_counter() - start
+
+    with _stats_lock:
+        _stats.queued += 1
+        _stats.max_queued = max(_stats.max_queued, _stats.queued)
+    future = asyncio.get_running_loop().run_in_executor(
+        get_sync_handler_executor(), run
+    )
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # Keep holding the state lock until the handler is done with the state.
+        await asyncio.wait([future])
+        raise
@@ -2,28 +2,54 @@
 
 import contextlib
 import dataclasses
+import itertools
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from typing import TypedDict
+from collections.abc import AsyncIterator, Collection, Iterable, Iterator
+from typing import TypedDict, TypeVar
 
 from typing_extensions import ReadOnly, Unpack
 
 from reflex import constants
 from reflex.config import get_config
 from reflex.event import Event
+from reflex.istate.codec import StateCodec, get_state_codec
 from reflex.state import BaseState
 from reflex.utils import console, prerequisites
 from reflex.utils.exceptions import InvalidStateManagerModeError
 
+T = TypeVar("T")
+
 
 class StateModificationContext(TypedDict, total=False):
     """The context for modifying state."""
 
     event: ReadOnly[Event]
 
+    # The full names of the states needed by the caller. When set, managers that load
+    # states on demand may skip the other substates of the token's state.
+    states: ReadOnly[Collection[str]]
+
 
 EmptyContext = StateModificationContext()
 
+# The default number of tokens processed together by the bulk state APIs.
+DEFAULT_BATCH_SIZE = 100
+
+
+def _batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split an iterable into lists of at most `size` items.
+
+    Args:
+        iterable: The iterable to split.
+        size: The maximum size of each list.
+
+    Yields:
+        The consecutive lists of items.
+    """
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
 
 @dataclasses.dataclass
 class StateManager(ABC):
@@ -114,6 +140,72 @@ class StateManager(ABC):
         """
         yield self.state()
 
+    async def get_states(
+        self, tokens: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[tuple[str, BaseState]]:
+        """Get the states for many tokens.
+
+        Args:
+            tokens: The tokens to get the states for.
+            batch_size: The number of tokens fetched together, if supported by the manager.
+
+        Yields:
+            Each token and its state.
+        """
+        for token in tokens:
+            yield token, await self.get_state(token)
+
+    async def modify_states(
+        self,
+        tokens: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **context: Unpack[StateModificationContext],
+    ) -> AsyncIterator[tuple[str, BaseState]]:
+        """Modify the states for many tokens, holding the lock of each while it is modified.
+
+        A state is persisted once the caller is done with it: when the next state
+        is requested, or when the iterator is closed while the state is being
+        modified. Managers may persist the states of a batch together once the
+        batch is done. Wrap the iterator in `contextlib.aclosing` when leaving
+        the loop early, so the modifications are persisted and the locks released
+        right away.
+
+        Args:
+            tokens: The tokens to modify the states for.
+            batch_size: The number of tokens locked and fetched together, if supported by the manager.
+            context: The state modification context.
+
+        Yields:
+            Each token and its state.
+        """
+        for token in dict.fromkeys(tokens):
+            closed = False
+            async with self.modify_state(token, **context) as state:
+                try:
+                    yield token, state
+                except GeneratorExit:
+                    # Leave the context normally so the current state is persisted.
+                    closed = True
+            if closed:
+                return
+
+    async def get_state_snapshot(self, token: str) -> BaseState:
+        """Get the state for a token without acquiring the lock.
+
+        The returned state must only be read, never modified or passed to
+        `set_state`. The redis state manager returns a fresh copy read from
+        redis, which does not include changes still held by a lease. The
+        memory and disk state managers return the live state, so an event
+        modifying it concurrently may be seen partway through.
+
+        Args:
+            token: The token to get the state for.
+
+        Returns:
+            The state for the token.
+        """
+        return await self.get_state(token)
+
     async def close(self):  # noqa: B027
         """Close the state manager."""
 
@@ -127,6 +219,24 @@ def _default_token_expiration() -> int:
     return get_config().redis_token_expiration
 
 
+def _default_state_codec() -> StateCodec:
+    """Get the state codec selected in the config.
+
+    Returns:
+        The state codec.
+    """
+    return get_state_codec()
+
+
+def _default_compression_threshold() -> int | None:
+    """Get the size above which encoded states are compressed.
+
+    Returns:
+        The compression threshold in bytes, or None when compression is disabled.
+    """
+    return get_config().state_codec_compression_threshold
+
+
 def reset_disk_state_manager():
     """Reset the disk state manager."""
     console.debug("Resetting disk state manager.")
@@ -12,13 +12,17 @@ from pathlib import Path
 from typing_extensions import Unpack, override
 
 from reflex.environment import environment
+from reflex.istate.codec import StateCodec, decode_state, encode_state
 from reflex.istate.manager import (
     StateManager,
     StateModificationContext,
+    _default_compression_threshold,
+    _default_state_codec,
     _default_token_expiration,
 )
 from reflex.state import BaseState, _split_substate_key, _substate_key
-from reflex.utils import console, path_ops, prerequisites
+from reflex.utils import console, metrics, path_ops, prerequisites
+from reflex.utils.metrics import EventPhase
 from reflex.utils.misc import run_in_thread
 
 
@@ -50,6 +54,14 @@ class StateManagerDisk(StateManager):
     # The token expiration time (s).
     token_expiration: int = dataclasses.field(default_factory=_default_token_expiration)
 
+    # The codec used to encode each substate.
+    codec: StateCodec = dataclasses.field(default_factory=_default_state_codec)
+
+    # Compress encoded substates larger than this many bytes (None to disable).
+    compression_threshold: int | None = dataclasses.field(
+        default_factory=_default_compression_threshold
+    )
+
     # Last time a token was touched.
     _token_last_touched: dict[str, float] = dataclasses.field(
         default_factory=dict,
@@ -122,8 +134,7 @@ class StateManagerDisk(StateManager):
 
         if token_path.exists():
             try:
-                with token_path.open(mode="rb") as file:
-                    return BaseState._deserialize(fp=file)
+                return decode_state(token_path.read_bytes())
             except Exception:
                 pass
         return None
@@ -173,17 +184,18 @@ class StateManagerDisk(StateManager):
             # Retrieved state from memory.
             return root_state
 
-        # Deserialize root state from disk.
-        root_state = await self.load_state(_substate_key(client_token, self.state))
-        # Create a new root state tree with all substates instantiated.
-        fresh_root_state = self.state(_reflex_internal_init=True)
-        if root_state is None:
-            root_state = fresh_root_state
-        else:
-            # Ensure all substates exist, even if they were not serialized previously.
-            root_state.substates = fresh_root_state.substates
-        self.states[client_token] = root_state
-        await self.populate_substates(client_token, root_state, root_state)
+        with metrics.measure(EventPhase.STATE_FETCH):
+            # Deserialize root state from disk.
+            root_state = await self.load_state(_substate_key(client_token, self.state))
+            # Create a new root state tree with all substates instantiated.
+            fresh_root_state = self.state(_reflex_internal_init=True)
+            if root_state is None:
+                root_state = fresh_root_state
+            else:
+                # Ensure all substates exist, even if they were not serialized previously.
+                root_state.substates = fresh_root_state.substates
+            self.states[client_token] = root_state
+            await self.populate_substates(client_token, root_state, root_state)
         return root_state
 
     async def set_state_for_substate(self, client_token: str, substate: BaseState):
@@ -197,7 +209,9 @@ class StateManagerDisk(StateManager):
 
         if substate._get_was_touched():
             substate._was_touched = False  # Reset the touched flag after serializing.
-            pickle_state = substate._serialize()
+            pickle_state = encode_state(
+                substate, self.codec, self.compression_threshold
+            )
             if pickle_state:
                 if not self.states_directory.exists():
                     self.states_directory.mkdir(parents=True, exist_ok=True)
@@ -3,20 +3,69 @@
 import asyncio
 import contextlib
 import dataclasses
+import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 
 from typing_extensions import Unpack, override
 
-from reflex.istate.manager import StateManager, StateModificationContext
+from reflex.environment import environment
+from reflex.istate.manager import (
+    StateManager,
+    StateModificationContext,
+    _default_token_expiration,
+)
 from reflex.state import BaseState, _split_substate_key
+from reflex.utils import console
+from reflex.utils.exceptions import StateSerializationError
+
+
+def _lock_in_use(lock: asyncio.Lock) -> bool:
+    """Check whether a lock is held or has pending waiters.
+
+    A released lock may still have a woken waiter that has not yet acquired it,
+    so the lock cannot be discarded until its waiter queue is also drained.
+
+    Args:
+        lock: The lock to check.
+
+    Returns:
+        Whether the lock is held or awaited.
+    """
+    return lock.locked() or bool(getattr(lock, "_waiters", None))
+
+
+def _estimate_state_size(state: BaseState) -> int:
+    """Estimate the memory footprint of a state tree using its serialized size.
+
+    Args:
+        state: The root of the state tree to measure.
+
+    Returns:
+        The sum of the pickled sizes of all states in the tree.
+    """
+    size = 0
+    stack = [state]
+    while stack:
+        substate = stack.pop()
+        with contextlib.suppress(StateSerializationError):
+            size += len(substate._serialize())
+        stack.extend(substate.substates.values())
+    return size
 
 
 @dataclasses.dataclass
 class StateManagerMemory(StateManager):
-    """A state manager that stores states in memory."""
+    """A state manager that stores states in memory.
 
-    # The mapping of client ids to states.
-    states: dict[str, BaseState] = dataclasses.field(default_factory=dict)
+    States are kept in least-recently-used order. Tokens that have not been
+    accessed within `token_expiration` seconds are dropped, and when `max_entries`
+    or `max_bytes` is set, the least recently used tokens are evicted to stay
+    within the budget. Tokens whose lock is currently held are never evicted.
+    """
+
+    # The mapping of client ids to states, ordered from least to most recently used.
+    states: OrderedDict[str, BaseState] = dataclasses.field(default_factory=OrderedDict)
 
     # The mutex ensures the dict of mutexes is updated exclusively
     _state_manager_lock: asyncio.Lock = dataclasses.field(default=asyncio.Lock())
@@ -26,6 +75,109 @@ class StateManagerMemory(StateManager):
         default_factory=dict, init=False
     )
 
+    # The token expiration time (s).
+    token_expiration: int = dataclasses.field(default_factory=_default_token_expiration)
+
+    # The maximum number of client states to keep (None for unlimited).
+    max_entries: int | None = dataclasses.field(
+        default_factory=environment.REFLEX_STATE_MANAGER_MEMORY_MAX_ENTRIES.get
+    )
+
+    # The maximum estimated size of all client states in bytes (None for unlimited).
+    max_bytes: int | None = dataclasses.field(
+        default_factory=environment.REFLEX_STATE_MANAGER_MEMORY_MAX_BYTES.get
+    )
+
+    # Last time a token was touched.
+    _token_last_touched: dict[str, float] = dataclasses.field(
+        default_factory=dict, init=False
+    )
+
+    # Estimated size of each client state in bytes (only tracked when max_bytes is set).
+    _state_sizes: dict[str, int] = dataclasses.field(default_factory=dict, init=False)
+
+    # Number of client states dropped because they were idle past token_expiration.
+    expired_count: int = dataclasses.field(default=0, init=False)
+
+    # Number of client states dropped to stay within max_entries or max_bytes.
+    evicted_count: int = dataclasses.field(default=0, init=False)
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Get the estimated size of all tracked client states.
+
+        Returns:
+            The estimated size in bytes (0 when max_bytes is not set).
+        """
+        return sum(self._state_sizes.values())
+
+    def _touch(self, token: str):
+        """Mark a token as most recently used.
+
+        Args:
+            token: The client token.
+        """
+        self._token_last_touched[token] = time.time()
+        self.states.move_to_end(token)
+
+    def _drop(self, token: str):
+        """Remove all bookkeeping for a token.
+
+        Args:
+            token: The client token.
+        """
+        self.states.pop(token, None)
+        self._token_last_touched.pop(token, None)
+        self._state_sizes.pop(token, None)
+        lock = self._states_locks.get(token)
+        if lock is not None and not _lock_in_use(lock):
+            self._states_locks.pop(token, None)
+
+    def _is_evictable(self, token: str) -> bool:
+        """Check whether a token's state may be dropped right now.
+
+        Args:
+            token: The client token.
+
+        Returns:
+            Whether no coroutine holds or waits for the token's lock.
+        """
+        lock = self._states_locks.get(token)
+        return lock is None or not _lock_in_use(lock)
+
+    def _over_budget(self) -> bool:
+        """Check whether the manager exceeds its entry or byte budget.
+
+        Returns:
+            Whether eviction is required.
+        """
+        if self.max_entries is not None and len(self.states) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.estimated_bytes > self.max_bytes
+
+    def _evict(self):
+        """Drop expired tokens, then least recently used tokens until within budget."""
+        now = time.time()
+        # States are ordered by last access, so expired tokens are at the front.
+        for token in list(self.states):
+            if now - self._token_last_touched.get(token, now) <= self.token_expiration:
+                break
+            if self._is_evictable(token):
+                self._drop(token)
+                self.expired_count += 1
+        if not self._over_budget():
+            return
+        for token in list(self.states):
+            if not self._over_budget():
+                break
+            if self._is_evictable(token):
+                self._drop(token)
+                self.evicted_count += 1
+        if self._over_budget():
+            console.debug(
+                f"StateManagerMemory: {len(self.states)} states in use exceed the configured budget."
+            )
+
     @override
     async def get_state(self, token: str) -> BaseState:
         """Get the state for a token.
@@ -38,9 +190,16 @@ class StateManagerMemory(StateManager):
         """
         # Memory state manager ignores the substate suffix and always returns the top-level state.
         token = _split_substate_key(token)[0]
-        if token not in self.states:
-            self.states[token] = self.state(_reflex_internal_init=True)
-        return self.states[token]
+        state = self.states.get(token)
+        if state is None:
+            state = self.states[token] = self.state(_reflex_internal_init=True)
+            self._touch(token)
+            if self.max_bytes is not None:
+                self._state_sizes[token] = _estimate_state_size(state)
+            self._evict()
+        else:
+            self._touch(token)
+        return state
 
     @override
     async def set_state(
@@ -58,6 +217,10 @@ class StateManagerMemory(StateManager):
         """
         token = _split_substate_key(token)[0]
         self.states[token] = state
+        self._touch(token)
+        if self.max_bytes is not None:
+            self._state_sizes[token] = _estimate_state_size(state)
+        self._evict()
 
     @override
     @contextlib.asynccontextmanager
@@ -83,3 +246,7 @@ class StateManagerMemory(StateManager):
         async with self._states_locks[token]:
             state = await self.get_state(token)
             yield state
+            if self.max_bytes is not None:
+                self._state_sizes[token] = _estimate_state_size(state)
+            # The token lock is still held here, so the current state is never evicted.
+            self._evict()
@@ -8,8 +8,8 @@ import os
 import sys
 import time
 import uuid
-from collections.abc import AsyncIterator
-from typing import TypedDict
+from collections.abc import AsyncIterator, Collection, Iterable, Sequence
+from typing import Any, TypedDict
 
 from redis import ResponseError
 from redis.asyncio import Redis
@@ -17,18 +17,33 @@ from typing_extensions import Unpack, override
 
 from reflex.config import get_config
 from reflex.environment import environment
+from reflex.istate.codec import (
+    StateCodec,
+    decode_state,
+    decode_value,
+    encode_state,
+    encode_value,
+    get_persisted_value,
+    persisted_var_names,
+    set_persisted_value,
+)
 from reflex.istate.manager import (
+    DEFAULT_BATCH_SIZE,
     StateManager,
     StateModificationContext,
+    _batched,
+    _default_compression_threshold,
+    _default_state_codec,
     _default_token_expiration,
 )
 from reflex.state import BaseState, _split_substate_key, _substate_key
-from reflex.utils import console
+from reflex.utils import console, metrics
 from reflex.utils.exceptions import (
     InvalidLockWarningThresholdError,
     LockExpiredError,
     StateSchemaMismatchError,
 )
+from reflex.utils.metrics import EventPhase
 from reflex.utils.tasks import ensure_task
 
 
@@ -61,6 +76,22 @@ def _default_oplock_hold_time_ms() -> int:
     )
 
 
+# The hash entry holding the schema hash when using the field layout.
+FIELD_LAYOUT_SCHEMA_KEY = "__schema__"
+
+
+def _fields_key(substate_key: str) -> str:
+    """Get the redis key of the hash storing a substate in the field layout.
+
+    Args:
+        substate_key: The substate key (token and state full name).
+
+    Returns:
+        The redis key of the substate hash.
+    """
+    return f"{substate_key}:fields"
+
+
 SMR = f"[SMR:{os.getpid()}]"
 start = time.monotonic()
 
@@ -101,6 +132,19 @@ class StateManagerRedis(StateManager):
         default_factory=_default_oplock_hold_time_ms
     )
 
+    # The codec used to encode each substate.
+    codec: StateCodec = dataclasses.field(default_factory=_default_state_codec)
+
+    # Compress encoded substates larger than this many bytes (None to disable).
+    compression_threshold: int | None = dataclasses.field(
+        default_factory=_default_compression_threshold
+    )
+
+    # Whether to store each substate as a hash with one entry per var, writing back only modified vars.
+    field_layout: bool = dataclasses.field(
+        default_factory=environment.REFLEX_STATE_MANAGER_REDIS_FIELD_LAYOUT.get
+    )
+
     # The keyspace subscription string when redis is waiting for lock to be released.
     _redis_notify_keyspace_events: str = dataclasses.field(
         default="K"  # Enable keyspace notifications (target a particular key)
@@ -254,63 +298,108 @@ class StateManagerRedis(StateManager):
             )
         return populated_states
 
-    @override
-    async def get_state(
-        self,
-        token: str,
-        top_level: bool = True,
-        for_state_instance: BaseState | None = None,
-    ) -> BaseState:
-        """Get the state for a token.
+    def _split_token(self, token: str) -> tuple[str, type[BaseState]]:
+        """Split a token into the client token and the requested state class.
 
         Args:
-            token: The token to get the state for.
-            top_level: If true, return an instance of the top-level state (self.state).
-            for_state_instance: If provided, attach the requested states to this existing state tree.
+            token: The token, in the form of {token}_{state_full_name}.
 
         Returns:
-            The state for the token.
+            The client token and the state class.
 
         Raises:
-            RuntimeError: when the state_cls is not specified in the token, or when the parent state for a
-                requested state was not fetched.
+            RuntimeError: when the state_cls is not specified in the token.
         """
-        # Split the actual token from the fully qualified substate name.
-        token, state_path = _split_substate_key(token)
-        if state_path:
-            # Get the State class associated with the given path.
-            state_cls = self.state.get_class_substate(state_path)
-        else:
-            msg = f"StateManagerRedis requires token to be specified in the form of {{token}}_{{state_full_name}}, but got {token}"
+        client_token, state_path = _split_substate_key(token)
+        if not state_path:
+            msg = f"StateManagerRedis requires token to be specified in the form of {{token}}_{{state_full_name}}, but got {client_token}"
             raise RuntimeError(msg)
+        # Get the State class associated with the given path.
+        return client_token, self.state.get_class_substate(state_path)
 
-        # Determine which states we already have.
-        flat_state_tree: dict[str, BaseState] = (
-            self._get_populated_states(for_state_instance) if for_state_instance else {}
-        )
+    def _get_sorted_required_state_classes(
+        self,
+        state_cls: type[BaseState],
+        exclude: set[type[BaseState]] | None = None,
+        states: Collection[str] | None = None,
+    ) -> list[type[BaseState]]:
+        """Get the state classes to fetch for a state, parents first.
 
-        # Determine which states from the tree need to be fetched.
-        required_state_classes = sorted(
-            self._get_required_state_classes(state_cls, subclasses=True)
-            - {type(s) for s in flat_state_tree.values()},
+        Args:
+            state_cls: The state class being fetched (with its substates).
+            exclude: State classes that were already fetched.
+            states: If provided, fetch these states instead of the substates of state_cls.
+
+        Returns:
+            The state classes to fetch, sorted by full name.
+        """
+        if states is None:
+            required_state_classes = self._get_required_state_classes(
+                state_cls, subclasses=True
+            )
+        else:
+            required_state_classes = self._get_required_state_classes(state_cls)
+            for state_name in states:
+                self._get_required_state_classes(
+                    self.state.get_class_substate(state_name),
+                    required_state_classes=required_state_classes,
+                )
+        return sorted(
+            required_state_classes - (exclude or set()),
             key=lambda x: x.get_full_name(),
         )
 
-        redis_pipeline = self.redis.pipeline()
+    def _queue_get_states(
+        self,
+        redis_pipeline: Any,
+        client_token: str,
+        required_state_classes: list[type[BaseState]],
+    ):
+        """Queue the commands fetching the given states on a pipeline.
+
+        Args:
+            redis_pipeline: The redis pipeline.
+            client_token: The client token.
+            required_state_classes: The state classes to fetch.
+        """
         for state_cls in required_state_classes:
-            redis_pipeline.get(_substate_key(token, state_cls))
+            if self.field_layout:
+                redis_pipeline.hmget(
+                    _fields_key(_substate_key(client_token, state_cls)),
+                    [FIELD_LAYOUT_SCHEMA_KEY, *persisted_var_names(state_cls)],
+                )
+            else:
+                redis_pipeline.get(_substate_key(client_token, state_cls))
 
+    def _build_state_tree(
+        self,
+        required_state_classes: list[type[BaseState]],
+        redis_states: list[Any],
+        flat_state_tree: dict[str, BaseState],
+    ):
+        """Instantiate fetched states and link them into a state tree.
+
+        Args:
+            required_state_classes: The fetched state classes, parents first.
+            redis_states: The pipeline results for each state class.
+            flat_state_tree: The states already in the tree by full name (updated in place).
+
+        Raises:
+            RuntimeError: when the parent state for a fetched state is missing.
+        """
         for state_cls, redis_state in zip(
             required_state_classes,
-            await redis_pipeline.execute(),
+            redis_states,
             strict=False,
         ):
             state = None
 
-            if redis_state is not None:
+            if self.field_layout:
+                state = self._state_from_fields(state_cls, redis_state)
+            elif redis_state is not None:
                 # Deserialize the substate.
                 with contextlib.suppress(StateSchemaMismatchError):
-                    state = BaseState._deserialize(data=redis_state)
+                    state = decode_state(redis_state)
             if state is None:
                 # Key didn't exist or schema mismatch so create a new instance for this token.
                 state = state_cls(
@@ -333,6 +422,51 @@ class StateManagerRedis(StateManager):
                 parent_state.substates[state_name] = state
                 state.parent_state = parent_state
 
+    @override
+    async def get_state(
+        self,
+        token: str,
+        top_level: bool = True,
+        for_state_instance: BaseState | None = None,
+        states: Collection[str] | None = None,
+    ) -> BaseState:
+        """Get the state for a token.
+
+        Args:
+            token: The token to get the state for.
+            top_level: If true, return an instance of the top-level state (self.state).
+            for_state_instance: If provided, attach the requested states to this existing state tree.
+            states: If provided, only fetch these states (by full name) instead of all substates.
+
+        Returns:
+            The state for the token.
+
+        Raises:
+            RuntimeError: when the state_cls is not specified in the token, or when the parent state for a
+                requested state was not fetched.
+        """
+        # Split the actual token from the fully qualified substate name.
+        token, state_cls = self._split_token(token)
+
+        # Determine which states we already have.
+        flat_state_tree: dict[str, BaseState] = (
+            self._get_populated_states(for_state_instance) if for_state_instance else {}
+        )
+
+        # Determine which states from the tree need to be fetched.
+        required_state_classes = self._get_sorted_required_state_classes(
+            state_cls,
+            exclude={type(s) for s in flat_state_tree.values()},
+            states=states,
+        )
+
+        with metrics.measure(EventPhase.STATE_FETCH):
+            redis_pipeline = self.redis.pipeline()
+            self._queue_get_states(redis_pipeline, token, required_state_classes)
+            self._build_state_tree(
+                required_state_classes, await redis_pipeline.execute(), flat_state_tree
+            )
+
         # To retain compatibility with previous implementation, by default, we return
         # the top-level state which should always be fetched or already cached.
         if top_level:
@@ -414,8 +548,10 @@ class StateManagerRedis(StateManager):
             for substate in state.substates.values()
         ]
         # Persist only the given state (parents or substates are excluded by BaseState.__getstate__).
-        if state._get_was_touched():
-            pickle_state = state._serialize()
+        if state._get_was_touched() and self.field_layout:
+            await self._set_state_fields(client_token, state)
+        elif state._get_was_touched():
+            pickle_state = encode_state(state, self.codec, self.compression_threshold)
             if pickle_state:
                 await self.redis.set(
                     _substate_key(client_token, state),
@@ -427,6 +563,120 @@ class StateManagerRedis(StateManager):
         for t in tasks:
             await t
 
+    @staticmethod
+    def _state_from_fields(
+        state_cls: type[BaseState], values: list[bytes | None]
+    ) -> BaseState:
+        """Reassemble a state instance from the values fetched from its hash.
+
+        Args:
+            state_cls: The state class to instantiate.
+            values: The schema hash followed by the persisted var values (HMGET result).
+
+        Returns:
+            The state instance.
+        """
+        state = state_cls(init_substates=False, _reflex_internal_init=True)
+        state._track_touched_vars = True
+        field_names = persisted_var_names(state_cls)
+        schema, *field_values = values
+        if schema is not None and schema.decode() == state_cls._to_schema():
+            with contextlib.suppress(StateSchemaMismatchError):
+                decoded = {
+                    name: decode_value(raw_value)
+                    for name, raw_value in zip(field_names, field_values, strict=True)
+                    if raw_value is not None
+                }
+                for name, value in decoded.items():
+                    set_persisted_value(state, name, value)
+                return state
+        # Missing, outdated or undecodable hash, so the first write must persist every var.
+        state._touched_vars.update(field_names)
+        return state
+
+    def _queue_set_state_fields(
+        self, redis_pipeline: Any, client_token: str, state: BaseState
+    ) -> set[str]:
+        """Queue the write of the modified vars of a state to its hash.
+
+        Args:
+            redis_pipeline: The redis pipeline.
+            client_token: The client token.
+            state: The state instance to persist (substates are not included).
+
+        Returns:
+            The names of the queued vars, to discard from the touched vars once written.
+        """
+        names = state._touched_vars.intersection(persisted_var_names(type(state)))
+        if not names:
+            return names
+        mapping: dict[str, bytes | str] = {
+            name: encode_value(
+                state,
+                name,
+                get_persisted_value(state, name),
+                self.codec,
+                self.compression_threshold,
+            )
+            for name in names
+        }
+        mapping[FIELD_LAYOUT_SCHEMA_KEY] = state._to_schema()
+        key = _fields_key(_substate_key(client_token, state))
+        redis_pipeline.hset(key, mapping=mapping)
+        redis_pipeline.pexpire(key, self.token_expiration * 1000)
+        return names
+
+    async def _set_state_fields(self, client_token: str, state: BaseState):
+        """Write back only the modified vars of a state to its hash.
+
+        Args:
+            client_token: The client token.
+            state: The state instance to persist (substates are not included).
+        """
+        redis_pipeline = self.redis.pipeline()
+        names = self._queue_set_state_fields(redis_pipeline, client_token, state)
+        if not names:
+            return
+        await redis_pipeline.execute()
+        state._touched_vars.difference_update(names)
+
+    def _queue_set_state_tree(
+        self, redis_pipeline: Any, client_token: str, state: BaseState
+    ) -> list[tuple[BaseState, set[str]]]:
+        """Queue the writes of every modified state in a state tree.
+
+        Args:
+            redis_pipeline: The redis pipeline.
+            client_token: The client token.
+            state: The root of the state tree to persist.
+
+        Returns:
+            The states written with the field layout and their queued var names.
+        """
+        queued_fields = []
+        stack = [state]
+        while stack:
+            substate = stack.pop()
+            stack.extend(substate.substates.values())
+            if not substate._get_was_touched():
+                continue
+            if self.field_layout:
+                queued_fields.append((
+                    substate,
+                    self._queue_set_state_fields(
+                        redis_pipeline, client_token, substate
+                    ),
+                ))
+            elif pickle_state := encode_state(
+                substate, self.codec, self.compression_threshold
+            ):
+                redis_pipeline.set(
+                    _substate_key(client_token, substate),
+                    pickle_state,
+                    ex=self.token_expiration,
+                )
+        return queued_fields
+
     @contextlib.asynccontextmanager
     async def _try_modify_state(
         self, token: str, **context: Unpack[StateModificationContext]
@@ -443,7 +693,7 @@ class StateManagerRedis(StateManager):
         if not self._oplock_enabled:
             # OpLock is disabled, get a fresh lock, write, and release.
             async with self._lock(token) as lock_id:
-                state = await self.get_state(token)
+                state = await self.get_state(token, states=context.get("states"))
                 yield state
                 await self.set_state(token, state, lock_id=lock_id, **context)
             return
@@ -474,7 +724,7 @@ class StateManagerRedis(StateManager):
                         f"{SMR} [{time.monotonic() - start:.3f}] {client_token} has contention, not leasing"
                     )
                 async with lock_held_ctx:
-                    state = await self.get_state(token)
+                    state = await self.get_state(token, states=context.get("states"))
                     yield state
                     await self.set_state(token, state, lock_id=lock_id, **context)
                 return
@@ -500,7 +750,9 @@ class StateManagerRedis(StateManager):
                             f"{SMR} [{time.monotonic() - start:.3f}] {client_token} holding lock {lock_id.decode()}, {new_lease_task=} already exited, doing single update..."
                         )
                     async with lock_held_ctx:
-                        state = await self.get_state(token)
+                        state = await self.get_state(
+                            token, states=context.get("states")
+                        )
                         yield state
                         await self.set_state(token, state, lock_id=lock_id, **context)
                     return
@@ -531,6 +783,216 @@ class StateManagerRedis(StateManager):
                     yield state_instance
                     return
 
+    async def _get_states_pipelined(self, tokens: Sequence[str]) -> list[BaseState]:
+        """Fetch the top-level states of many tokens in a single round trip.
+
+        Args:
+            tokens: The tokens to fetch, in the form of {token}_{state_full_name}.
+
+        Returns:
+            The top-level state for each token.
+        """
+        redis_pipeline = self.redis.pipeline()
+        fetches = []
+        for token in tokens:
+            client_token, state_cls = self._split_token(token)
+            required_state_classes = self._get_sorted_required_state_classes(state_cls)
+            self._queue_get_states(redis_pipeline, client_token, required_state_classes)
+            fetches.append(required_state_classes)
+        if not fetches:
+            return []
+        redis_states = await redis_pipeline.execute()
+        states = []
+        offset = 0
+        for required_state_classes in fetches:
+            flat_state_tree: dict[str, BaseState] = {}
+            self._build_state_tree(
+                required_state_classes,
+                redis_states[offset : offset + len(required_state_classes)],
+                flat_state_tree,
+            )
+            offset += len(required_state_classes)
+            states.append(flat_state_tree[self.state.get_full_name()])
+        return states
+
+    async def _try_get_locks(self, tokens: Sequence[str]) -> dict[str, bytes]:
+        """Try to get the redis locks of many tokens in a single round trip.
+
+        Tokens with local waiters are skipped to preserve the waiting order.
+
+        Args:
+            tokens: The tokens to lock.
+
+        Returns:
+            The lock ID of each token whose lock was obtained.
+        """
+        redis_pipeline = self.redis.pipeline()
+        lock_ids = {}
+        for token in tokens:
+            lock_key = self._lock_key(token)
+            if self._n_lock_waiters(lock_key):
+                continue
+            lock_ids[token] = uuid.uuid4().hex.encode()
+            redis_pipeline.set(
+                lock_key, lock_ids[token], px=self.lock_expiration, nx=True
+            )
+        if not lock_ids:
+            return {}
+        return {
+            token: lock_id
+            for (token, lock_id), obtained in zip(
+                lock_ids.items(), await redis_pipeline.execute(), strict=True
+            )
+            if obtained
+        }
+
+    async def _release_locks(self, lock_ids: dict[str, bytes]):
+        """Release the redis locks of many tokens in a single round trip.
+
+        Args:
+            lock_ids: The lock ID of each locked token.
+        """
+        if not lock_ids:
+            return
+        redis_pipeline = self.redis.pipeline()
+        for token in lock_ids:
+            redis_pipeline.getdel(self._lock_key(token))
+        for (token, lock_id), deleted_lock_id in zip(
+            lock_ids.items(), await redis_pipeline.execute(), strict=True
+        ):
+            lock_key = self._lock_key(token)
+            if deleted_lock_id is not None and deleted_lock_id != lock_id:
+                console.warn(
+                    f"{lock_key.decode()} was released by {lock_id.decode()}, but it belonged to {deleted_lock_id.decode()}. This is a bug."
+                )
+            self._notify_next_waiter(lock_key)
+
+    async def _set_states_pipelined(
+        self,
+        states: list[tuple[str, BaseState]],
+        lock_ids: dict[str, bytes],
+        **context: Unpack[StateModificationContext],
+    ):
+        """Persist many modified states in a single round trip.
+
+        Args:
+            states: The token and top-level state of each modified state.
+            lock_ids: The lock ID of each locked token.
+            context: The state modification context.
+
+        Raises:
+            LockExpiredError: If the lock of any token expired while modifying its state.
+        """
+        if not states:
+            return
+        redis_pipeline = self.redis.pipeline()
+        for token, _ in states:
+            redis_pipeline.get(self._lock_key(token))
+        current_lock_ids = await redis_pipeline.execute()
+
+        expired = []
+        queued_fields = []
+        redis_pipeline = self.redis.pipeline()
+        for (token, state), current_lock_id in zip(
+            states, current_lock_ids, strict=True
+        ):
+            if current_lock_id != lock_ids[token]:
+                expired.append(token)
+                continue
+            queued_fields.extend(
+                self._queue_set_state_tree(
+                    redis_pipeline, _split_substate_key(token)[0], state
+                )
+            )
+        if len(expired) < len(states):
+            await redis_pipeline.execute()
+        for state, names in queued_fields:
+            state._touched_vars.difference_update(names)
+        if expired:
+            msg = (
+                f"Lock expired for tokens {', '.join(expired)} while modifying them in bulk. "
+                f"Consider increasing `app.state_manager.lock_expiration` (currently {self.lock_expiration}) "
+                "or using a smaller batch size."
+                + (
+                    f" Happened in event: {event.name}"
+                    if (event := context.get("event")) is not None
+                    else ""
+                )
+            )
+            raise LockExpiredError(msg)
+
+    @override
+    async def get_states(
+        self, tokens: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[tuple[str, BaseState]]:
+        """Get the states for many tokens, fetching each batch in a single round trip.
+
+        Args:
+            tokens: The tokens to get the states for.
+            batch_size: The number of tokens fetched per round trip.
+
+        Yields:
+            Each token and its state, as each batch becomes available.
+        """
+        for batch in _batched(tokens, batch_size):
+            for token, state in zip(
+                batch, await self._get_states_pipelined(batch), strict=True
+            ):
+                yield token, state
+
+    @override
+    async def modify_states(
+        self,
+        tokens: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **context: Unpack[StateModificationContext],
+    ) -> AsyncIterator[tuple[str, BaseState]]:
+        """Modify the states for many tokens, pipelining locks, reads and writes per batch.
+
+        The locks of a batch are acquired together and held until every state of
+        the batch was modified, then the modified states are written and the locks
+        released together. When the iterator is closed early (also when the loop
+        body raises), the states yielded so far (including the one being modified)
+        are written. When an error is raised within the iterator (thrown in with
+        `athrow`, or while fetching or writing), the locks of the batch are
+        released without writing its states.
+        Tokens whose lock is held elsewhere are modified one at a time after
+        their batch.
+
+        Args:
+            tokens: The tokens to modify the states for.
+            batch_size: The number of tokens locked and fetched per round trip.
+            context: The state modification context.
+
+        Yields:
+            Each token and its state while holding its lock.
+        """
+        for batch in _batched(dict.fromkeys(tokens), batch_size):
+            lock_ids = await self._try_get_locks(batch)
+            try:
+                locked_tokens = [token for token in batch if token in lock_ids]
+                modified = []
+                try:
+                    for token, state in zip(
+                        locked_tokens,
+                        await self._get_states_pipelined(locked_tokens),
+                        strict=True,
+                    ):
+                        # Recorded before yielding, so it is written if the caller leaves early.
+                        modified.append((token, state))
+                        yield token, state
+                except GeneratorExit:
+                    await self._set_states_pipelined(modified, lock_ids, **context)
+                    raise
+                else:
+                    await self._set_states_pipelined(modified, lock_ids, **context)
+            finally:
+                await self._release_locks(lock_ids)
+            for token in batch:
+                if token not in lock_ids:
+                    async with self.modify_state(token, **context) as state:
+                        yield token, state
+
     @contextlib.asynccontextmanager
     async def _get_state_cached(self, token: str) -> AsyncIterator[BaseState | None]:
         """Get the cached state for a token, while holding the local lease lock.
@@ -699,7 +1161,9 @@ class StateManagerRedis(StateManager):
                     name=f"reflex_lease_breaker|{client_token}|{lock_id.decode()}",
                 )
                 # Fetch the requested state into the cache.
-                self._cached_states[client_token] = await self.get_state(token)
+                self._cached_states[client_token] = await self.get_state(
+                    token, states=context.get("states")
+                )
                 return task
         return None
 
@@ -1010,7 +1474,8 @@ class StateManagerRedis(StateManager):
         lock_key = self._lock_key(token)
         lock_id = uuid.uuid4().hex.encode()
 
-        await self._wait_lock(lock_key, lock_id)
+        with metrics.measure(EventPhase.LOCK_WAIT):
+            await self._wait_lock(lock_key, lock_id)
         state_is_locked = True
 
         try:
@@ -8,6 +8,7 @@ import dataclasses
 import functools
 import inspect
 import json
+import time
 from collections.abc import Callable, Sequence
 from importlib.util import find_spec
 from types import MethodType
@@ -22,6 +23,7 @@ from reflex.utils.serializers import can_serialize, serialize, serializer
 from reflex.vars.base import Var
 
 if TYPE_CHECKING:
+    from reflex.event import EventHandler
     from reflex.state import BaseState, StateUpdate
 
 T_STATE = TypeVar("T_STATE", bound="BaseState")
@@ -51,12 +53,21 @@ class StateProxy(wrapt.ObjectProxy):
                 await asyncio.sleep(1)
                 async with self:
                     self.counter += 1
+
+    With a flush interval (`@rx.event(background=True, flush_interval=0.1)`), the
+    lock is kept for up to that many seconds after exiting the context, so the
+    changes of consecutive `async with self` blocks are written and emitted to
+    the frontend together instead of once per block. Other events of the same
+    client wait for the lock meanwhile, so they can be delayed by up to the
+    flush interval. When a context raises while changes are held, the held
+    changes are written along with the changes made before the error.
     """
 
     def __init__(
         self,
         state_instance: BaseState,
         parent_state_proxy: StateProxy | None = None,
+        flush_interval: float | None = None,
     ):
         """Create a proxy for a state instance.
 
@@ -67,6 +78,7 @@ class StateProxy(wrapt.ObjectProxy):
         Args:
             state_instance: The state instance to proxy.
             parent_state_proxy: The parent state proxy, for linked mutability and context tracking.
+            flush_interval: The minimum time between writes of the state (s), None to write on every context exit.
         """
         from reflex.state import _substate_key
 
@@ -82,6 +94,11 @@ class StateProxy(wrapt.ObjectProxy):
         self._self_actx_lock = asyncio.Lock()
         self._self_actx_lock_holder = None
         self._self_parent_state_proxy = parent_state_proxy
+        self._self_flush_interval = flush_interval
+        self._self_last_flush = 0.0
+        self._self_changes_held = False
+        self._self_flush_handle: asyncio.TimerHandle | None = None
+        self._self_flush_task: asyncio.Task | None = None
 
     def _is_mutable(self) -> bool:
         """Check if the state is mutable.
@@ -131,13 +148,24 @@ class StateProxy(wrapt.ObjectProxy):
 
         await self._self_actx_lock.acquire()
         self._self_actx_lock_holder = current_task
-        self._self_actx = self._self_app.modify_state(
-            token=self._self_substate_token, background=True
-        )
-        mutable_state = await self._self_actx.__aenter__()
-        super().__setattr__(
-            "__wrapped__", mutable_state.get_substate(self._self_substate_path)
-        )
+        if self._self_flush_handle is not None:
+            self._self_flush_handle.cancel()
+            self._self_flush_handle = None
+        if self._self_actx is None:
+            self._self_actx = self._self_app.modify_state(
+                token=self._self_substate_token, background=True
+            )
+            try:
+                mutable_state = await self._self_actx.__aenter__()
+            except BaseException:
+                self._self_actx = None
+                self._self_actx_lock_holder = None
+                self._self_actx_lock.release()
+                raise
+            super().__setattr__(
+                "__wrapped__", mutable_state.get_substate(self._self_substate_path)
+            )
+        # Otherwise the lock is still held since the last context, keep using that state.
         self._self_mutable = True
         return self
 
@@ -156,11 +184,64 @@ class StateProxy(wrapt.ObjectProxy):
             return
         self._self_mutable = False
         try:
-            await self._self_actx.__aexit__(*exc_info)
+            delay = (
+                self._self_last_flush + self._self_flush_interval - time.monotonic()
+                if self._self_flush_interval is not None and exc_info[0] is None
+                else 0
+            )
+            if delay > 0:
+                # Keep the lock and flush the accumulated changes later.
+                self._self_changes_held = True
+                self._self_flush_handle = asyncio.get_running_loop().call_later(
+                    delay, self._start_flush
+                )
+            elif exc_info[0] is not None and self._self_changes_held:
+                # The held changes of the previous contexts succeeded, so write them
+                # (with the partial changes of this context) instead of dropping them.
+                await self._flush_locked()
+            else:
+                await self._flush_locked(*exc_info)
         finally:
             self._self_actx_lock_holder = None
             self._self_actx_lock.release()
-        self._self_actx = None
+
+    async def _flush_locked(self, *exc_info: Any) -> None:
+        """Write the state and emit its delta, releasing the state lock.
+
+        Must be called while holding the context lock of the proxy.
+
+        Args:
+            exc_info: The exception info tuple.
+        """
+        if self._self_flush_handle is not None:
+            self._self_flush_handle.cancel()
+            self._self_flush_handle = None
+        if self._self_actx is None:
+            return
+        actx, self._self_actx = self._self_actx, None
+        self._self_changes_held = False
+        try:
+            await actx.__aexit__(*(exc_info or (None, None, None)))
+        finally:
+            self._self_last_flush = time.monotonic()
+
+    def _start_flush(self):
+        """Flush the changes kept since the last context in a new task."""
+        self._self_flush_handle = None
+        self._self_flush_task = asyncio.create_task(
+            self._flush(), name=f"reflex_state_flush|{self._self_substate_token}"
+        )
+
+    async def _flush(self) -> None:
+        """Write the changes kept since the last context, if any.
+
+        Called when the flush interval elapsed and when the background task ends.
+        """
+        if self._self_parent_state_proxy is not None:
+            await self._self_parent_state_proxy._flush()
+            return
+        async with self._self_actx_lock:
+            await self._flush_locked()
 
     def __enter__(self):
         """Enter the regular context manager protocol.
@@ -309,7 +390,55 @@ class StateProxy(wrapt.ObjectProxy):
 
 
 class ReadOnlyStateProxy(StateProxy):
-    """A read-only proxy for a state."""
+    """A read-only proxy for a state.
+
+    Used for states fetched without holding the state lock, such as the snapshot
+    passed to `@rx.event(read_only=True)` handlers. Changes are never written back.
+    """
+
+    async def __aenter__(self) -> StateProxy:
+        """Prevent entering a mutable context on a read-only proxy.
+
+        Raises:
+            NotImplementedError: Always raised when trying to modify the proxied state.
+        """
+        msg = "This is a read-only state proxy."
+        raise NotImplementedError(msg)
+
+    async def get_state(self, state_cls: type[T_STATE]) -> T_STATE:
+        """Get a read-only instance of another state associated with this token.
+
+        Args:
+            state_cls: The class of the state.
+
+        Returns:
+            A read-only proxy of the state.
+        """
+        return type(self)(await self.__wrapped__.get_state(state_cls))  # pyright: ignore [reportReturnType]
+
+    async def _as_state_update(
+        self, handler: EventHandler, events: Any, final: bool
+    ) -> StateUpdate:
+        """Convert the events returned by a read-only handler to a StateUpdate.
+
+        Args:
+            handler: The handler where the events originated from.
+            events: The events to queue with the update.
+            final: Whether the handler is done processing.
+
+        Returns:
+            The StateUpdate containing only the events, since the state is never modified.
+        """
+        from reflex.event import fix_events
+        from reflex.state import StateUpdate
+
+        state = self.__wrapped__
+        return StateUpdate(
+            events=fix_events(
+                state._check_valid(handler, events), state.router.session.client_token
+            ),
+            final=final,
+        )
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Prevent setting attributes on the state for read-only proxy.
@@ -401,6 +530,9 @@ class MutableProxy(wrapt.ObjectProxy):
     # Dynamically generated classes for tracking dataclass mutations.
     __dataclass_proxies__: dict[str, type] = {}
 
+    # Whether the proxy wraps a value nested inside the field rather than the field itself.
+    _self_nested: bool = False
+
     def __new__(cls, wrapped: Any, *args, **kwargs) -> MutableProxy:
         """Create a proxy instance for a mutable object that tracks changes.
 
@@ -472,12 +604,43 @@ class MutableProxy(wrapt.ObjectProxy):
         Returns:
             The result of the wrapped function.
         """
+        self._self_state._record_field_ops(
+            self._self_field_name,
+            self.__wrapped__,
+            functools.partial(self._get_field_ops, wrapped, args, kwargs or {}),
+        )
         self._self_state.dirty_vars.add(self._self_field_name)
         self._self_state._mark_dirty()
         if wrapped is not None:
             return wrapped(*args, **(kwargs or {}))
         return None
 
+    def _get_field_ops(
+        self, wrapped: Callable | None, args: tuple, kwargs: dict
+    ) -> list[dict[str, Any]] | None:
+        """Describe a pending mutation of the field as JSON-patch style operations.
+
+        Must be called before the mutation is applied.
+
+        Args:
+            wrapped: The mutating method of the wrapped object.
+            args: The args for the method.
+            kwargs: The kwargs for the method.
+
+        Returns:
+            The operations, or None if the mutation cannot be described.
+        """
+        if self._self_nested or wrapped is None:
+            return None
+        value = self.__wrapped__
+        method = getattr(wrapped, "__name__", None)
+        args = tuple(_unwrap_proxy(arg) for arg in args)
+        if type(value) is list:
+            return _get_list_ops(value, method, args, kwargs)
+        if type(value) is dict:
+            return _get_dict_ops(value, method, args, kwargs)
+        return None
+
     @staticmethod
     def _is_called_from_dataclasses_internal() -> bool:
         """Check if the current function is called from dataclasses helper.
@@ -511,11 +674,13 @@ class MutableProxy(wrapt.ObjectProxy):
         # Recursively wrap mutable types, but do not re-wrap MutableProxy instances.
         if is_mutable_type(type(value)) and not isinstance(value, MutableProxy):
             base_cls = globals()[self.__base_proxy__]
-            return base_cls(
+            proxy = base_cls(
                 wrapped=value,
                 state=self._self_state,
                 field_name=self._self_field_name,
             )
+            proxy._self_nested = True
+            return proxy
         return value
 
     def _wrap_recursive_decorator(
@@ -677,6 +842,121 @@ class MutableProxy(wrapt.ObjectProxy):
         return self.__wrapped__.__reduce_ex__(protocol_version)
 
 
+def _unwrap_proxy(value: Any) -> Any:
+    """Strip a MutableProxy off a value.
+
+    Args:
+        value: The value, possibly a MutableProxy.
+
+    Returns:
+        The wrapped value.
+    """
+    return value.__wrapped__ if isinstance(value, MutableProxy) else value
+
+
+def _normalize_index(length: int, index: Any) -> int | None:
+    """Convert a possibly negative list index to a positive one.
+
+    Args:
+        length: The length of the list.
+        index: The index.
+
+    Returns:
+        The positive index, or None if it is out of range or not an int.
+    """
+    if type(index) is not int:
+        return None
+    if index < 0:
+        index += length
+    return index if 0 <= index < length else None
+
+
+def _get_list_ops(
+    value: list, method: str | None, args: tuple, kwargs: dict
+) -> list[dict[str, Any]] | None:
+    """Describe a pending list mutation as JSON-patch style operations.
+
+    Args:
+        value: The list before the mutation.
+        method: The name of the mutating method.
+        args: The args for the method.
+        kwargs: The kwargs for the method.
+
+    Returns:
+        The operations, or None if the mutation cannot be described.
+    """
+    if kwargs:
+        return None
+    if method == "append":
+        return [{"op": "add", "path": "-", "value": args[0]}]
+    if method == "extend" and isinstance(args[0], (list, tuple)):
+        return [
+            {"op": "add", "path": "-", "value": _unwrap_proxy(item)} for item in args[0]
+        ]
+    if method == "insert":
+        index = args[0]
+        if type(index) is not int:
+            return None
+        index = min(max(index + len(value) if index < 0 else index, 0), len(value))
+        path = "-" if index == len(value) else index
+        return [{"op": "add", "path": path, "value": args[1]}]
+    if method in ("pop", "__delitem__"):
+        index = _normalize_index(len(value), args[0] if args else -1)
+        if index is None:
+            return None
+        return [{"op": "remove", "path": index}]
+    if method == "remove":
+        try:
+            index = value.index(args[0])
+        except ValueError:
+            return None
+        return [{"op": "remove", "path": index}]
+    if method == "__setitem__":
+        index = _normalize_index(len(value), args[0])
+        if index is None:
+            return None
+        return [{"op": "replace", "path": index, "value": args[1]}]
+    return None
+
+
+def _get_dict_ops(
+    value: dict, method: str | None, args: tuple, kwargs: dict
+) -> list[dict[str, Any]] | None:
+    """Describe a pending dict mutation as JSON-patch style operations.
+
+    Args:
+        value: The dict before the mutation.
+        method: The name of the mutating method.
+        args: The args for the method.
+        kwargs: The kwargs for the method.
+
+    Returns:
+        The operations, or None if the mutation cannot be described.
+    """
+    if method == "update":
+        if len(args) > 1 or (args and type(args[0]) is not dict):
+            return None
+        items = {**(args[0] if args else {}), **kwargs}
+        if not all(type(key) is str for key in items):
+            return None
+        return [
+            {"op": "add", "path": key, "value": _unwrap_proxy(item)}
+            for key, item in items.items()
+        ]
+    if kwargs or not args or type(args[0]) not in (str, int):
+        return None
+    key = args[0]
+    if method == "__setitem__":
+        return [{"op": "add", "path": key, "value": args[1]}]
+    if method == "setdefault":
+        if key in value:
+            return []
+        return [{"op": "add", "path": key, "value": args[1] if len(args) > 1 else None}]
+    if method in ("pop", "__delitem__"):
+        return [{"op": "remove", "path": key}] if key in value else []
+    return None
+
+
 @serializer
 def serialize_mutable_proxy(mp: MutableProxy):
     """Return the wrapped value of a MutableProxy.
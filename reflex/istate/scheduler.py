@@ -0,0 +1,279 @@
+"""Scheduler limiting the concurrency of background event handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections.abc import Callable, Coroutine, Hashable
+from enum import Enum
+from typing import Any
+
+from reflex.utils import console
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a background task started while its concurrency limit is reached."""
+
+    # Wait for a running task to finish.
+    QUEUE = "queue"
+    # Do not run the new task.
+    DROP = "drop"
+    # Cancel the queued and oldest running tasks of the handler to run the new one.
+    REPLACE = "replace"
+
+
+@dataclasses.dataclass(frozen=True)
+class BackgroundTaskLimits:
+    """The concurrency limits of a background event handler."""
+
+    # The maximum number of running tasks of the handler across all clients.
+    max_concurrency: int | None = None
+
+    # The maximum number of running tasks of the handler for a single client token.
+    max_concurrency_per_token: int | None = None
+
+    # What to do with tasks started while a limit is reached.
+    overflow: OverflowPolicy = OverflowPolicy.QUEUE
+
+
+@dataclasses.dataclass
+class BackgroundTaskInfo:
+    """A background task tracked by the scheduler."""
+
+    # The full name of the event handler.
+    handler: str
+
+    # The client token the task runs for.
+    token: str
+
+    # The asyncio task.
+    task: asyncio.Task
+
+    # When the task was submitted (monotonic time).
+    submitted_at: float
+
+    # When the task started running (None while queued).
+    started_at: float | None = None
+
+
+@dataclasses.dataclass
+class _Slots:
+    """A concurrency limit shared by the tasks of one scope, granted in FIFO order."""
+
+    limit: int
+
+    # The tasks holding a slot, in the order they started.
+    holders: list[asyncio.Task] = dataclasses.field(default_factory=list)
+
+    # The tasks waiting for a slot, in the order they were queued.
+    waiters: dict[asyncio.Task, asyncio.Future] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def is_available(self) -> bool:
+        """Check whether a new task would get a slot right away.
+
+        Returns:
+            Whether a slot is free and no task is queued for it.
+        """
+        return not self.waiters and len(self.holders) < self.limit
+
+    async def acquire(self, task: asyncio.Task):
+        """Wait until the task holds a slot.
+
+        Args:
+            task: The task acquiring the slot.
+        """
+        if self.is_available():
+            self.holders.append(task)
+            return
+        waiter = self.waiters[task] = asyncio.get_running_loop().create_future()
+        await waiter
+
+    def release(self, task: asyncio.Task):
+        """Release the slot of a task (or its place in the queue).
+
+        Args:
+            task: The task releasing the slot.
+        """
+        if task not in self.holders:
+            self.waiters.pop(task, None)
+            return
+        self.holders.remove(task)
+        # Hand the free slots over to the queued tasks.
+        while self.waiters and len(self.holders) < self.limit:
+            waiter_task = next(iter(self.waiters))
+            waiter = self.waiters.pop(waiter_task)
+            self.holders.append(waiter_task)
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+@dataclasses.dataclass
+class BackgroundTaskScheduler:
+    """Starts background tasks, enforcing global, per handler and per token limits."""
+
+    # The maximum number of running background tasks (None for unlimited).
+    max_tasks: int | None = None
+
+    # The tracked tasks, queued or running.
+    _tasks: dict[asyncio.Task, BackgroundTaskInfo] = dataclasses.field(
+        default_factory=dict, init=False
+    )
+
+    # The slots of each limited scope, discarded when unused.
+    _slots: dict[Hashable, _Slots] = dataclasses.field(default_factory=dict, init=False)
+
+    def _scopes(
+        self, handler: str, token: str, limits: BackgroundTaskLimits | None
+    ) -> list[tuple[Hashable, int]]:
+        """Get the limited scopes of a task, most specific first.
+
+        Args:
+            handler: The full name of the event handler.
+            token: The client token.
+            limits: The limits of the handler.
+
+        Returns:
+            The scope keys with their limit.
+        """
+        scopes: list[tuple[Hashable, int]] = []
+        if limits is not None:
+            if limits.max_concurrency_per_token is not None:
+                scopes.append(((handler, token), limits.max_concurrency_per_token))
+            if limits.max_concurrency is not None:
+                scopes.append((handler, limits.max_concurrency))
+        if self.max_tasks is not None:
+            scopes.append((None, self.max_tasks))
+        return scopes
+
+    def _supersede(self, scopes: list[tuple[Hashable, int]]):
+        """Cancel the tasks of a handler superseded by a new task.
+
+        The queued tasks of the full handler scopes are cancelled, along with a
+        single running task: the oldest one of the most specific full scope,
+        which also holds a slot in the broader scopes of the handler.
+
+        Args:
+            scopes: The limited scopes of the new task, most specific first.
+        """
+        full_slots = [
+            slots
+            for key, _ in scopes
+            if key is not None
+            and (slots := self._slots.get(key)) is not None
+            and not slots.is_available()
+        ]
+        for slots in full_slots:
+            for waiter_task in slots.waiters:
+                waiter_task.cancel()
+        for slots in full_slots:
+            if len(slots.holders) >= slots.limit:
+                slots.holders[0].cancel()
+                break
+
+    def submit(
+        self,
+        handler: str,
+        token: str,
+        coro_fn: Callable[[], Coroutine[Any, Any, Any]],
+        limits: BackgroundTaskLimits | None = None,
+    ) -> asyncio.Task:
+        """Start a background task once the limits of its scopes allow it.
+
+        Args:
+            handler: The full name of the event handler.
+            token: The client token the task runs for.
+            coro_fn: Creates the coroutine to run.
+            limits: The limits of the handler.
+
+        Returns:
+            The task, which returns without running the coroutine if it was dropped.
+        """
+        scopes = self._scopes(handler, token, limits)
+        overflow = limits.overflow if limits is not None else OverflowPolicy.QUEUE
+
+        async def _run():
+            task = asyncio.current_task()
+            if task is None:
+                msg = "Background tasks must run in an asyncio task."
+                raise RuntimeError(msg)
+            acquired: list[_Slots] = []
+            try:
+                if overflow == OverflowPolicy.DROP and any(
+                    (slots := self._slots.get(key)) is not None
+                    and not slots.is_available()
+                    for key, _ in scopes
+                ):
+                    console.debug(
+                        f"Dropping background task {handler} for {token}, concurrency limit reached."
+                    )
+                    return
+                if overflow == OverflowPolicy.REPLACE:
+                    self._supersede(scopes)
+                for key, limit in scopes:
+                    slots = self._slots.setdefault(key, _Slots(limit=limit))
+                    acquired.append(slots)
+                    await slots.acquire(task)
+                self._tasks[task].started_at = time.monotonic()
+                await coro_fn()
+            finally:
+                for slots in acquired:
+                    slots.release(task)
+                for key, _ in scopes:
+                    if (
+                        (slots := self._slots.get(key)) is not None
+                        and not slots.holders
+                        and not slots.waiters
+                    ):
+                        del self._slots[key]
+                self._tasks.pop(task, None)
+
+        task = asyncio.create_task(
+            _run(),
+            name=f"reflex_background_task|{handler}|{time.time()}|{token}",
+        )
+        self._tasks[task] = BackgroundTaskInfo(
+            handler=handler,
+            token=token,
+            task=task,
+            submitted_at=time.monotonic(),
+        )
+        return task
+
+    def get_tasks(
+        self, token: str | None = None, handler: str | None = None
+    ) -> list[BackgroundTaskInfo]:
+        """Get the queued and running tasks.
+
+        Args:
+            token: Only include the tasks of this client token.
+            handler: Only include the tasks of this event handler (full name).
+
+        Returns:
+            The matching tasks, in the order they were submitted.
+        """
+        return [
+            info
+            for info in self._tasks.values()
+            if (token is None or info.token == token)
+            and (handler is None or info.handler == handler)
+        ]
+
+    def cancel(self, token: str | None = None, handler: str | None = None) -> int:
+        """Cancel the queued and running tasks.
+
+        Cancellation is cooperative: a task is interrupted at its next await.
+
+        Args:
+            token: Only cancel the tasks of this client token.
+            handler: Only cancel the tasks of this event handler (full name).
+
+        Returns:
+            The number of cancelled tasks.
+        """
+        tasks = self.get_tasks(token=token, handler=handler)
+        for info in tasks:
+            info.task.cancel()
+        return len(tasks)
@@ -42,9 +42,45 @@ class HydrateMiddleware(Middleware):
         setattr(state, constants.CompileVars.IS_HYDRATED, False)
 
         # Get the initial state.
-        delta = await _resolve_delta(state.dict())
+        if app.get_route_state_names(state.router.url.path) is None:
+            delta = await _resolve_delta(state.dict())
+        else:
+            # The states rendered by the page are sent after on_load_internal.
+            delta = await _resolve_delta(state.dict(include_substates=()))
         # since a full dict was captured, clean any dirtiness
         state._clean()
 
         # Return the state update.
         return StateUpdate(delta=delta, events=[])
+
+    async def postprocess(
+        self, app: App, state: BaseState, event: Event, update: StateUpdate
+    ) -> StateUpdate:
+        """Postprocess the event.
+
+        When hydration is scoped to the page, the states rendered by the page are
+        sent along with the update of the on_load_internal event.
+
+        Args:
+            app: The app to apply the middleware to.
+            state: The client state.
+            event: The event to postprocess.
+            update: The current state update.
+
+        Returns:
+            The state update.
+        """
+        if event.name != f"{state.get_name()}.{constants.CompileVars.ON_LOAD_INTERNAL}":
+            return update
+        state_names = app.get_route_state_names(state.router.url.path)
+        if state_names is None:
+            return update
+
+        # The redis state manager only fetched these states for on_load_internal.
+        delta = await _resolve_delta(state.dict(include_substates=state_names))
+        state._clean()
+
+        # Values changed by the event take precedence.
+        for state_name, values in delta.items():
+            update.delta[state_name] = {**values, **update.delta.get(state_name, {})}
+        return update
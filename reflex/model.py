@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import importlib
 import re
 from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
 from contextlib import suppress
 from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from typing_extensions import Self
+
 from reflex.config import get_config
 from reflex.environment import environment
 from reflex.utils import console
@@ -48,6 +54,34 @@ class _ClassThatErrorsOnInit:
         _print_db_not_available(*args, **kwargs)
 
 
+# The async sessions opened by `event_asession` for the event being processed, by url.
+_event_asessions: contextvars.ContextVar[dict[str | None, Any] | None] = (
+    contextvars.ContextVar("_event_asessions", default=None)
+)
+
+
+@contextlib.asynccontextmanager
+async def asession_scope() -> AsyncIterator[None]:
+    """Scope the sessions of `event_asession` to the enclosed block.
+
+    Sessions are only opened on first use and are closed when the block exits.
+
+    Yields:
+        None
+    """
+    sessions: dict[str | None, Any] = {}
+    # Restore by value: the scope may be exited from another context when the
+    # event generator is finalized.
+    previous = _event_asessions.get()
+    _event_asessions.set(sessions)
+    try:
+        yield
+    finally:
+        _event_asessions.set(previous)
+        for session in sessions.values():
+            await session.close()
+
+
 if find_spec("sqlalchemy"):
     import sqlalchemy
     import sqlalchemy.exc
@@ -57,6 +91,40 @@ if find_spec("sqlalchemy"):
     _ENGINE: dict[str, sqlalchemy.engine.Engine] = {}
     _ASYNC_ENGINE: dict[str, sqlalchemy.ext.asyncio.AsyncEngine] = {}
 
+    def _get_pool_stats(pool: sqlalchemy.pool.Pool) -> dict[str, Any]:
+        """Get the connection counters of a pool.
+
+        Args:
+            pool: The connection pool.
+
+        Returns:
+            The counters of a queue pool, otherwise only its status.
+        """
+        if not isinstance(pool, sqlalchemy.pool.QueuePool):
+            return {"status": pool.status()}
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+
+    def get_pool_stats() -> dict[str, dict[str, Any]]:
+        """Get the connection pool counters of the engines created so far.
+
+        Returns:
+            The counters of each engine, by database url (without credentials).
+        """
+        stats = {
+            _safe_db_url_for_logging(url): _get_pool_stats(engine.pool)
+            for url, engine in _ENGINE.items()
+        }
+        stats.update({
+            _safe_db_url_for_logging(url): _get_pool_stats(engine.sync_engine.pool)
+            for url, engine in _ASYNC_ENGINE.items()
+        })
+        return stats
+
     def get_engine_args(url: str | None = None) -> dict[str, Any]:
         """Get the database engine arguments.
 
@@ -248,6 +316,7 @@ else:
     get_engine_args = _print_db_not_available
     get_engine = _print_db_not_available
     get_async_engine = _print_db_not_available
+    get_pool_stats = _print_db_not_available
     sqla_session = _print_db_not_available
     ModelRegistry = _ClassThatErrorsOnInit  # pyright: ignore [reportAssignmentType]
 
@@ -317,6 +386,21 @@ if find_spec("sqlmodel") and find_spec("sqlalchemy") and find_spec("pydantic"):
 
         return {"db": status}
 
+    async def get_async_db_status() -> dict[str, bool]:
+        """Checks the status of the database connection using the async engine.
+
+        Returns:
+            The status of the database connection.
+        """
+        status = True
+        try:
+            async with get_async_engine(None).connect() as connection:
+                await connection.execute(sqlalchemy.text("SELECT 1"))
+        except sqlalchemy.exc.OperationalError:
+            status = False
+
+        return {"db": status}
+
     @serializer
     def serialize_sqlmodel(m: sqlmodel.SQLModel) -> dict[str, Any]:
         """Serialize a SQLModel object to a dictionary.
@@ -595,6 +679,147 @@ if find_spec("sqlmodel") and find_spec("sqlalchemy") and find_spec("pydantic"):
             """
             return sqlmodel.select(cls)
 
+        @classmethod
+        async def aget(
+            cls, id: Any, session: AsyncSession | None = None
+        ) -> Self | None:
+            """Get a row by primary key.
+
+            Args:
+                id: The primary key of the row.
+                session: The async session to use, defaults to `event_asession()`.
+
+            Returns:
+                The row, or None if it does not exist.
+            """
+            async with _use_asession(session) as asession:
+                return await asession.get(cls, id)
+
+        @classmethod
+        def _row_values(cls, rows: Iterable[Model | dict[str, Any]]) -> list[dict]:
+            """Get the column values of rows to write in bulk.
+
+            Args:
+                rows: The model instances or dicts of column values.
+
+            Returns:
+                The column values of each row, without the primary keys left to the database.
+            """
+            primary_keys = cls.__table__.primary_key.columns.keys()  # pyright: ignore [reportAttributeAccessIssue]
+            return [
+                row.model_dump(
+                    exclude={
+                        name for name in primary_keys if getattr(row, name) is None
+                    }
+                )
+                if isinstance(row, Model)
+                else row
+                for row in rows
+            ]
+
+        @classmethod
+        async def abulk_insert(
+            cls,
+            rows: Iterable[Model | dict[str, Any]],
+            session: AsyncSession | None = None,
+        ) -> int:
+            """Insert many rows with a single executemany and commit.
+
+            Args:
+                rows: The model instances or dicts of column values to insert.
+                session: The async session to use, defaults to `event_asession()`.
+
+            Returns:
+                The number of inserted rows.
+            """
+            values = cls._row_values(rows)
+            if not values:
+                return 0
+            async with _use_asession(session) as asession:
+                await asession.exec(sqlalchemy.insert(cls), params=values)
+                await asession.commit()
+            return len(values)
+
+        @classmethod
+        async def aupsert(
+            cls,
+            rows: Iterable[Model | dict[str, Any]],
+            session: AsyncSession | None = None,
+        ) -> int:
+            """Insert many rows, updating the rows whose primary key already exists, and commit.
+
+            Uses a single `INSERT ... ON CONFLICT DO UPDATE` executemany on PostgreSQL
+            and SQLite, and merges the rows one by one on other databases.
+
+            Args:
+                rows: The model instances or dicts of column values to upsert, all with the same columns.
+                session: The async session to use, defaults to `event_asession()`.
+
+            Returns:
+                The number of upserted rows.
+            """
+            values = cls._row_values(rows)
+            if not values:
+                return 0
+            table = cls.__table__  # pyright: ignore [reportAttributeAccessIssue]
+            async with _use_asession(session) as asession:
+                dialect = asession.get_bind().dialect.name
+                if dialect in ("postgresql", "sqlite"):
+                    statement = importlib.import_module(
+                        f"sqlalchemy.dialects.{dialect}"
+                    ).insert(table)
+                    updated = {
+                        name: statement.excluded[name]
+                        for name in values[0]
+                        if name not in table.primary_key.columns
+                    }
+                    await asession.exec(
+                        statement.on_conflict_do_update(
+                            index_elements=list(table.primary_key.columns),
+                            set_=updated,
+                        )
+                        if updated
+                        else statement.on_conflict_do_nothing(),
+                        params=values,
+                    )
+                else:
+                    for row in values:
+                        await asession.merge(cls(**row))
+                await asession.commit()
+            return len(values)
+
+        @classmethod
+        async def aselect_chunks(
+            cls,
+            statement: Any = None,
+            chunk_size: int = 1000,
+            session: AsyncSession | None = None,
+        ) -> AsyncIterator[list[Self]]:
+            """Stream the rows of a select statement in chunks.
+
+            The rows are fetched from a server side cursor where supported, so
+            large results are never loaded in memory at once.
+
+                async for rows in Item.aselect_chunks(Item.select().order_by(Item.id)):
+                    ...
+
+            Args:
+                statement: The select statement, defaults to all the rows of the table.
+                chunk_size: The number of rows per chunk.
+                session: The async session to use, defaults to `event_asession()`.
+
+            Yields:
+                The rows, chunk_size at a time.
+            """
+            if statement is None:
+                statement = cls.select()
+            async with _use_asession(session) as asession:
+                result = await asession.stream_scalars(
+                    statement.execution_options(yield_per=chunk_size)
+                )
+                async for chunk in result.partitions(chunk_size):
+                    yield list(chunk)
+
     ModelRegistry.register(Model)
 
     def session(url: str | None = None) -> sqlmodel.Session:
@@ -633,8 +858,57 @@ if find_spec("sqlmodel") and find_spec("sqlalchemy") and find_spec("pydantic"):
             )
         return _AsyncSessionLocal[url]()
 
+    def event_asession(url: str | None = None) -> AsyncSession:
+        """Get the async session of the event being processed.
+
+        The session is opened from the pool on first use and shared by the rest
+        of the event handler, then closed once the handler is done. Changes must
+        still be committed explicitly.
+
+            session = rx.event_asession()
+            user = await session.get(User, user_id)
+
+        Args:
+            url: The database url.
+
+        Returns:
+            The async database session of the current event.
+
+        Raises:
+            RuntimeError: If no event is being processed.
+        """
+        sessions = _event_asessions.get()
+        if sessions is None:
+            msg = "`event_asession` can only be used while processing an event, use `asession` instead."
+            raise RuntimeError(msg)
+        if url not in sessions:
+            sessions[url] = asession(url)
+        return sessions[url]
+
+    @contextlib.asynccontextmanager
+    async def _use_asession(
+        session: AsyncSession | None,
+    ) -> AsyncIterator[AsyncSession]:
+        """Use the given session, the session of the current event or a new session.
+
+        Args:
+            session: The session passed by the caller.
+
+        Yields:
+            The session to use, closed on exit only if it was created here.
+        """
+        if session is not None:
+            yield session
+        elif _event_asessions.get() is not None:
+            yield event_asession()
+        else:
+            async with asession() as new_session:
+                yield new_session
+
 else:
     get_db_status = _print_db_not_available
+    get_async_db_status = _print_db_not_available
     session = _print_db_not_available
     asession = _print_db_not_available
+    event_asession = _print_db_not_available
     Model = _ClassThatErrorsOnInit  # pyright: ignore [reportAssignmentType]
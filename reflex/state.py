@@ -16,7 +16,7 @@ import sys
 import time
 import typing
 import warnings
-from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from collections.abc import AsyncIterator, Callable, Container, Iterator, Sequence
 from enum import Enum
 from hashlib import md5
 from importlib.util import find_spec
@@ -28,10 +28,14 @@ from typing_extensions import Self
 
 import reflex.istate.dynamic
 from reflex import constants, event
-from reflex.constants.state import FIELD_MARKER
+from reflex.constants.state import COLUMNAR_MARKER, FIELD_MARKER, PATCH_MARKER
 from reflex.environment import PerformanceMode, environment
 from reflex.event import (
+    BACKGROUND_FLUSH_INTERVAL_MARKER,
+    BACKGROUND_TASK_LIMITS_MARKER,
     BACKGROUND_TASK_MARKER,
+    READ_ONLY_EVENT_MARKER,
+    THREADED_EVENT_MARKER,
     Event,
     EventHandler,
     EventSpec,
@@ -40,11 +44,12 @@ from reflex.event import (
 )
 from reflex.istate import HANDLED_PICKLE_ERRORS, debug_failed_pickles
 from reflex.istate.data import RouterData
+from reflex.istate.executor import next_generator_step, run_sync_handler
 from reflex.istate.proxy import ImmutableMutableProxy as ImmutableMutableProxy
 from reflex.istate.proxy import MutableProxy, StateProxy, is_mutable_type
 from reflex.istate.storage import ClientStorageBase
-from reflex.model import Model
-from reflex.utils import console, format, prerequisites, types
+from reflex.model import Model, asession_scope
+from reflex.utils import console, format, metrics, prerequisites, types
 from reflex.utils.exceptions import (
     ComputedVarShadowsBaseVarsError,
     ComputedVarShadowsStateVarError,
@@ -61,6 +66,7 @@ from reflex.utils.exceptions import (
 )
 from reflex.utils.exceptions import ImmutableStateError as ImmutableStateError
 from reflex.utils.exec import is_testing_env
+from reflex.utils.metrics import EventPhase
 from reflex.utils.monitoring import is_pyleak_enabled, monitor_loopblocks
 from reflex.utils.types import _isinstance, is_union, value_inside_optional
 from reflex.vars import Field, VarData, field
@@ -306,6 +312,120 @@ _deserializers = {
     datetime.time: datetime.time.fromisoformat,
 }
 
+
+def _compile_payload_decoder(arg: str, hinted_args: Any) -> Callable[[Any], Any] | None:
+    """Build the converter applied to an event payload value for a handler argument.
+
+    Args:
+        arg: The name of the argument.
+        hinted_args: The type hint of the argument.
+
+    Returns:
+        A function converting the payload value, or None if values are passed as is.
+    """
+    if hinted_args is Any:
+        return None
+    optional = is_union(hinted_args)
+    if optional:
+        hinted_args = value_inside_optional(hinted_args)
+    is_class = isinstance(hinted_args, type) and not types.is_generic_alias(hinted_args)
+
+    dict_converter: Callable[[dict], Any] | None = None
+    if is_class:
+        if issubclass(hinted_args, Model):
+            fields = hinted_args.__fields__
+
+            def dict_converter(value: dict) -> Any:
+                # Remove non-fields from the payload
+                return hinted_args(**{
+                    key: value for key, value in value.items() if key in fields
+                })
+
+        elif dataclasses.is_dataclass(hinted_args):
+
+            def dict_converter(value: dict) -> Any:
+                return hinted_args(**value)
+
+        elif find_spec("pydantic"):
+            from pydantic import BaseModel as BaseModelV2
+            from pydantic.v1 import BaseModel as BaseModelV1
+
+            if issubclass(hinted_args, BaseModelV1):
+                dict_converter = hinted_args.parse_obj
+            elif issubclass(hinted_args, BaseModelV2):
+                dict_converter = hinted_args.model_validate
+
+    list_converter = hinted_args if hinted_args is set or hinted_args is tuple else None
+    is_enum = isinstance(hinted_args, type) and issubclass(hinted_args, Enum)
+    try:
+        deserializer = _deserializers.get(hinted_args)
+    except TypeError:
+        # Unhashable type hints have no deserializer.
+        deserializer = None
+
+    if (
+        dict_converter is None
+        and list_converter is None
+        and not is_enum
+        and deserializer is None
+    ):
+        return None
+
+    def decode(value: Any) -> Any:
+        if optional and value is None:
+            return value
+        if isinstance(value, dict) and is_class:
+            return value if dict_converter is None else dict_converter(value)
+        if isinstance(value, list) and list_converter is not None:
+            return list_converter(value)
+        if is_enum:
+            try:
+                return hinted_args(value)
+            except ValueError:
+                msg = f"Received an invalid enum value ({value}) for {arg} of type {hinted_args}"
+                raise ValueError(msg) from None
+        if isinstance(value, str) and deserializer is not None:
+            try:
+                converted = deserializer(value)
+            except ValueError:
+                msg = f"Received a string value ({value}) for {arg} but expected a {hinted_args}"
+                raise ValueError(msg) from None
+            console.warn(
+                f"Received a string value ({value}) for {arg} but expected a {hinted_args}. A simple conversion was successful."
+            )
+            return converted
+        return value
+
+    return decode
+
+
+def _get_payload_decoders(handler: EventHandler) -> dict[str, Callable[[Any], Any]]:
+    """Get the converters for the payload values of an event handler.
+
+    The converters are built from the handler type hints on first use and cached
+    on the handler, so events do not resolve type hints on every dispatch.
+
+    Args:
+        handler: The event handler.
+
+    Returns:
+        A mapping of argument name to the converter for its payload value.
+    """
+    if (decoders := getattr(handler, "__payload_decoders", None)) is None:
+        try:
+            type_hints = typing.get_type_hints(handler.fn)
+        except Exception:
+            type_hints = {}
+        decoders = {
+            arg: decoder
+            for arg, hinted_args in type_hints.items()
+            if arg != "return"
+            and (decoder := _compile_payload_decoder(arg, hinted_args)) is not None
+        }
+        object.__setattr__(handler, "__payload_decoders", decoders)
+    return decoders
+
+
 all_base_state_classes: dict[str, None] = {}
 
 CLASS_VAR_NAMES = frozenset({
@@ -393,6 +513,17 @@ class BaseState(EvenMoreBasicBaseState):
     # Whether the state has ever been touched since instantiation.
     _was_touched: bool = field(default=False, is_var=False)
 
+    # The persisted vars modified since the state manager last wrote them back.
+    _touched_vars: set[str] = field(default_factory=set, is_var=False)
+
+    # Whether _touched_vars is tracked (only the field layout of the redis state manager uses it).
+    _track_touched_vars: bool = field(default=False, is_var=False)
+
+    # Structural operations applied to base vars since the last delta (None when not patchable).
+    _field_ops: builtins.dict[str, tuple[Any, list[builtins.dict[str, Any]]] | None] = (
+        field(default_factory=builtins.dict, is_var=False)
+    )
+
     # A special event handler for setting base vars.
     setvar: ClassVar[EventHandler]
 
@@ -658,6 +789,14 @@ class BaseState(EvenMoreBasicBaseState):
         newfn.__annotations__ = fn.__annotations__
         if mark := getattr(fn, BACKGROUND_TASK_MARKER, None):
             setattr(newfn, BACKGROUND_TASK_MARKER, mark)
+        if mark := getattr(fn, READ_ONLY_EVENT_MARKER, None):
+            setattr(newfn, READ_ONLY_EVENT_MARKER, mark)
+        if (mark := getattr(fn, THREADED_EVENT_MARKER, None)) is not None:
+            setattr(newfn, THREADED_EVENT_MARKER, mark)
+        if mark := getattr(fn, BACKGROUND_TASK_LIMITS_MARKER, None):
+            setattr(newfn, BACKGROUND_TASK_LIMITS_MARKER, mark)
+        if (mark := getattr(fn, BACKGROUND_FLUSH_INTERVAL_MARKER, None)) is not None:
+            setattr(newfn, BACKGROUND_FLUSH_INTERVAL_MARKER, mark)
         return newfn
 
     @staticmethod
@@ -836,6 +975,37 @@ class BaseState(EvenMoreBasicBaseState):
         # Reset cached schema value
         cls._to_schema.cache_clear()
 
+        # Dependencies of other states may have changed, so drop all cached closures.
+        cls._get_var_dependency_closure.cache_clear()
+
+    @classmethod
+    @functools.cache
+    def _get_var_dependency_closure(cls, var_name: str) -> tuple[tuple[str, str], ...]:
+        """Get every computed var affected, directly or transitively, by a var of this state.
+
+        Args:
+            var_name: The name of the var defined on this state.
+
+        Returns:
+            The (state_full_name, computed_var_name) pairs, nearest dependents first.
+        """
+        root_state = cls.get_root_state()
+        closure: builtins.dict[tuple[str, str], None] = {}
+        pending = [(cls, var_name)]
+        while pending:
+            next_pending = []
+            for state_cls, name in pending:
+                for dependent in state_cls._var_dependencies.get(name, ()):
+                    if dependent in closure:
+                        continue
+                    closure[dependent] = None
+                    next_pending.append((
+                        root_state.get_class_substate(dependent[0]),
+                        dependent[1],
+                    ))
+            pending = next_pending
+        return tuple(closure)
+
     @classmethod
     def _check_overridden_methods(cls):
         """Check for shadow methods and raise error if any.
@@ -1442,6 +1612,8 @@ class BaseState(EvenMoreBasicBaseState):
 
         # Add the var to the dirty list.
         if name in self.base_vars:
+            # A reassigned var cannot be described by the recorded operations.
+            self._field_ops[name] = None
             self.dirty_vars.add(name)
             self._mark_dirty()
 
@@ -1696,10 +1868,13 @@ class BaseState(EvenMoreBasicBaseState):
             msg = "The value of state cannot be None when processing an event."
             raise ValueError(msg)
         handler = substate.event_handlers[name]
+        metrics.resolve_event(event.name)
 
         # For background tasks, proxy the state
         if handler.is_background:
-            substate = StateProxy(substate)
+            substate = StateProxy(
+                substate, flush_interval=handler.background_flush_interval
+            )
 
         return substate, handler
 
@@ -1854,115 +2029,76 @@ class BaseState(EvenMoreBasicBaseState):
         else:
             fn = functools.partial(handler.fn, state)
 
-        try:
-            type_hints = typing.get_type_hints(handler.fn)
-        except Exception:
-            type_hints = {}
+        if (threaded := handler.is_threaded) is None:
+            threaded = environment.REFLEX_THREADED_SYNC_HANDLERS.get()
 
+        payload_decoders = _get_payload_decoders(handler)
         for arg, value in list(payload.items()):
-            hinted_args = type_hints.get(arg, Any)
-            if hinted_args is Any:
-                continue
-            if is_union(hinted_args):
-                if value is None:
-                    continue
-                hinted_args = value_inside_optional(hinted_args)
-            if (
-                isinstance(value, dict)
-                and isinstance(hinted_args, type)
-                and not types.is_generic_alias(hinted_args)  # py3.10
-            ):
-                if issubclass(hinted_args, Model):
-                    # Remove non-fields from the payload
-                    payload[arg] = hinted_args(**{
-                        key: value
-                        for key, value in value.items()
-                        if key in hinted_args.__fields__
-                    })
-                elif dataclasses.is_dataclass(hinted_args):
-                    payload[arg] = hinted_args(**value)
-                elif find_spec("pydantic"):
-                    from pydantic import BaseModel as BaseModelV2
-                    from pydantic.v1 import BaseModel as BaseModelV1
-
-                    if issubclass(hinted_args, BaseModelV1):
-                        payload[arg] = hinted_args.parse_obj(value)
-                    elif issubclass(hinted_args, BaseModelV2):
-                        payload[arg] = hinted_args.model_validate(value)
-            elif isinstance(value, list) and (hinted_args is set or hinted_args is set):
-                payload[arg] = set(value)
-            elif isinstance(value, list) and (
-                hinted_args is tuple or hinted_args is tuple
-            ):
-                payload[arg] = tuple(value)
-            elif isinstance(hinted_args, type) and issubclass(hinted_args, Enum):
-                try:
-                    payload[arg] = hinted_args(value)
-                except ValueError:
-                    msg = f"Received an invalid enum value ({value}) for {arg} of type {hinted_args}"
-                    raise ValueError(msg) from None
-            elif (
-                isinstance(value, str)
-                and (deserializer := _deserializers.get(hinted_args)) is not None
-            ):
-                try:
-                    payload[arg] = deserializer(value)
-                except ValueError:
-                    msg = f"Received a string value ({value}) for {arg} but expected a {hinted_args}"
-                    raise ValueError(msg) from None
-                else:
-                    console.warn(
-                        f"Received a string value ({value}) for {arg} but expected a {hinted_args}. A simple conversion was successful."
-                    )
+            if (decoder := payload_decoders.get(arg)) is not None:
+                payload[arg] = decoder(value)
 
-        # Wrap the function in a try/except block.
-        try:
-            # Handle async functions.
-            if inspect.iscoroutinefunction(fn.func):
-                events = await fn(**payload)
-
-            # Handle regular functions.
-            else:
-                events = fn(**payload)
-            # Handle async generators.
-            if inspect.isasyncgen(events):
-                async for event in events:
-                    yield await state._as_state_update(handler, event, final=False)
-                yield await state._as_state_update(handler, events=None, final=True)
-
-            # Handle regular generators.
-            elif inspect.isgenerator(events):
-                try:
+        # Sessions from `rx.event_asession()` are closed once the handler is done.
+        async with asession_scope():
+            # Wrap the function in a try/except block.
+            try:
+                with metrics.measure(EventPhase.HANDLER):
+                    # Handle async functions.
+                    if inspect.iscoroutinefunction(fn.func):
+                        events = await fn(**payload)
+
+                    # Handle regular functions, in the thread pool when threaded.
+                    elif threaded and not inspect.isasyncgenfunction(fn.func):
+                        events = await run_sync_handler(fn, **payload)
+                    else:
+                        events = fn(**payload)
+                # Handle async generators.
+                if inspect.isasyncgen(events):
                     while True:
-                        yield await state._as_state_update(
-                            handler, next(events), final=False
-                        )
-                except StopIteration as si:
-                    # the "return" value of the generator is not available
-                    # in the loop, we must catch StopIteration to access it
-                    if si.value is not None:
-                        yield await state._as_state_update(
-                            handler, si.value, final=False
-                        )
-                yield await state._as_state_update(handler, events=None, final=True)
-
-            # Handle regular event chains.
-            else:
-                yield await state._as_state_update(handler, events, final=True)
+                        with metrics.measure(EventPhase.HANDLER):
+                            try:
+                                event = await anext(events)
+                            except StopAsyncIteration:
+                                break
+                        yield await state._as_state_update(handler, event, final=False)
+                    yield await state._as_state_update(handler, events=None, final=True)
+
+                # Handle regular generators.
+                elif inspect.isgenerator(events):
+                    while True:
+                        with metrics.measure(EventPhase.HANDLER):
+                            if threaded:
+                                done, event = await run_sync_handler(
+                                    next_generator_step, events
+                                )
+                            else:
+                                done, event = next_generator_step(events)
+                        if done:
+                            break
+                        yield await state._as_state_update(handler, event, final=False)
+                    # the "return" value of the generator is reported with the end
+                    if event is not None:
+                        yield await state._as_state_update(handler, event, final=False)
+                    yield await state._as_state_update(handler, events=None, final=True)
+
+                # Handle regular event chains.
+                else:
+                    yield await state._as_state_update(handler, events, final=True)
 
-        # If an error occurs, throw a window alert.
-        except Exception as ex:
-            telemetry.send_error(ex, context="backend")
+            # If an error occurs, throw a window alert.
+            except Exception as ex:
+                telemetry.send_error(ex, context="backend")
 
-            event_specs = (
-                prerequisites.get_and_validate_app().app.backend_exception_handler(ex)
-            )
+                event_specs = (
+                    prerequisites.get_and_validate_app().app.backend_exception_handler(
+                        ex
+                    )
+                )
 
-            yield await state._as_state_update(
-                handler,
-                event_specs,
-                final=True,
-            )
+                yield await state._as_state_update(
+                    handler,
+                    event_specs,
+                    final=True,
+                )
 
     def _mark_dirty_computed_vars(self) -> None:
         """Mark ComputedVars that need to be recalculated based on dirty_vars."""
@@ -1972,24 +2108,36 @@ class BaseState(EvenMoreBasicBaseState):
         self.dirty_vars.update(self._always_dirty_computed_vars)
 
         dirty_vars = self.dirty_vars
-        while dirty_vars:
-            calc_vars, dirty_vars = dirty_vars, set()
-            for state_name, cvar in self._dirty_computed_vars(from_vars=calc_vars):
-                if state_name == self.get_full_name():
-                    defining_state = self
-                else:
-                    defining_state = self._get_root_state().get_substate(
-                        tuple(state_name.split("."))
-                    )
-                defining_state.dirty_vars.add(cvar)
-                actual_var = defining_state.computed_vars.get(cvar)
-                if actual_var is not None:
-                    actual_var.mark_dirty(instance=defining_state)
-                if defining_state is self:
-                    dirty_vars.add(cvar)
-                else:
-                    # mark dirty where this var is defined
-                    defining_state._mark_dirty()
+        if not self._var_dependencies or not dirty_vars:
+            return
+        get_closure = type(self)._get_var_dependency_closure
+        if len(dirty_vars) == 1:
+            closure = get_closure(next(iter(dirty_vars)))
+        else:
+            closure = builtins.dict.fromkeys(
+                dependent
+                for dirty_var in dirty_vars
+                for dependent in get_closure(dirty_var)
+            )
+        if not closure:
+            return
+
+        full_name = self.get_full_name()
+        other_states: builtins.dict[str, BaseState] = {}
+        for state_name, cvar in closure:
+            if state_name == full_name:
+                defining_state = self
+            elif (defining_state := other_states.get(state_name)) is None:
+                defining_state = other_states[state_name] = (
+                    self._get_root_state().get_substate(tuple(state_name.split(".")))
+                )
+            defining_state.dirty_vars.add(cvar)
+            actual_var = defining_state.computed_vars.get(cvar)
+            if actual_var is not None:
+                actual_var.mark_dirty(instance=defining_state)
+        for defining_state in other_states.values():
+            # mark dirty where this var is defined
+            defining_state._mark_dirty()
 
     def _expired_computed_vars(self) -> set[str]:
         """Determine ComputedVars that need to be recalculated based on the expiration time.
@@ -2030,7 +2178,8 @@ class BaseState(EvenMoreBasicBaseState):
         """
         delta = {}
 
-        self._mark_dirty_computed_vars()
+        with metrics.measure(EventPhase.COMPUTED_VARS):
+            self._mark_dirty_computed_vars()
         frontend_computed_vars: set[str] = {
             name for name, cv in self.computed_vars.items() if not cv._backend
         }
@@ -2041,11 +2190,23 @@ class BaseState(EvenMoreBasicBaseState):
             self.dirty_vars.intersection(frontend_computed_vars)
         )
 
-        subdelta: dict[str, Any] = {
-            prop + FIELD_MARKER: self.get_value(prop)
-            for prop in delta_vars
-            if not types.is_backend_base_variable(prop, type(self))
-        }
+        subdelta: dict[str, Any] = {}
+        for prop in delta_vars:
+            if types.is_backend_base_variable(prop, type(self)):
+                continue
+            if (patch := self._get_field_patch(prop)) is not None:
+                subdelta[prop + PATCH_MARKER] = patch
+                continue
+            value = self.get_value(prop)
+            if (
+                types.is_dataframe(type(value))
+                and environment.REFLEX_COLUMNAR_DATAFRAMES.get()
+            ):
+                from reflex.utils.serializers import serialize_dataframe_columnar
+
+                subdelta[prop + COLUMNAR_MARKER] = serialize_dataframe_columnar(value)
+            else:
+                subdelta[prop + FIELD_MARKER] = value
 
         if len(subdelta) > 0:
             delta[self.get_full_name()] = subdelta
@@ -2058,13 +2219,73 @@ class BaseState(EvenMoreBasicBaseState):
         # Return the delta.
         return delta
 
+    def _record_field_ops(
+        self,
+        name: str,
+        target: Any,
+        get_ops: Callable[[], list[builtins.dict[str, Any]] | None],
+    ):
+        """Record structural operations applied in place to a base var.
+
+        The operations are only kept while every change to the var since the
+        last delta went through the same top-level list or dict, so that
+        replaying them on the frontend yields the current value.
+
+        Args:
+            name: The name of the var.
+            target: The list or dict that is being modified.
+            get_ops: Returns the operations, or None if the change is not representable.
+        """
+        if name not in self._field_ops:
+            if (
+                name in self.dirty_vars
+                or name not in self.base_vars
+                or not environment.REFLEX_STATE_PATCH_DELTAS.get()
+            ):
+                self._field_ops[name] = None
+                return
+            self._field_ops[name] = (target, [])
+        entry = self._field_ops[name]
+        if entry is None:
+            return
+        ops = get_ops() if entry[0] is target else None
+        if ops is None:
+            self._field_ops[name] = None
+        else:
+            entry[1].extend(ops)
+
+    def _get_field_patch(self, name: str) -> list[builtins.dict[str, Any]] | None:
+        """Get the recorded operations for a var if they are much smaller than its value.
+
+        Each operation carries some framing, so patches are only used when they
+        touch fewer than half of the items of the value.
+
+        Args:
+            name: The name of the var.
+
+        Returns:
+            The operations to apply to the previous value, or None to send the full value.
+        """
+        entry = self._field_ops.get(name)
+        if entry is None:
+            return None
+        target, ops = entry
+        if object.__getattribute__(self, name) is not target or 2 * len(ops) >= len(
+            target
+        ):
+            return None
+        return ops
+
     async def _get_resolved_delta(self) -> Delta:
         """Get the delta for the state after resolving all coroutines.
 
         Returns:
             The resolved delta for the state.
         """
-        return await _resolve_delta(self.get_delta())
+        with metrics.measure(EventPhase.GET_DELTA):
+            delta = self.get_delta()
+        with metrics.measure(EventPhase.RESOLVE_DELTA):
+            return await _resolve_delta(delta)
 
     def _mark_dirty(self):
         """Mark the substate and all parent states as dirty."""
@@ -2081,15 +2302,19 @@ class BaseState(EvenMoreBasicBaseState):
         self._mark_dirty_computed_vars()
 
     def _update_was_touched(self):
-        """Update the _was_touched flag based on dirty_vars."""
-        if self.dirty_vars and not self._was_touched:
-            for var in self.dirty_vars:
-                if var in self.base_vars or var in self._backend_vars:
-                    self._was_touched = True
-                    break
-                if var == constants.ROUTER_DATA and self.parent_state is None:
-                    self._was_touched = True
+        """Update the _was_touched flag and _touched_vars based on dirty_vars."""
+        if not self.dirty_vars or (self._was_touched and not self._track_touched_vars):
+            return
+        for var in self.dirty_vars:
+            if (
+                var in self.base_vars
+                or var in self._backend_vars
+                or (var == constants.ROUTER_DATA and self.parent_state is None)
+            ):
+                self._was_touched = True
+                if not self._track_touched_vars:
                     break
+                self._touched_vars.add(var)
 
     def _get_was_touched(self) -> bool:
         """Check current dirty_vars and flag to determine if state instance was modified.
@@ -2119,6 +2344,8 @@ class BaseState(EvenMoreBasicBaseState):
         # Clean this state.
         self.dirty_vars = set()
         self.dirty_substates = set()
+        if self._field_ops:
+            self._field_ops = {}
 
     def get_value(self, key: str) -> Any:
         """Get the value of a field (without proxying).
@@ -2154,13 +2381,18 @@ class BaseState(EvenMoreBasicBaseState):
         raise TypeError(msg)
 
     def dict(
-        self, include_computed: bool = True, initial: bool = False, **kwargs
+        self,
+        include_computed: bool = True,
+        initial: bool = False,
+        include_substates: Container[str] | None = None,
+        **kwargs,
     ) -> dict[str, Any]:
         """Convert the object to a dictionary.
 
         Args:
             include_computed: Whether to include computed vars.
             initial: Whether to get the initial value of computed vars.
+            include_substates: The full names of the substates to include (all loaded substates if None).
             **kwargs: Kwargs to pass to the dict method.
 
         Returns:
@@ -2199,8 +2431,14 @@ class BaseState(EvenMoreBasicBaseState):
             },
         }
         for substate_d in [
-            v.dict(include_computed=include_computed, initial=initial, **kwargs)
+            v.dict(
+                include_computed=include_computed,
+                initial=initial,
+                include_substates=include_substates,
+                **kwargs,
+            )
             for v in self.substates.values()
+            if include_substates is None or v.get_full_name() in include_substates
         ]:
             d.update(substate_d)
 
@@ -2247,6 +2485,9 @@ class BaseState(EvenMoreBasicBaseState):
         state.pop("parent_state", None)
         state.pop("substates", None)
         state.pop("_was_touched", None)
+        state.pop("_touched_vars", None)
+        state.pop("_track_touched_vars", None)
+        state.pop("_field_ops", None)
         # Remove all inherited vars.
         for inherited_var_name in self.inherited_vars:
             state.pop(inherited_var_name, None)
@@ -2262,6 +2503,9 @@ class BaseState(EvenMoreBasicBaseState):
         """
         state["parent_state"] = None
         state["substates"] = {}
+        state["_touched_vars"] = set()
+        state["_track_touched_vars"] = False
+        state["_field_ops"] = {}
         for key, value in state.items():
             object.__setattr__(self, key, value)
 
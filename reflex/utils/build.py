@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import contextlib
 import os
+import struct
 import zipfile
+import zlib
+from collections.abc import Iterable, Iterator
 from pathlib import Path, PosixPath
+from typing import IO
 
 from rich.progress import MofNCompleteColumn, Progress, TimeElapsedColumn
 
 from reflex import constants
 from reflex.config import get_config
+from reflex.environment import environment
 from reflex.utils import console, js_runtimes, path_ops, prerequisites, processes
 from reflex.utils.exec import is_in_app_harness
+from reflex.utils.staticfiles import precompress_directory
 
 
 def set_env_json():
@@ -26,6 +35,198 @@ def set_env_json():
     )
 
 
+# The extensions of the files already compressed, which are stored instead of deflated.
+STORED_EXTENSIONS = frozenset({
+    ".7z",
+    ".avif",
+    ".br",
+    ".bz2",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".mp3",
+    ".mp4",
+    ".ogg",
+    ".png",
+    ".webm",
+    ".webp",
+    ".whl",
+    ".woff",
+    ".woff2",
+    ".xz",
+    ".zip",
+    ".zst",
+})
+
+# The size of the fixed part of a zip local file header.
+_LOCAL_HEADER_SIZE = 30
+
+# The number of members compressed ahead of the one being written, per worker.
+_COMPRESS_AHEAD = 4
+
+# The maximum total size of the files compressed ahead of the member being written.
+_COMPRESS_AHEAD_BYTES = 64 * 1024 * 1024
+
+# Files larger than this are streamed into the zip instead of compressed ahead in memory.
+_STREAM_MIN_SIZE = 8 * 1024 * 1024
+
+# The size of the chunks large files are read and copied in.
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _compress_member(
+    path: Path,
+    arcname: str,
+    compress_type: int,
+    previous: zipfile.ZipInfo | None,
+) -> tuple[zipfile.ZipInfo, bytes | None]:
+    """Compress a file to be written as a zip member.
+
+    Args:
+        path: The file to compress.
+        arcname: The name of the member.
+        compress_type: ZIP_DEFLATED or ZIP_STORED.
+        previous: The member of the previous zip with the same name and compression.
+
+    Returns:
+        The info of the member and its compressed data, or None when the data
+        of the previous member can be reused.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    if zinfo.is_dir():
+        zinfo.CRC = zinfo.compress_size = 0
+        return zinfo, b""
+    data = path.read_bytes()
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    zinfo.compress_type = compress_type
+    if (
+        previous is not None
+        and previous.file_size == zinfo.file_size
+        and previous.CRC == zinfo.CRC
+    ):
+        zinfo.compress_size = previous.compress_size
+        return zinfo, None
+    if compress_type == zipfile.ZIP_DEFLATED:
+        # A raw deflate stream, as written by zipfile.
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+
+def _stream_member(
+    zipf: zipfile.ZipFile,
+    path: Path,
+    arcname: str,
+    compress_type: int,
+    previous: zipfile.ZipInfo | None,
+    previous_fp: IO[bytes] | None,
+) -> bool:
+    """Write a large file to a zip file chunk by chunk.
+
+    Args:
+        zipf: The zip file, open for writing.
+        path: The file to write.
+        arcname: The name of the member.
+        compress_type: ZIP_DEFLATED or ZIP_STORED.
+        previous: The member of the previous zip with the same name and compression.
+        previous_fp: The previous zip file, when previous is set.
+
+    Returns:
+        Whether the data of the previous member was reused.
+    """
+    if previous is not None and previous_fp is not None:
+        zinfo = zipfile.ZipInfo.from_file(path, arcname)
+        zinfo.compress_type = compress_type
+        zinfo.CRC = 0
+        with path.open("rb") as fp:
+            while chunk := fp.read(_CHUNK_SIZE):
+                zinfo.CRC = zlib.crc32(chunk, zinfo.CRC)
+        if previous.file_size == zinfo.file_size and previous.CRC == zinfo.CRC:
+            zinfo.compress_size = previous.compress_size
+            _write_raw_member(zipf, zinfo, _iter_raw_member(previous_fp, previous))
+            return True
+    zipf.write(path, arcname, compress_type=compress_type)
+    return False
+
+
+def _iter_raw_member(fp: IO[bytes], zinfo: zipfile.ZipInfo) -> Iterator[bytes]:
+    """Read the compressed data of a zip member chunk by chunk.
+
+    Args:
+        fp: The zip file.
+        zinfo: The info of the member.
+
+    Yields:
+        The chunks of the compressed data.
+    """
+    fp.seek(zinfo.header_offset)
+    header = fp.read(_LOCAL_HEADER_SIZE)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    fp.seek(name_length + extra_length, os.SEEK_CUR)
+    remaining = zinfo.compress_size
+    while remaining > 0:
+        chunk = fp.read(min(remaining, _CHUNK_SIZE))
+        if not chunk:
+            msg = f"Truncated member {zinfo.filename} in the previous zip."
+            raise zipfile.BadZipFile(msg)
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _write_raw_member(
+    zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, chunks: Iterable[bytes]
+):
+    """Write an already compressed member to a zip file.
+
+    zipfile has no public API to write compressed data as is. This is the only
+    place using its internals: ZipFile.fp, start_dir, filelist, NameToInfo and
+    ZipInfo.FileHeader, which are the same from CPython 3.10 to 3.14 (as used
+    by ZipFile.write and ZipFile.close).
+
+    Args:
+        zipf: The zip file, open for writing.
+        zinfo: The info of the member, with its CRC and sizes.
+        chunks: The compressed data.
+
+    Raises:
+        ValueError: when the zip file is closed.
+    """
+    fp = zipf.fp
+    if fp is None:
+        msg = "Attempt to write to a closed zip file."
+        raise ValueError(msg)
+    zinfo.header_offset = fp.tell()
+    fp.write(zinfo.FileHeader(zip64=None))
+    for chunk in chunks:
+        fp.write(chunk)
+    zipf.start_dir = fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _get_previous_members(target: Path) -> dict[str, zipfile.ZipInfo]:
+    """Get the members of a previous zip which can be reused.
+
+    Args:
+        target: The zip file.
+
+    Returns:
+        The unencrypted members, by name.
+    """
+    try:
+        with zipfile.ZipFile(target) as previous_zip:
+            return {
+                zinfo.filename: zinfo
+                for zinfo in previous_zip.infolist()
+                if not zinfo.flag_bits & 0x1
+            }
+    except (OSError, zipfile.BadZipFile):
+        return {}
+
+
 def _zip(
     *,
     component_name: constants.ComponentName,
@@ -36,9 +237,13 @@ def _zip(
     directory_names_to_exclude: set[str] | None = None,
     files_to_exclude: set[Path] | None = None,
     globs_to_include: list[str] | None = None,
+    store_compressed: bool = True,
+    incremental: bool = False,
 ) -> None:
     """Zip utility function.
 
+    The files are compressed in parallel and written in order.
+
     Args:
         component_name: The name of the component: backend or frontend.
         target: The target zip file.
@@ -48,12 +253,30 @@ def _zip(
         directory_names_to_exclude: The directory names to exclude.
         files_to_exclude: The files to exclude.
         globs_to_include: Apply these globs from the root_directory and always include them in the zip.
+        store_compressed: Whether to store the files with an extension of STORED_EXTENSIONS instead of deflating them.
+        incremental: Whether to reuse the members of the previous target which did not change.
 
     """
     target = Path(target)
     root_directory = Path(root_directory).resolve()
     directory_names_to_exclude = directory_names_to_exclude or set()
     files_to_exclude = files_to_exclude or set()
+    # Resolve the excluded files once, entries are then matched by device and inode.
+    excluded_ids = set()
+    for exclude in files_to_exclude:
+        with contextlib.suppress(OSError):
+            exclude_stat = exclude.stat()
+            excluded_ids.add((exclude_stat.st_dev, exclude_stat.st_ino))
+
+    def _is_excluded(path: Path) -> bool:
+        if not excluded_ids:
+            return False
+        try:
+            path_stat = path.stat()
+        except OSError:
+            return False
+        return (path_stat.st_dev, path_stat.st_ino) in excluded_ids
+
     files_to_zip: list[Path] = []
     # Traverse the root directory in a top-down manner. In this traversal order,
     # we can modify the dirs list in-place to remove directories we don't want to include.
@@ -66,12 +289,8 @@ def _zip(
             subdirectory_name
             for subdirectory_name in subdirectories_names
             if subdirectory_name not in directory_names_to_exclude
-            and not any(
-                (directory_path / subdirectory_name).samefile(exclude)
-                for exclude in files_to_exclude
-                if exclude.exists()
-            )
             and not subdirectory_name.startswith(".")
+            and not _is_excluded(directory_path / subdirectory_name)
             and (
                 not exclude_venv_directories
                 or not _looks_like_venv_directory(directory_path / subdirectory_name)
@@ -87,19 +306,27 @@ def _zip(
         files_to_zip += [
             directory_path / subfile_name
             for subfile_name in subfiles_names
-            if not any(
-                (directory_path / subfile_name).samefile(excluded_file)
-                for excluded_file in files_to_exclude
-                if excluded_file.exists()
-            )
+            if not _is_excluded(directory_path / subfile_name)
         ]
     if globs_to_include:
         for glob in globs_to_include:
             files_to_zip += [
-                file
-                for file in root_directory.glob(glob)
-                if file.name not in files_to_exclude
+                file for file in root_directory.glob(glob) if not _is_excluded(file)
             ]
+    previous_members = _get_previous_members(target) if incremental else {}
+
+    def _get_member(file: Path) -> tuple[str, int, zipfile.ZipInfo | None]:
+        arcname = file.relative_to(root_directory).as_posix()
+        compress_type = (
+            zipfile.ZIP_STORED
+            if store_compressed and file.suffix.lower() in STORED_EXTENSIONS
+            else zipfile.ZIP_DEFLATED
+        )
+        previous = previous_members.get(arcname)
+        if previous is not None and previous.compress_type != compress_type:
+            previous = None
+        return arcname, compress_type, previous
+
     # Create a progress bar for zipping the component.
     progress = Progress(
         *Progress.get_default_columns()[:-1],
@@ -110,11 +337,87 @@ def _zip(
         f"Zipping {component_name.value}:", total=len(files_to_zip)
     )
 
-    with progress, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file in files_to_zip:
-            console.debug(f"{target}: {file}", progress=progress)
-            progress.advance(task)
-            zipf.write(file, Path(file).relative_to(root_directory))
+    # Write to a hidden file first, the previous target is read while writing.
+    partial_target = target.with_name(f".{target.name}.partial")
+    max_workers = os.cpu_count() or 1
+    reused = 0
+    try:
+        with (
+            progress,
+            concurrent.futures.ThreadPoolExecutor(max_workers) as executor,
+            contextlib.ExitStack() as stack,
+            zipfile.ZipFile(partial_target, "w") as zipf,
+        ):
+            previous_fp = (
+                stack.enter_context(target.open("rb")) if previous_members else None
+            )
+            # zlib releases the GIL while compressing, so the files are compressed
+            # by the workers ahead of the member being written. Large files are
+            # streamed when their turn comes, to bound the memory used.
+            pending: collections.deque[
+                tuple[
+                    Path,
+                    int,
+                    concurrent.futures.Future[tuple[zipfile.ZipInfo, bytes | None]]
+                    | None,
+                ]
+            ] = collections.deque()
+            pending_size = 0
+            files = iter(files_to_zip)
+
+            def _fill_pending():
+                nonlocal pending_size
+                while (
+                    pending_size < _COMPRESS_AHEAD_BYTES
+                    and len(pending) < _COMPRESS_AHEAD * max_workers
+                    and (file := next(files, None)) is not None
+                ):
+                    try:
+                        size = file.stat().st_size
+                    except OSError:
+                        size = 0
+                    if size >= _STREAM_MIN_SIZE and file.is_file():
+                        pending.append((file, 0, None))
+                    else:
+                        pending.append((
+                            file,
+                            size,
+                            executor.submit(_compress_member, file, *_get_member(file)),
+                        ))
+                        pending_size += size
+
+            _fill_pending()
+            while pending:
+                file, size, future = pending.popleft()
+                pending_size -= size
+                _fill_pending()
+                if future is None:
+                    arcname, compress_type, previous = _get_member(file)
+                    reused += _stream_member(
+                        zipf, file, arcname, compress_type, previous, previous_fp
+                    )
+                else:
+                    zinfo, data = future.result()
+                    if data is None:
+                        # Only members of the previous target are reused.
+                        _write_raw_member(
+                            zipf,
+                            zinfo,
+                            _iter_raw_member(
+                                previous_fp,  # pyright: ignore[reportArgumentType]
+                                previous_members[zinfo.filename],
+                            ),
+                        )
+                        reused += 1
+                    else:
+                        _write_raw_member(zipf, zinfo, (data,))
+                console.debug(f"{target}: {file}", progress=progress)
+                progress.advance(task)
+        partial_target.replace(target)
+    finally:
+        partial_target.unlink(missing_ok=True)
+    if incremental:
+        console.debug(f"Reused {reused} of {len(files_to_zip)} members of {target}.")
 
 
 def zip_app(
@@ -139,6 +442,8 @@ def zip_app(
         Path(constants.ComponentName.FRONTEND.zip()).resolve(),
         Path(constants.ComponentName.BACKEND.zip()).resolve(),
     }
+    store_compressed = environment.REFLEX_EXPORT_STORE_COMPRESSED.get()
+    incremental = environment.REFLEX_EXPORT_INCREMENTAL.get()
 
     if frontend:
         _zip(
@@ -147,6 +452,8 @@ def zip_app(
             root_directory=prerequisites.get_web_dir() / constants.Dirs.STATIC,
             files_to_exclude=files_to_exclude,
             exclude_venv_directories=False,
+            store_compressed=store_compressed,
+            incremental=incremental,
         )
 
     if backend:
@@ -161,6 +468,8 @@ def zip_app(
             globs_to_include=[
                 str(Path(constants.Dirs.WEB) / constants.Dirs.BACKEND / "*")
             ],
+            store_compressed=store_compressed,
+            incremental=incremental,
         )
 
 
@@ -250,6 +559,10 @@ def build():
                 wdir / constants.Dirs.STATIC / frontend_path / child.name,
             )
 
+    if environment.REFLEX_PRECOMPRESS_STATIC.get():
+        # Write the gzip/brotli variants served in place of the files.
+        precompress_directory(wdir / constants.Dirs.STATIC)
+
 
 def setup_frontend(
     root: Path,
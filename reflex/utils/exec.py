@@ -310,6 +310,27 @@ def should_use_granian():
     return False
 
 
+def should_preload_backend() -> bool:
+    """Whether the production backend workers are forked from a process which loaded the app.
+
+    Returns:
+        True if REFLEX_BACKEND_PRELOAD is set and gunicorn can fork the workers.
+    """
+    if not environment.REFLEX_BACKEND_PRELOAD.get():
+        return False
+    if (
+        constants.IS_WINDOWS
+        or importlib.util.find_spec("uvicorn") is None
+        or importlib.util.find_spec("gunicorn") is None
+    ):
+        console.warn(
+            "REFLEX_BACKEND_PRELOAD requires gunicorn and uvicorn on a POSIX system, "
+            "each backend worker will load the app."
+        )
+        return False
+    return True
+
+
 def get_app_module():
     """Get the app module for the backend.
 
@@ -583,7 +604,9 @@ def run_backend_prod(
 
     environment.REFLEX_MOUNT_FRONTEND_COMPILED_APP.set(mount_frontend_compiled_app)
 
-    if should_use_granian():
+    if should_preload_backend():
+        run_uvicorn_backend_prod(host, port, loglevel, preload=True)
+    elif should_use_granian():
         run_granian_backend_prod(host, port, loglevel)
     else:
         run_uvicorn_backend_prod(host, port, loglevel)
@@ -595,13 +618,16 @@ def _get_backend_workers():
     return processes.get_num_workers()
 
 
-def run_uvicorn_backend_prod(host: str, port: int, loglevel: LogLevel):
+def run_uvicorn_backend_prod(
+    host: str, port: int, loglevel: LogLevel, preload: bool = False
+):
     """Run the backend in production mode using Uvicorn.
 
     Args:
         host: The app host
         port: The app port
         loglevel: The log level.
+        preload: Whether to fork the worker processes from the gunicorn master once it loaded the app.
     """
     import os
     import shlex
@@ -630,7 +656,11 @@ def run_uvicorn_backend_prod(host: str, port: int, loglevel: LogLevel):
             "gunicorn",
             "--preload",
             *("--worker-class", "uvicorn.workers.UvicornH11Worker"),
-            *("--threads", str(_get_backend_workers())),
+            *(
+                ("--workers", str(_get_backend_workers()))
+                if preload
+                else ("--threads", str(_get_backend_workers()))
+            ),
             *("--bind", f"{host}:{port}"),
             *env_args,
             f"{app_module}()",
@@ -640,14 +670,12 @@ def run_uvicorn_backend_prod(host: str, port: int, loglevel: LogLevel):
         *("--log-level", loglevel.value),
     ]
 
-    processes.new_process(
-        command,
-        run=True,
-        show_logs=True,
-        env={
-            environment.REFLEX_SKIP_COMPILE.name: "true"
-        },  # skip compile for prod backend
-    )
+    # Skip compile for prod backend.
+    env = {environment.REFLEX_SKIP_COMPILE.name: "true"}
+    if preload:
+        # Let the app loaded by the gunicorn master prepare for forking the workers.
+        env[environment.REFLEX_BACKEND_PRELOADED.name] = "true"
+    processes.new_process(command, run=True, show_logs=True, env=env)
 
 
 def run_granian_backend_prod(host: str, port: int, loglevel: LogLevel):
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import json
 import os
 import re
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 from reflex import constants
@@ -686,6 +688,49 @@ def json_dumps(obj: Any, **kwargs) -> str:
     return json.dumps(obj, **kwargs)
 
 
+@functools.cache
+def _get_orjson() -> ModuleType | None:
+    """Get the orjson module if it is installed.
+
+    Returns:
+        The orjson module or None.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def json_dumps_bytes(obj: Any, fast: bool = False) -> bytes:
+    """Takes an object and returns it as UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to be serialized.
+        fast: Whether to use orjson when it is installed. Unlike the stdlib encoder,
+            orjson encodes NaN and Infinity as null.
+
+    Returns:
+        The encoded JSON.
+    """
+    if fast and (orjson := _get_orjson()) is not None:
+        from reflex.utils import serializers
+
+        try:
+            return orjson.dumps(
+                obj,
+                default=serializers.serialize,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except (orjson.JSONEncodeError, TypeError):
+            # Fall back to the stdlib encoder, i.e. for integers larger than 64 bits.
+            pass
+    return json_dumps(obj).encode()
+
+
 def collect_form_dict_names(form_dict: dict[str, Any]) -> dict[str, Any]:
     """Collapse keys with consecutive suffixes into a single list value.
 
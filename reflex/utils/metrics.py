@@ -0,0 +1,341 @@
+"""Per event timing of the phases of event processing."""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import contextvars
+import dataclasses
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+
+from reflex.environment import environment
+
+
+class EventPhase(str, Enum):
+    """A phase of processing an event."""
+
+    # The whole event, from receiving it to emitting its last update.
+    EVENT = "event"
+    # Waiting for the lock of the client state.
+    LOCK_WAIT = "lock_wait"
+    # Fetching and deserializing the states from the state manager.
+    STATE_FETCH = "state_fetch"
+    # Running the event handler (and advancing it when it is a generator).
+    HANDLER = "handler"
+    # Marking the computed vars depending on the changed vars as dirty.
+    COMPUTED_VARS = "computed_vars"
+    # Collecting the changed vars of the state tree.
+    GET_DELTA = "get_delta"
+    # Awaiting the coroutines of the delta.
+    RESOLVE_DELTA = "resolve_delta"
+    # Encoding the updates sent as binary frames.
+    SERIALIZE = "serialize"
+    # Sending the updates to the client.
+    EMIT = "emit"
+
+
+# The name of the events whose handler was not found, so that names sent by
+# clients cannot add histograms without bound.
+UNKNOWN_EVENT = "<unknown>"
+
+# The upper bounds of the histogram buckets (s).
+BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class PhaseTiming:
+    """The time spent in a phase of an event."""
+
+    # When the phase was first entered (ns since the epoch).
+    start_ns: int
+
+    # The total time spent in the phase (ns).
+    duration_ns: int
+
+
+@dataclasses.dataclass(frozen=True)
+class EventTiming:
+    """The timings of a processed event, passed to the hooks."""
+
+    # The full name of the event handler.
+    event: str
+
+    # When the event was received (ns since the epoch).
+    start_ns: int
+
+    # The time taken to process the event (ns).
+    duration_ns: int
+
+    # The time spent in each phase, which can overlap (e.g. a handler fetching a state).
+    phases: dict[EventPhase, PhaseTiming]
+
+
+@dataclasses.dataclass
+class Histogram:
+    """A histogram of durations."""
+
+    # The number of observations in each bucket of BUCKETS, followed by the overflow bucket.
+    counts: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(BUCKETS) + 1)
+    )
+
+    # The sum of the observed durations (s).
+    sum: float = 0.0
+
+    # The number of observations.
+    count: int = 0
+
+    def observe(self, seconds: float):
+        """Add a duration to the histogram.
+
+        Args:
+            seconds: The duration.
+        """
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class _EventRecorder:
+    """Accumulates the time spent in each phase of one event."""
+
+    __slots__ = ("active", "event", "perf_start", "phases", "wall_start")
+
+    def __init__(self, event: str | None):
+        self.event = event or UNKNOWN_EVENT
+        self.wall_start = time.time_ns()
+        self.perf_start = time.perf_counter_ns()
+        # The first start (perf counter) and total duration of each phase.
+        self.phases: dict[EventPhase, list[int]] = {}
+        # The phases being measured, so that recursive calls are not counted twice.
+        self.active: set[EventPhase] = set()
+
+
+class _Measure:
+    """Context manager adding its duration to a phase of the current event."""
+
+    __slots__ = ("phase", "recorder", "start")
+
+    def __init__(self, recorder: _EventRecorder, phase: EventPhase):
+        self.recorder = recorder
+        self.phase = phase
+        self.start = 0
+
+    def __enter__(self):
+        self.recorder.active.add(self.phase)
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter_ns() - self.start
+        self.recorder.active.discard(self.phase)
+        if (timing := self.recorder.phases.get(self.phase)) is None:
+            self.recorder.phases[self.phase] = [self.start, duration]
+        else:
+            timing[1] += duration
+
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+_current_recorder: contextvars.ContextVar[_EventRecorder | None] = (
+    contextvars.ContextVar("reflex_event_recorder", default=None)
+)
+
+_histograms: dict[tuple[str, EventPhase], Histogram] = {}
+_histograms_lock = threading.Lock()
+_hooks: list[Callable[[EventTiming], None]] = []
+
+
+def is_enabled() -> bool:
+    """Check whether events are timed.
+
+    Returns:
+        Whether REFLEX_EVENT_METRICS is set or a hook is registered.
+    """
+    return bool(_hooks) or environment.REFLEX_EVENT_METRICS.get()
+
+
+def add_hook(hook: Callable[[EventTiming], None]):
+    """Register a function called with the timings of each processed event.
+
+    Registering a hook enables the timing of events. The hook runs on the event
+    loop, so it should only hand the timings over (e.g. to an OpenTelemetry
+    tracer, creating spans with the recorded start times and durations).
+
+    Args:
+        hook: The function to call.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[EventTiming], None]):
+    """Unregister a hook added with `add_hook`.
+
+    Args:
+        hook: The function to remove.
+    """
+    _hooks.remove(hook)
+
+
+@contextlib.contextmanager
+def event_scope(event: str | None = None):
+    """Time the phases of an event processed within the context.
+
+    Does nothing when timing is disabled. A scope replaces the scope it is
+    entered in, so background tasks are timed as events of their own.
+
+    Args:
+        event: The full name of the event handler, None until it is found (see `resolve_event`).
+
+    Yields:
+        None
+    """
+    if not is_enabled():
+        yield
+        return
+    recorder = _EventRecorder(event)
+    reset_token = _current_recorder.set(recorder)
+    try:
+        yield
+    finally:
+        _current_recorder.reset(reset_token)
+        _record(recorder, time.perf_counter_ns() - recorder.perf_start)
+
+
+def resolve_event(event: str):
+    """Name the event of the current scope, once its handler is found.
+
+    Args:
+        event: The full name of the event handler.
+    """
+    if (recorder := _current_recorder.get()) is not None:
+        recorder.event = event
+
+
+def measure(phase: EventPhase) -> contextlib.AbstractContextManager:
+    """Add the time spent within the context to a phase of the current event.
+
+    Outside of an event scope (or when the phase is already being measured),
+    this returns a shared no-op context manager.
+
+    Args:
+        phase: The phase to measure.
+
+    Returns:
+        The context manager.
+    """
+    recorder = _current_recorder.get()
+    if recorder is None or phase in recorder.active:
+        return _NULL_CONTEXT
+    return _Measure(recorder, phase)
+
+
+def _record(recorder: _EventRecorder, duration_ns: int):
+    """Add the timings of an event to the histograms and pass them to the hooks.
+
+    Args:
+        recorder: The recorder of the event.
+        duration_ns: The time taken to process the event.
+    """
+    phases = {
+        phase: PhaseTiming(
+            start_ns=recorder.wall_start + start - recorder.perf_start,
+            duration_ns=duration,
+        )
+        for phase, (start, duration) in recorder.phases.items()
+    }
+    with _histograms_lock:
+        for phase, seconds in [
+            (EventPhase.EVENT, duration_ns / 1e9),
+            *((phase, timing.duration_ns / 1e9) for phase, timing in phases.items()),
+        ]:
+            key = (recorder.event, phase)
+            if (histogram := _histograms.get(key)) is None:
+                histogram = _histograms[key] = Histogram()
+            histogram.observe(seconds)
+    if _hooks:
+        timing = EventTiming(
+            event=recorder.event,
+            start_ns=recorder.wall_start,
+            duration_ns=duration_ns,
+            phases=phases,
+        )
+        for hook in _hooks:
+            hook(timing)
+
+
+def get_histograms() -> dict[tuple[str, EventPhase], Histogram]:
+    """Get a snapshot of the histograms.
+
+    Returns:
+        A copy of the histogram of each event handler (full name) and phase.
+    """
+    with _histograms_lock:
+        return {
+            key: dataclasses.replace(histogram, counts=list(histogram.counts))
+            for key, histogram in _histograms.items()
+        }
+
+
+def reset():
+    """Clear the histograms."""
+    with _histograms_lock:
+        _histograms.clear()
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The escaped value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def export_prometheus() -> str:
+    """Export the histograms in the Prometheus text format.
+
+    Returns:
+        The exported metrics.
+    """
+    lines = [
+        "# HELP reflex_event_phase_seconds Time spent in each phase of processing an event.",
+        "# TYPE reflex_event_phase_seconds histogram",
+    ]
+    for (event, phase), histogram in sorted(
+        get_histograms().items(), key=lambda item: (item[0][0], item[0][1].value)
+    ):
+        labels = f'event="{_escape_label(event)}",phase="{phase.value}"'
+        cumulative = 0
+        for bound, count in zip(
+            (*map(str, BUCKETS), "+Inf"), histogram.counts, strict=True
+        ):
+            cumulative += count
+            lines.append(
+                f'reflex_event_phase_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines.extend((
+            f"reflex_event_phase_seconds_sum{{{labels}}} {histogram.sum}",
+            f"reflex_event_phase_seconds_count{{{labels}}} {histogram.count}",
+        ))
+    return "\n".join(lines) + "\n"
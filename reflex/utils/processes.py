@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import collections
 import contextlib
+import math
 import os
 import signal
 import socket
@@ -34,16 +35,95 @@ def kill(pid: int):
     os.kill(pid, signal.SIGTERM)
 
 
+# The cgroup v2 unified hierarchy, or the root of the cgroup v1 controllers.
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# cgroup v1 reports a near 2**63 memory limit when the memory is unlimited.
+_CGROUP_V1_UNLIMITED_MEMORY = 2**60
+
+
+def _read_cgroup_file(*parts: str) -> str | None:
+    """Read a file of the cgroup filesystem.
+
+    Args:
+        *parts: The path of the file relative to the cgroup root.
+
+    Returns:
+        The stripped content of the file, or None if it cannot be read.
+    """
+    try:
+        return _CGROUP_ROOT.joinpath(*parts).read_text().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def get_cpu_limit() -> float | None:
+    """Get the CPU quota of the cgroup of the process (e.g. a container limit).
+
+    Returns:
+        The number of CPUs the quota allows, or None if there is no quota.
+    """
+    if (cpu_max := _read_cgroup_file("cpu.max")) is not None:
+        quota, _, period = cpu_max.partition(" ")
+    else:
+        quota = _read_cgroup_file("cpu", "cpu.cfs_quota_us") or "-1"
+        period = _read_cgroup_file("cpu", "cpu.cfs_period_us") or ""
+    try:
+        cpus = int(quota) / int(period)
+    except (ValueError, ZeroDivisionError):
+        # "max" (v2) or -1 (v1) when there is no quota.
+        return None
+    return cpus if cpus > 0 else None
+
+
+def get_memory_limit() -> int | None:
+    """Get the memory limit of the cgroup of the process (e.g. a container limit).
+
+    Returns:
+        The memory limit in bytes, or None if there is no limit.
+    """
+    memory_max = _read_cgroup_file("memory.max") or _read_cgroup_file(
+        "memory", "memory.limit_in_bytes"
+    )
+    try:
+        limit = int(memory_max or "")
+    except ValueError:
+        # "max" (v2) when there is no limit.
+        return None
+    return limit if 0 < limit < _CGROUP_V1_UNLIMITED_MEMORY else None
+
+
+def get_available_cpus() -> float:
+    """Get the number of CPUs the process can use.
+
+    Returns:
+        The CPUs the process is allowed to run on, capped by the cgroup CPU quota.
+    """
+    try:
+        cpus: float = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS and Windows.
+        cpus = os.cpu_count() or 1
+    if (cpu_limit := get_cpu_limit()) is not None:
+        cpus = min(cpus, cpu_limit)
+    return cpus
+
+
 def get_num_workers() -> int:
     """Get the number of backend worker processes.
 
+    Unless set with the `backend_workers` config, the count is two workers per
+    CPU available (within the CPU quota of the container) plus one, capped so
+    that each worker has `backend_worker_memory` MiB within the memory limit.
+
     Raises:
         SystemExit: If unable to connect to Redis.
 
     Returns:
         The number of backend worker processes.
     """
-    if get_config().transport == "polling":
+    config = get_config()
+    if config.transport == "polling":
         return 1
 
     if (redis_client := prerequisites.get_redis_sync()) is None:
@@ -56,7 +136,20 @@ def get_num_workers() -> int:
     except RedisError as re:
         console.error(f"Unable to connect to Redis: {re}")
         raise SystemExit(1) from None
-    return (os.cpu_count() or 1) * 2 + 1
+
+    if config.backend_workers is not None:
+        return config.backend_workers
+
+    cpus = get_available_cpus()
+    workers = math.ceil(cpus) * 2 + 1
+    if (memory_limit := get_memory_limit()) is not None:
+        workers = min(
+            workers, max(1, memory_limit // (config.backend_worker_memory * 1024**2))
+        )
+    console.debug(
+        f"Using {workers} backend workers for {cpus:g} CPUs and a memory limit of {memory_limit} bytes."
+    )
+    return workers
 
 
 def _can_bind_at_port(
@@ -0,0 +1,231 @@
+"""Serving of static files with precompressed variants and cache headers."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import gzip
+import os
+import re
+import stat
+from collections.abc import Callable
+from mimetypes import guess_type
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+from reflex.utils import console
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The content codings of the precompressed variants, by order of preference.
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+# The extensions of the files worth compressing.
+COMPRESSIBLE_EXTENSIONS = frozenset({
+    ".css",
+    ".csv",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".svg",
+    ".txt",
+    ".wasm",
+    ".xml",
+})
+
+# Files smaller than this are not compressed, the framing overhead outweighs the gain.
+MIN_COMPRESS_SIZE = 1024
+
+# The directory of the bundler output, at the root of the built frontend.
+BUNDLER_ASSETS_DIR = "assets"
+
+# Bundler output named after the base64url hash of its content, e.g. index-Bx2k3D4f.js.
+# Eight lowercase letters are far more likely a word than a hash (team-portrait.jpg).
+_HASHED_ASSET = re.compile(r"[^/]+-(?=[a-z-]*[A-Z0-9_])[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _get_compressors() -> dict[str, Callable[[bytes], bytes]]:
+    """Get the available compressors of the precompressed variants.
+
+    Returns:
+        The compress function of each content coding.
+    """
+    compressors: dict[str, Callable[[bytes], bytes]] = {
+        "gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    }
+    if brotli is not None:
+        compressors["br"] = lambda data: brotli.compress(data, quality=11)
+    return compressors
+
+
+def _precompress_file(
+    path: Path, compressors: dict[str, Callable[[bytes], bytes]]
+) -> int:
+    """Write the compressed variants of a file next to it.
+
+    Variants which are not smaller than the file are not written.
+
+    Args:
+        path: The file to compress.
+        compressors: The compress function of each content coding.
+
+    Returns:
+        The number of variants written.
+    """
+    data = path.read_bytes()
+    written = 0
+    for encoding, compress in compressors.items():
+        compressed = compress(data)
+        if len(compressed) < len(data):
+            path.with_name(path.name + ENCODINGS[encoding]).write_bytes(compressed)
+            written += 1
+    return written
+
+
+def precompress_directory(directory: Path) -> int:
+    """Write the gzip (and brotli, if installed) variants of the files of a directory.
+
+    Args:
+        directory: The directory holding the files to serve.
+
+    Returns:
+        The number of variants written.
+    """
+    compressors = _get_compressors()
+    files = [
+        path
+        for path in directory.rglob("*")
+        if path.suffix in COMPRESSIBLE_EXTENSIONS
+        and path.is_file()
+        and path.stat().st_size >= MIN_COMPRESS_SIZE
+    ]
+    # zlib and brotli release the GIL while compressing.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        written = sum(
+            executor.map(lambda path: _precompress_file(path, compressors), files)
+        )
+    console.debug(f"Wrote {written} precompressed variants of {len(files)} files.")
+    return written
+
+
+def get_accepted_encodings(accept_encoding: str) -> set[str]:
+    """Get the content codings accepted by a client.
+
+    Args:
+        accept_encoding: The value of the Accept-Encoding header.
+
+    Returns:
+        The accepted content codings, "*" standing for any coding.
+    """
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        quality = params.strip().lower().removeprefix("q=")
+        if not coding:
+            continue
+        try:
+            if params and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding)
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Static files served with their precompressed variants when the client accepts them.
+
+    The .br and .gz files next to a file are served in its place with the
+    matching Content-Encoding. Content-hashed bundler output is cached as
+    immutable, and HTML files are revalidated on each request. Range requests,
+    ETags and zero-copy sending (`http.response.pathsend`) are handled by the
+    Starlette FileResponse.
+    """
+
+    def _is_hashed_asset(self, path: Path) -> bool:
+        """Check whether a file is content-hashed bundler output.
+
+        Only the files directly in the bundler assets directory of a served
+        directory are considered, not the public files of the app.
+
+        Args:
+            path: The resolved path of the file.
+
+        Returns:
+            Whether the file can be cached as immutable.
+        """
+        return (
+            path.parent.name == BUNDLER_ASSETS_DIR
+            and _HASHED_ASSET.fullmatch(path.name) is not None
+            and os.path.realpath(path.parent.parent)
+            in {os.path.realpath(directory) for directory in self.all_directories}
+        )
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Get the response serving a file.
+
+        Args:
+            full_path: The path of the file.
+            stat_result: The stat of the file.
+            scope: The ASGI scope of the request.
+            status_code: The status code of the response.
+
+        Returns:
+            The response.
+        """
+        request_headers = Headers(scope=scope)
+        path = Path(full_path)
+        headers = {}
+        media_type = guess_type(path.name)[0] or "text/plain"
+
+        if path.suffix in COMPRESSIBLE_EXTENSIONS:
+            accepted = get_accepted_encodings(
+                request_headers.get("accept-encoding", "")
+            )
+            for encoding, suffix in ENCODINGS.items():
+                variant = path.with_name(path.name + suffix)
+                try:
+                    variant_stat = variant.stat()
+                except OSError:
+                    continue
+                if not stat.S_ISREG(variant_stat.st_mode):
+                    continue
+                # Caches must key the response on the encoding once a variant exists.
+                headers["vary"] = "Accept-Encoding"
+                if encoding in accepted or "*" in accepted:
+                    headers["content-encoding"] = encoding
+                    full_path, stat_result = variant, variant_stat
+                    break
+
+        if self._is_hashed_asset(path):
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        elif media_type == "text/html":
+            headers["cache-control"] = "no-cache"
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -2494,6 +2494,7 @@ class ComputedVar(Var[RETURN_TYPE]):
                         objclass.get_full_name(),
                         self._name,
                     ))
+                    objclass._get_var_dependency_closure.cache_clear()
                     return
         msg = (
             "ComputedVar dependencies must be Var instances with a state and "
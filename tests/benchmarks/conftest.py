@@ -1,3 +1,3 @@
-from .fixtures import evaluated_page, unevaluated_page
+from .fixtures import evaluated_page, large_page, unevaluated_page
 
-__all__ = ["evaluated_page", "unevaluated_page"]
+__all__ = ["evaluated_page", "large_page", "unevaluated_page"]
@@ -367,6 +367,30 @@ def _stateful_page():
     )
 
 
+def _nested_card(depth: int):
+    if depth == 0:
+        return rx.text("Leaf", on_click=BenchmarkState.increment)
+    return rx.box(
+        rx.cond(
+            BenchmarkState.counter > depth,
+            _nested_card(depth - 1),
+            rx.text(BenchmarkState.counter),
+        ),
+        _nested_card(depth - 1) if depth < 3 else rx.text("Shallow"),
+        on_click=BenchmarkState.decrement,
+    )
+
+
+def _large_page():
+    # Roughly 10k components with stateful subtrees nested 6 levels deep.
+    return rx.vstack(*[_nested_card(6) for _ in range(166)])
+
+
+@pytest.fixture
+def large_page():
+    return _large_page()
+
+
 @pytest.fixture(params=[_complicated_page, _stateful_page])
 def unevaluated_page(request: pytest.FixtureRequest):
     return request.param
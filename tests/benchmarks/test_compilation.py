@@ -1,7 +1,7 @@
 from pytest_codspeed import BenchmarkFixture
 
 from reflex.compiler.compiler import _compile_page, _compile_stateful_components
-from reflex.components.component import Component
+from reflex.components.component import Component, StatefulComponent
 
 
 def import_templates():
@@ -23,3 +23,21 @@ def test_compile_stateful(evaluated_page: Component, benchmark: BenchmarkFixture
 
 def test_get_all_imports(evaluated_page: Component, benchmark: BenchmarkFixture):
     benchmark(lambda: evaluated_page._get_all_imports())
+
+
+def test_compile_large_page(large_page: Component, benchmark: BenchmarkFixture):
+    import_templates()
+
+    benchmark(lambda: _compile_page(large_page))
+
+
+def test_compile_large_page_stateful(
+    large_page: Component, benchmark: BenchmarkFixture, monkeypatch
+):
+    import_templates()
+    # Shared stateful components are only extracted in prod mode.
+    monkeypatch.setattr("reflex.compiler.compiler.is_prod_mode", lambda: True)
+    page = StatefulComponent.compile_from(large_page)
+    assert page is not None
+
+    benchmark(lambda: _compile_stateful_components([page, page]))
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_codspeed import BenchmarkFixture
+
+from reflex.utils.format import json_dumps
+from reflex.utils.serializers import serialize_dataframe, serialize_dataframe_columnar
+
+
+def _make_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    """Make a dataframe mixing float, int, categorical and string columns.
+
+    Args:
+        rows: The number of rows.
+        columns: The number of columns.
+
+    Returns:
+        The dataframe.
+    """
+    rng = np.random.default_rng(0)
+    data = {}
+    for index in range(columns):
+        kind = index % 4
+        if kind == 0:
+            data[f"c{index}"] = rng.random(rows)
+        elif kind == 1:
+            data[f"c{index}"] = rng.integers(0, 1000, rows)
+        elif kind == 2:
+            data[f"c{index}"] = pd.Categorical(rng.choice(["a", "b", "c"], rows))
+        else:
+            data[f"c{index}"] = [f"s{i}" for i in range(rows)]
+    return pd.DataFrame(data)
+
+
+FRAMES = {
+    "wide": _make_dataframe(rows=100, columns=400),
+    "tall": _make_dataframe(rows=50_000, columns=8),
+}
+
+
+def _serialize_dataframe_numpy(df: pd.DataFrame) -> dict:
+    """The row based serialization before it was done column by column.
+
+    Args:
+        df: The dataframe to serialize.
+
+    Returns:
+        The serialized dataframe.
+    """
+    return {"columns": df.columns.tolist(), "data": df.to_numpy().tolist()}
+
+
+@pytest.mark.parametrize("shape", FRAMES)
+def test_serialize_dataframe_numpy(benchmark: BenchmarkFixture, shape: str):
+    """Row based serialization through an object array."""
+    df = FRAMES[shape]
+    benchmark(lambda: json_dumps(_serialize_dataframe_numpy(df)))
+
+
+@pytest.mark.parametrize("shape", FRAMES)
+def test_serialize_dataframe(benchmark: BenchmarkFixture, shape: str):
+    """Row based serialization, column by column."""
+    df = FRAMES[shape]
+    benchmark(lambda: json_dumps(serialize_dataframe(df)))
+
+
+@pytest.mark.parametrize("shape", FRAMES)
+def test_serialize_dataframe_columnar(benchmark: BenchmarkFixture, shape: str):
+    """Columnar serialization with typed array buffers."""
+    df = FRAMES[shape]
+    benchmark(lambda: json_dumps(serialize_dataframe_columnar(df)))
@@ -0,0 +1,127 @@
+import dataclasses
+import enum
+import typing
+from enum import Enum
+from typing import Any
+
+from pytest_codspeed import BenchmarkFixture
+
+import reflex as rx
+from reflex.model import Model
+from reflex.state import _deserializers, _get_payload_decoders
+from reflex.utils import types
+from reflex.utils.types import is_union, value_inside_optional
+
+
+class Color(enum.Enum):
+    """A color passed by name."""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclasses.dataclass
+class Point:
+    """A point passed as a dict."""
+
+    x: int
+    y: int
+
+
+class PayloadState(rx.State):
+    """State with a handler taking typed arguments."""
+
+    value: str = ""
+
+    @rx.event
+    def on_input(self, text: str, count: int, color: Color, point: Point | None):
+        """Handle an input with typed arguments.
+
+        Args:
+            text: The text.
+            count: The count.
+            color: The color.
+            point: The point.
+        """
+        self.value = f"{text}{count}{color}{point}"
+
+
+PAYLOAD = {
+    "text": "hello",
+    "count": 3,
+    "color": "red",
+    "point": {"x": 1, "y": 2},
+}
+
+
+def _decode_payload_per_event(handler: rx.EventHandler, payload: dict) -> dict:
+    """Convert a payload as BaseState._process_event did before the decoders were cached.
+
+    Args:
+        handler: The event handler.
+        payload: The event payload.
+
+    Returns:
+        The converted payload.
+    """
+    payload = dict(payload)
+    try:
+        type_hints = typing.get_type_hints(handler.fn)
+    except Exception:
+        type_hints = {}
+
+    for arg, value in list(payload.items()):
+        hinted_args = type_hints.get(arg, Any)
+        if hinted_args is Any:
+            continue
+        if is_union(hinted_args):
+            if value is None:
+                continue
+            hinted_args = value_inside_optional(hinted_args)
+        if (
+            isinstance(value, dict)
+            and isinstance(hinted_args, type)
+            and not types.is_generic_alias(hinted_args)
+        ):
+            if issubclass(hinted_args, Model):
+                payload[arg] = hinted_args(**{
+                    key: value
+                    for key, value in value.items()
+                    if key in hinted_args.__fields__
+                })
+            elif dataclasses.is_dataclass(hinted_args):
+                payload[arg] = hinted_args(**value)
+        elif isinstance(value, list) and hinted_args is set:
+            payload[arg] = set(value)
+        elif isinstance(value, list) and hinted_args is tuple:
+            payload[arg] = tuple(value)
+        elif isinstance(hinted_args, type) and issubclass(hinted_args, Enum):
+            payload[arg] = hinted_args(value)
+        elif (
+            isinstance(value, str)
+            and (deserializer := _deserializers.get(hinted_args)) is not None
+        ):
+            payload[arg] = deserializer(value)
+    return payload
+
+
+def test_decode_payload_per_event(benchmark: BenchmarkFixture):
+    """The per-event cost of converting the payload before the decoders were cached."""
+    handler = PayloadState.on_input
+    assert _decode_payload_per_event(handler, PAYLOAD)["point"] == Point(x=1, y=2)
+    benchmark(_decode_payload_per_event, handler, PAYLOAD)
+
+
+def test_decode_payload(benchmark: BenchmarkFixture):
+    """The per-event cost of converting the payload with the cached decoders."""
+    handler = PayloadState.on_input
+
+    def decode():
+        decoders = _get_payload_decoders(handler)
+        return {
+            arg: decoder(value) if (decoder := decoders.get(arg)) else value
+            for arg, value in PAYLOAD.items()
+        }
+
+    assert decode()["point"] == Point(x=1, y=2)
+    benchmark(decode)
@@ -442,3 +442,29 @@ def test_create_document_root_with_meta_viewport():
     assert str(root.children[0].children[2].name) == '"viewport"'  # pyright: ignore [reportAttributeAccessIssue]
     assert str(root.children[0].children[2].content) == '"foo"'  # pyright: ignore [reportAttributeAccessIssue]
     assert str(root.children[0].children[3].char_set) == '"utf-8"'  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def test_get_rendered_state_names():
+    """Test that the states rendered by a component tree are found with their parents."""
+    from reflex.components.base.fragment import Fragment
+    from reflex.components.el.elements.typography import Div
+    from reflex.state import State
+
+    class RenderedState(State):
+        value: int = 0
+
+    class RenderedSubstate(RenderedState):
+        text: str = ""
+
+    class UnusedState(State):
+        other: int = 0
+
+    page = Fragment.create(Div.create(RenderedSubstate.text))
+    state_names = utils.get_rendered_state_names("\n".join(page._get_all_hooks()))
+    assert state_names == {
+        State.get_full_name(),
+        RenderedState.get_full_name(),
+        RenderedSubstate.get_full_name(),
+    }
+    assert UnusedState.get_full_name() not in state_names
+    assert utils.get_rendered_state_names("") == set()
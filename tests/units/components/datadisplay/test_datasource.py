@@ -0,0 +1,151 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from reflex.components.datadisplay.datasource import (
+    DataFrameDataSource,
+    DataQuery,
+    DataSourceState,
+    SequenceDataSource,
+)
+from reflex.state import State
+
+ROWS = [{"name": f"item{i}", "price": i % 3} for i in range(10)]
+
+sequence_source = SequenceDataSource(ROWS, ["name", "price"])
+
+
+class ItemsState(DataSourceState, State):
+    """A state serving the rows of a sequence."""
+
+    overscan = 2
+
+    @classmethod
+    def get_data_source(cls):
+        """Get the data source of the rows.
+
+        Returns:
+            The sequence data source.
+        """
+        return sequence_source
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "source",
+    [sequence_source, DataFrameDataSource(pd.DataFrame(ROWS))],
+)
+async def test_data_source(source):
+    """Test that data sources filter, sort and serve windows of rows.
+
+    Args:
+        source: The data source.
+    """
+    assert source.columns == ["name", "price"]
+    assert await source.count(DataQuery()) == 10
+    assert await source.fetch(DataQuery(), 8, 5) == [["item8", 2], ["item9", 0]]
+
+    query = DataQuery(
+        sort_column="price", sort_descending=True, filters=(("name", "ITEM"),)
+    )
+    assert await source.count(query) == 10
+    assert await source.fetch(query, 0, 4) == [
+        ["item2", 2],
+        ["item5", 2],
+        ["item8", 2],
+        ["item1", 1],
+    ]
+    query = DataQuery(filters=(("price", "1"),))
+    assert await source.count(query) == 3
+    assert await source.fetch(query, 1, 10) == [["item4", 1], ["item7", 1]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "source",
+    [
+        SequenceDataSource(list(ROWS), ["name", "price"]),
+        DataFrameDataSource(pd.DataFrame(ROWS)),
+    ],
+)
+async def test_data_source_cache(source):
+    """Test that the rows of each query are cached until the data changes.
+
+    Args:
+        source: The data source.
+    """
+    ascending = DataQuery(sort_column="price")
+    descending = DataQuery(sort_column="price", sort_descending=True)
+    assert await source.count(ascending) == 10
+    assert await source.count(descending) == 10
+
+    # Both orderings are kept, scrolling does not sort the rows again.
+    with mock.patch.object(source, "_match") as match:
+        await source.fetch(ascending, 0, 2)
+        await source.fetch(descending, 0, 2)
+    match.assert_not_called()
+
+    new_row = {"name": "item10", "price": 5}
+    if isinstance(source, SequenceDataSource):
+        source.rows.append(new_row)  # pyright: ignore [reportAttributeAccessIssue]
+        assert await source.count(ascending) == 10
+        source.invalidate()
+    else:
+        source.df = pd.concat([source.df, pd.DataFrame([new_row])])
+    assert await source.count(ascending) == 11
+    assert await source.fetch(descending, 0, 1) == [["item10", 5]]
+
+
+@pytest.mark.asyncio
+async def test_data_source_state():
+    """Test that the state only fetches the rows around the visible region."""
+    state = ItemsState()  # pyright: ignore [reportCallIssue]
+    await state._refresh()
+    assert state.total_rows == 10
+    assert [row[0] for row in state.window] == ["item0", "item1", "item2", "item3"]
+
+    await ItemsState.load_visible_region.fn(
+        state, {"x": 0, "y": 4, "width": 2, "height": 2}
+    )
+    assert state.window_offset == 2
+    assert [row[0] for row in state.window] == [
+        "item2",
+        "item3",
+        "item4",
+        "item5",
+        "item6",
+        "item7",
+    ]
+
+    # Scrolling within the fetched rows does not fetch them again.
+    with mock.patch.object(SequenceDataSource, "fetch") as fetch:
+        await ItemsState.load_visible_region.fn(
+            state, {"x": 0, "y": 3, "width": 2, "height": 1}
+        )
+    fetch.assert_not_called()
+
+    await ItemsState.set_filter.fn(state, "price", "2")
+    assert state.total_rows == 3
+    assert state.window == [["item2", 2], ["item5", 2], ["item8", 2]]
+
+    # Loading the rows (on mount) reuses the cached rows of the data source.
+    with mock.patch.object(sequence_source, "invalidate") as invalidate:
+        await ItemsState.load_rows.fn(state)
+    invalidate.assert_not_called()
+    assert state.total_rows == 3
+
+    # Refreshing fetches the rows again after the data changed.
+    with mock.patch.object(sequence_source, "invalidate") as invalidate:
+        await ItemsState.refresh.fn(state)
+    invalidate.assert_called_once()
+
+
+def test_data_source_editor():
+    """Test that the data editor reads the window at its offset."""
+    editor = ItemsState.data_editor().children[0]
+    hooks = "".join(editor._get_all_hooks())
+    assert "window_offset" in hooks
+    assert "onVisibleRegionChanged" in str(editor.render()["props"])
+    assert "load_rows" in str(editor.event_triggers["on_mount"])
+    assert "dataOffset" not in str(editor.render()["props"])
@@ -1,12 +1,19 @@
+import base64
+
+import numpy as np
 import pandas as pd
 import pytest
 
 import reflex as rx
 from reflex.components.gridjs.datatable import DataTable
-from reflex.constants.state import FIELD_MARKER
+from reflex.constants.state import COLUMNAR_MARKER, FIELD_MARKER
 from reflex.utils import types
 from reflex.utils.exceptions import UntypedComputedVarError
-from reflex.utils.serializers import serialize, serialize_dataframe
+from reflex.utils.serializers import (
+    serialize,
+    serialize_dataframe,
+    serialize_dataframe_columnar,
+)
 
 
 @pytest.mark.parametrize(
@@ -132,3 +139,80 @@ def test_serialize_dataframe():
     assert value == serialize_dataframe(simple_dataframe)
     assert isinstance(value, dict)
     assert tuple(value) == ("columns", "data")
+
+
+def _decode_columnar(value: dict) -> dict:
+    """Decode a columnar dataframe like the frontend does.
+
+    Args:
+        value: The output of serialize_dataframe_columnar.
+
+    Returns:
+        The dataframe in the format of serialize_dataframe.
+    """
+    dtypes = {"bool": "<u1", "float64": "<f8", "int8": "<i1", "int64": "<i8"}
+
+    def decode(column: dict) -> list:
+        if column["type"] == "list":
+            return column["data"]
+        if column["type"] == "category":
+            return [column["categories"][code] for code in decode(column["codes"])]
+        values = np.frombuffer(
+            base64.b64decode(column["data"]), dtype=dtypes[column["type"]]
+        ).tolist()
+        return [bool(v) for v in values] if column["type"] == "bool" else values
+
+    columns = [decode(column) for column in value["values"]]
+    return {
+        "columns": value["columns"],
+        "data": [list(row) for row in zip(*columns, strict=True)]
+        if columns
+        else [[] for _ in range(value["length"])],
+    }
+
+
+def test_serialize_dataframe_columnar():
+    """The columnar encoding decodes to the row based serialization."""
+    df = pd.DataFrame({
+        "int": [1, 2, 3],
+        "float": [0.5, 1.5, 2.5],
+        "str": ["a", "b", "c"],
+        "category": pd.Categorical(["x", "y", "x"]),
+        "bool": [True, False, True],
+        "big": [2**60, 1, 2],
+    })
+    value = serialize_dataframe_columnar(df)
+    assert [column["type"] for column in value["values"]] == [
+        "float64",
+        "float64",
+        "list",
+        "category",
+        "bool",
+        "list",
+    ]
+    assert value["values"][3]["categories"] == ["x", "y"]
+    assert _decode_columnar(value) == serialize_dataframe(df)
+    assert serialize_dataframe(df)["data"][0] == [1, 0.5, "a", "x", True, 2**60]
+
+
+def test_columnar_dataframe_delta(monkeypatch: pytest.MonkeyPatch):
+    """Dataframe vars are sent columnar in deltas when enabled.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+
+    class ColumnarState(rx.State):
+        df: pd.DataFrame = pd.DataFrame({"a": [1, 2]})
+
+    state = ColumnarState(_reflex_internal_init=True)  # pyright: ignore [reportCallIssue]
+    state.dirty_vars.add("df")
+    delta = state.get_delta()[ColumnarState.get_full_name()]
+    assert "df" + FIELD_MARKER in delta
+
+    monkeypatch.setenv("REFLEX_COLUMNAR_DATAFRAMES", "true")
+    delta = state.get_delta()[ColumnarState.get_full_name()]
+    assert "df" + FIELD_MARKER not in delta
+    assert _decode_columnar(delta["df" + COLUMNAR_MARKER]) == serialize_dataframe(
+        state.df
+    )
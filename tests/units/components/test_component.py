@@ -14,6 +14,7 @@ from reflex.components.component import (
     CustomComponent,
     StatefulComponent,
     custom_component,
+    memoize_tree_aggregates,
 )
 from reflex.components.radix.themes.layout.box import Box
 from reflex.constants import EventTriggers
@@ -1071,6 +1072,46 @@ def test_get_hooks_nested2(component3, component4):
     )
 
 
+def test_memoize_tree_aggregates(component3, component4):
+    """Test that memoized aggregates match the computed ones and are not shared.
+
+    Args:
+        component3: component with hooks defined.
+        component4: component with different hooks defined.
+    """
+    c = component4.create(
+        component3.create(id="first"),
+        rx.cond(EventState.v, component3.create(id="second"), rx.text("no")),
+    )
+    expected = (
+        c._get_all_imports(),
+        c._get_all_hooks(),
+        c._get_all_custom_code(),
+        c._get_all_refs(),
+        c._get_all_dynamic_imports(),
+    )
+    with memoize_tree_aggregates():
+        # The first caller (a cache miss) may merge into its result too.
+        c._get_all_hooks()["first"] = None
+        for _ in range(2):
+            assert (
+                c._get_all_imports(),
+                c._get_all_hooks(),
+                c._get_all_custom_code(),
+                c._get_all_refs(),
+                c._get_all_dynamic_imports(),
+            ) == expected
+        # Callers may merge into the returned aggregates without affecting others.
+        c._get_all_hooks()["extra"] = None
+        c._get_all_imports().setdefault("extra", []).append(ImportVar(tag="x"))
+        assert c._get_all_hooks() == expected[1]
+        assert c._get_all_imports() == expected[0]
+
+    # Outside the block the aggregates are recomputed from the current tree.
+    c.children.append(component3.create(id="third"))
+    assert "ref_third" in c._get_all_refs()
+
+
 @pytest.mark.parametrize("fixture", ["component5", "component6"])
 def test_unsupported_child_components(fixture, request):
     """Test that a value error is raised when an unsupported component (a child component found in the
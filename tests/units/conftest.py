@@ -175,6 +175,17 @@ def tmp_working_dir(tmp_path):
         yield working_dir
 
 
+@pytest.fixture(autouse=True)
+def states_workdir(tmp_path, monkeypatch):
+    """Write the states of the disk state manager under the per-test temp dir.
+
+    Args:
+        tmp_path: pytest tmp_path fixture creates per-test temp dir
+        monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(prerequisites, "get_states_dir", lambda: tmp_path / "states")
+
+
 @pytest.fixture
 def token() -> str:
     """Create a token.
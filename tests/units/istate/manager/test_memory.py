@@ -0,0 +1,110 @@
+"""Tests specific to the in-memory state manager."""
+
+import asyncio
+import time
+
+import pytest
+
+from reflex.istate.manager.memory import StateManagerMemory
+from reflex.state import BaseState, _substate_key
+
+
+class MemoryTestState(BaseState):
+    """A state for memory manager tests."""
+
+    value: str = ""
+
+
+@pytest.mark.asyncio
+async def test_idle_tokens_expire():
+    """Tokens idle for longer than token_expiration are dropped."""
+    state_manager = StateManagerMemory(state=MemoryTestState, token_expiration=60)
+    token = _substate_key("idle", MemoryTestState)
+    async with state_manager.modify_state(token) as state:
+        state.value = "old"
+    assert "idle" in state_manager.states
+    assert "idle" in state_manager._states_locks
+
+    # Pretend the token was last touched long ago.
+    state_manager._token_last_touched["idle"] = time.time() - 120
+    await state_manager.get_state(_substate_key("fresh", MemoryTestState))
+
+    assert "idle" not in state_manager.states
+    assert "idle" not in state_manager._states_locks
+    assert state_manager.expired_count == 1
+    assert (await state_manager.get_state(token)).value == ""
+
+
+@pytest.mark.asyncio
+async def test_max_entries_evicts_least_recently_used():
+    """Only max_entries states are kept, dropping the least recently used."""
+    state_manager = StateManagerMemory(state=MemoryTestState, max_entries=2)
+    for client_token in ("a", "b", "c"):
+        async with state_manager.modify_state(
+            _substate_key(client_token, MemoryTestState)
+        ) as state:
+            state.value = client_token
+        if client_token == "b":
+            # Touch "a" so that "b" becomes the least recently used.
+            await state_manager.get_state(_substate_key("a", MemoryTestState))
+
+    assert list(state_manager.states) == ["a", "c"]
+    assert state_manager.evicted_count == 1
+
+
+@pytest.mark.asyncio
+async def test_max_bytes_budget():
+    """States are evicted when the estimated size exceeds max_bytes."""
+    state_manager = StateManagerMemory(state=MemoryTestState, max_bytes=1)
+    async with state_manager.modify_state(_substate_key("a", MemoryTestState)) as state:
+        state.value = "x" * 100
+    # The state in use is kept even though it exceeds the budget.
+    assert list(state_manager.states) == ["a"]
+    assert state_manager.estimated_bytes > 1
+
+    async with state_manager.modify_state(_substate_key("b", MemoryTestState)):
+        pass
+    assert list(state_manager.states) == ["b"]
+    assert state_manager.evicted_count == 1
+
+
+@pytest.mark.asyncio
+async def test_max_bytes_counts_new_states():
+    """States created by get_state count towards max_bytes before being modified."""
+    state_manager = StateManagerMemory(state=MemoryTestState, max_bytes=10**6)
+    await state_manager.get_state(_substate_key("a", MemoryTestState))
+    size = state_manager.estimated_bytes
+    assert size > 0
+
+    state_manager.max_bytes = 2 * size
+    for client_token in ("b", "c", "d"):
+        await state_manager.get_state(_substate_key(client_token, MemoryTestState))
+    assert list(state_manager.states) == ["c", "d"]
+    assert state_manager.estimated_bytes == 2 * size
+
+
+@pytest.mark.asyncio
+async def test_locked_tokens_are_not_evicted():
+    """A token whose lock is held is never evicted."""
+    state_manager = StateManagerMemory(state=MemoryTestState, max_entries=1)
+    held = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold_lock():
+        async with state_manager.modify_state(
+            _substate_key("held", MemoryTestState)
+        ) as state:
+            state.value = "held"
+            held.set()
+            await release.wait()
+
+    task = asyncio.create_task(hold_lock())
+    await held.wait()
+    async with state_manager.modify_state(_substate_key("other", MemoryTestState)):
+        pass
+    assert "held" in state_manager.states
+    release.set()
+    await task
+    assert (
+        await state_manager.get_state(_substate_key("held", MemoryTestState))
+    ).value == "held"
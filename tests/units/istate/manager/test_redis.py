@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import pickle
 import time
 import uuid
 from collections.abc import AsyncGenerator
@@ -10,7 +11,12 @@ from typing import Any
 import pytest
 import pytest_asyncio
 
-from reflex.istate.manager.redis import StateManagerRedis
+from reflex.istate.codec import COMPRESSED_MAGIC, get_state_codec, persisted_var_names
+from reflex.istate.manager.redis import (
+    FIELD_LAYOUT_SCHEMA_KEY,
+    StateManagerRedis,
+    _fields_key,
+)
 from reflex.state import BaseState, _substate_key
 from tests.units.mock_redis import mock_redis, real_redis
 
@@ -682,3 +688,164 @@ async def test_oplock_hold_oplock_after_cancel(
     # Both increments should be present.
     final_state = await state_manager_redis.get_state(_substate_key(token, root_state))
     assert final_state.count == 2
+
+
+async def test_field_layout_writes_only_modified_vars(
+    state_manager_redis: StateManagerRedis,
+    root_state: type[BaseState],
+    event_log: list[dict[str, Any]],
+):
+    """Test that the field layout writes back only the modified vars.
+
+    Args:
+        state_manager_redis: The StateManagerRedis to test.
+        root_state: The root state class.
+        event_log: The redis event log.
+    """
+    state_manager_redis._oplock_enabled = False
+    state_manager_redis.field_layout = True
+
+    token = str(uuid.uuid4())
+    substate_key = _substate_key(token, root_state)
+    fields_key = _fields_key(substate_key)
+
+    # The first write of a new state persists every var.
+    async with state_manager_redis.modify_state(substate_key) as new_state:
+        new_state.count = 1
+    assert await state_manager_redis.redis.hmget(
+        fields_key, [FIELD_LAYOUT_SCHEMA_KEY, "foo", "count"]
+    ) == [
+        root_state._to_schema().encode(),
+        pickle.dumps("bar"),
+        pickle.dumps(1),
+    ]
+    assert await state_manager_redis.redis.get(substate_key) is None
+
+    # Poison the stored value of foo to prove that it is not rewritten.
+    await state_manager_redis.redis.hset(fields_key, mapping={"foo": pickle.dumps("x")})
+    async with state_manager_redis.modify_state(substate_key) as new_state:
+        assert new_state.foo == "x"
+        assert new_state.count == 1
+        new_state.count += 2
+    assert await state_manager_redis.redis.hmget(fields_key, ["foo", "count"]) == [
+        pickle.dumps("x"),
+        pickle.dumps(3),
+    ]
+
+    # Unmodified states are not written at all.
+    n_hset_events = len([ev for ev in event_log if ev["data"] == b"hset"])
+    async with state_manager_redis.modify_state(substate_key) as new_state:
+        assert new_state.count == 3
+    assert len([ev for ev in event_log if ev["data"] == b"hset"]) == n_hset_events
+
+
+async def test_field_layout_schema_mismatch(
+    state_manager_redis: StateManagerRedis,
+    root_state: type[BaseState],
+):
+    """Test that a hash with an outdated schema is ignored.
+
+    Args:
+        state_manager_redis: The StateManagerRedis to test.
+        root_state: The root state class.
+    """
+    state_manager_redis._oplock_enabled = False
+    state_manager_redis.field_layout = True
+
+    token = str(uuid.uuid4())
+    substate_key = _substate_key(token, root_state)
+    await state_manager_redis.redis.hset(
+        _fields_key(substate_key),
+        mapping={FIELD_LAYOUT_SCHEMA_KEY: "outdated", "count": pickle.dumps(99)},
+    )
+    state = await state_manager_redis.get_state(substate_key)
+    assert state.count == 0
+    assert state._touched_vars == set(persisted_var_names(root_state))
+
+
+async def test_field_layout_corrupt_value(
+    state_manager_redis: StateManagerRedis,
+    root_state: type[BaseState],
+):
+    """Test that a hash with an undecodable value falls back to a fresh state.
+
+    Args:
+        state_manager_redis: The StateManagerRedis to test.
+        root_state: The root state class.
+    """
+    state_manager_redis._oplock_enabled = False
+    state_manager_redis.field_layout = True
+
+    token = str(uuid.uuid4())
+    substate_key = _substate_key(token, root_state)
+    await state_manager_redis.redis.hset(
+        _fields_key(substate_key),
+        mapping={
+            FIELD_LAYOUT_SCHEMA_KEY: root_state._to_schema(),
+            "foo": pickle.dumps("x"),
+            "count": b"not a pickle",
+        },
+    )
+    state = await state_manager_redis.get_state(substate_key)
+    assert state.foo == "bar"
+    assert state.count == 0
+    assert state._touched_vars == set(persisted_var_names(root_state))
+
+
+async def test_field_layout_uses_codec(
+    state_manager_redis: StateManagerRedis,
+    root_state: type[BaseState],
+):
+    """Test that field values are encoded with the configured codec and compression.
+
+    Args:
+        state_manager_redis: The StateManagerRedis to test.
+        root_state: The root state class.
+    """
+    state_manager_redis._oplock_enabled = False
+    state_manager_redis.field_layout = True
+    state_manager_redis.codec = get_state_codec("compact")
+    state_manager_redis.compression_threshold = 16
+
+    token = str(uuid.uuid4())
+    substate_key = _substate_key(token, root_state)
+    async with state_manager_redis.modify_state(substate_key) as new_state:
+        new_state.foo = "x" * 100
+        new_state.count = 5
+    foo, count = await state_manager_redis.redis.hmget(
+        _fields_key(substate_key), ["foo", "count"]
+    )
+    assert foo.startswith(COMPRESSED_MAGIC)
+    assert count == get_state_codec("compact").magic + b"J5"
+
+    async with state_manager_redis.modify_state(substate_key) as new_state:
+        assert new_state.foo == "x" * 100
+        assert new_state.count == 5
+
+
+async def test_modify_states_error_discards_batch(
+    state_manager_redis: StateManagerRedis,
+    root_state: type[BaseState],
+):
+    """Test that a batch is not written when an error is raised in the iterator.
+
+    Args:
+        state_manager_redis: The StateManagerRedis to test.
+        root_state: The root state class.
+    """
+    state_manager_redis._oplock_enabled = False
+    tokens = [_substate_key(str(uuid.uuid4()), root_state) for _ in range(2)]
+
+    states = state_manager_redis.modify_states(tokens)
+    async for _, state in states:
+        state.count = 1
+        break
+    with pytest.raises(RuntimeError, match="boom"):
+        await states.athrow(RuntimeError("boom"))
+
+    for token in tokens:
+        assert (await state_manager_redis.get_state(token)).count == 0
+        assert (
+            await state_manager_redis.redis.get(state_manager_redis._lock_key(token))
+            is None
+        )
@@ -0,0 +1,140 @@
+"""Tests for the state persistence codecs."""
+
+import pickle
+
+import pytest
+
+from reflex.istate.codec import (
+    COMPRESSED_MAGIC,
+    CompactStateCodec,
+    PickleStateCodec,
+    decode_state,
+    encode_state,
+    get_codec_stats,
+    get_state_codec,
+)
+from reflex.state import BaseState
+from reflex.utils.exceptions import StateSchemaMismatchError
+
+
+class CodecState(BaseState):
+    """A state with JSON native and exotic vars."""
+
+    name: str = "codec"
+    rows: list[dict[str, int]] = []
+    pair: tuple[int, int] = (1, 2)
+    tags: set[str] = set()
+    _secret: bytes = b""
+
+
+def _make_state() -> CodecState:
+    state = CodecState(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.rows = [{"a": i} for i in range(100)]
+    state.pair = (3, 4)
+    state.tags = {"x", "y"}
+    state._secret = b"\x00\x01"
+    state._clean()
+    return state
+
+
+@pytest.mark.parametrize("codec_name", ["pickle", "compact"])
+def test_round_trip(codec_name: str):
+    """Both built-in codecs restore every persisted var.
+
+    Args:
+        codec_name: The codec to test.
+    """
+    codec = get_state_codec(codec_name)
+    state = decode_state(encode_state(_make_state(), codec))
+    assert isinstance(state, CodecState)
+    assert state.rows == [{"a": i} for i in range(100)]
+    assert state.pair == (3, 4)
+    assert state.tags == {"x", "y"}
+    assert state._secret == b"\x00\x01"
+    assert not state.dirty_vars
+
+
+def test_compact_codec_pickles_only_exotic_vars():
+    """Vars with JSON native declared types are not pickled."""
+    payload = CompactStateCodec().encode(_make_state())
+    assert payload.startswith(CompactStateCodec.magic)
+    _, _, json_values, pickled_values = pickle.loads(
+        payload[len(CompactStateCodec.magic) :]
+    )
+    assert b'"rows"' in json_values
+    assert set(pickled_values) == {"pair", "tags", "_secret", "router", "router_data"}
+
+
+def test_compact_codec_pickles_mistyped_values():
+    """Values which do not match their JSON native declared type are pickled."""
+    state = _make_state()
+    state.rows = [{"a": {1, 2}}]  # pyright: ignore[reportAttributeAccessIssue]
+    payload = CompactStateCodec().encode(state)
+    _, _, json_values, pickled_values = pickle.loads(
+        payload[len(CompactStateCodec.magic) :]
+    )
+    assert b'"rows"' not in json_values
+    assert b'"name"' in json_values
+    assert "rows" in pickled_values
+    assert decode_state(payload).rows == [{"a": {1, 2}}]
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [{1: 2}],
+        [{"a": (1, 2)}],
+        [{"a": True, "b": 1.5}, {"c": None}],
+    ],
+)
+def test_compact_codec_round_trip_is_lossless(rows: list):
+    """Values which would change in a JSON round trip are pickled instead.
+
+    Args:
+        rows: The value of the dict[str, int] list var.
+    """
+    state = _make_state()
+    state.rows = rows
+    payload = CompactStateCodec().encode(state)
+    decoded = decode_state(payload)
+    assert decoded.rows == rows  # pyright: ignore[reportAttributeAccessIssue]
+    assert [type(key) for row in decoded.rows for key in row] == [  # pyright: ignore[reportAttributeAccessIssue]
+        type(key) for row in rows for key in row
+    ]
+    assert [type(value) for row in decoded.rows for value in row.values()] == [  # pyright: ignore[reportAttributeAccessIssue]
+        type(value) for row in rows for value in row.values()
+    ]
+
+
+def test_compact_codec_schema_mismatch():
+    """A payload with an outdated schema is rejected."""
+    state = _make_state()
+    payload = CompactStateCodec.magic + pickle.dumps((
+        CodecState,
+        "outdated",
+        b"{}",
+        {},
+    ))
+    with pytest.raises(StateSchemaMismatchError):
+        decode_state(payload)
+    # Valid payloads of the other codec are still decoded.
+    assert decode_state(PickleStateCodec().encode(state)).pair == (3, 4)
+
+
+def test_compression_threshold():
+    """Payloads above the threshold are compressed and tracked in the stats."""
+    codec = get_state_codec("compact")
+    encode_count = get_codec_stats()["compact"].encode_count
+    data = encode_state(_make_state(), codec, compression_threshold=10)
+    assert data.startswith(COMPRESSED_MAGIC)
+    assert decode_state(data).rows[-1] == {"a": 99}
+    assert get_codec_stats()["compact"].encode_count == encode_count + 1
+    assert not encode_state(
+        _make_state(), codec, compression_threshold=len(data) * 10
+    ).startswith(COMPRESSED_MAGIC)
+
+
+def test_unknown_codec():
+    """Selecting an unregistered codec fails."""
+    with pytest.raises(ValueError, match="Unknown state codec"):
+        get_state_codec("nope")
@@ -0,0 +1,152 @@
+"""Tests for the background task scheduler."""
+
+import asyncio
+import dataclasses
+
+import pytest
+
+from reflex.istate.scheduler import (
+    BackgroundTaskLimits,
+    BackgroundTaskScheduler,
+    OverflowPolicy,
+)
+
+
+async def _run_tasks(
+    scheduler: BackgroundTaskScheduler,
+    limits: BackgroundTaskLimits,
+    tokens: list[str],
+) -> tuple[list[asyncio.Task], list[str], asyncio.Event]:
+    """Submit one blocking task per token.
+
+    Args:
+        scheduler: The scheduler.
+        limits: The limits of the handler.
+        tokens: The token of each task.
+
+    Returns:
+        The tasks, the log of started tasks and the event releasing them.
+    """
+    started = []
+    release = asyncio.Event()
+
+    def _make_coro(index: int):
+        async def _coro():
+            started.append(index)
+            await release.wait()
+
+        return _coro
+
+    tasks = [
+        scheduler.submit("state.handler", token, _make_coro(index), limits=limits)
+        for index, token in enumerate(tokens)
+    ]
+    # Let the tasks start or queue.
+    for _ in range(3):
+        await asyncio.sleep(0)
+    return tasks, started, release
+
+
+@pytest.mark.asyncio
+async def test_queue_per_token():
+    """Tasks over the per token limit wait for a running task to finish."""
+    scheduler = BackgroundTaskScheduler()
+    limits = BackgroundTaskLimits(max_concurrency_per_token=1)
+    tasks, started, release = await _run_tasks(scheduler, limits, ["a", "a", "b"])
+    assert started == [0, 2]
+    assert [info.started_at is not None for info in scheduler.get_tasks()] == [
+        True,
+        False,
+        True,
+    ]
+    assert len(scheduler.get_tasks(token="a")) == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started == [0, 2, 1]
+    assert not scheduler.get_tasks()
+    assert not scheduler._slots
+
+
+@pytest.mark.asyncio
+async def test_drop():
+    """Tasks over the handler limit are dropped."""
+    scheduler = BackgroundTaskScheduler()
+    limits = BackgroundTaskLimits(max_concurrency=2, overflow=OverflowPolicy.DROP)
+    tasks, started, release = await _run_tasks(scheduler, limits, ["a", "b", "c"])
+    assert started == [0, 1]
+    assert tasks[2].done()
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_replace():
+    """The latest task replaces the running task of the same token."""
+    scheduler = BackgroundTaskScheduler()
+    limits = BackgroundTaskLimits(
+        max_concurrency_per_token=1, overflow=OverflowPolicy.REPLACE
+    )
+    tasks, started, release = await _run_tasks(scheduler, limits, ["a", "a", "a"])
+    assert tasks[0].cancelled()
+    assert tasks[1].cancelled()
+    assert started == [0, 2]
+
+    release.set()
+    await tasks[2]
+    assert not scheduler.get_tasks()
+
+
+@pytest.mark.asyncio
+async def test_replace_cancels_single_task():
+    """A task over both the per token and handler limits replaces only one running task."""
+    scheduler = BackgroundTaskScheduler()
+    queue_limits = BackgroundTaskLimits(max_concurrency=1, max_concurrency_per_token=1)
+    # The second task holds the slot of token "a" while queued for the handler slot.
+    tasks, started, release = await _run_tasks(scheduler, queue_limits, ["b", "a"])
+
+    async def _coro():
+        started.append(2)
+        await release.wait()
+
+    tasks.append(
+        scheduler.submit(
+            "state.handler",
+            "a",
+            _coro,
+            limits=dataclasses.replace(queue_limits, overflow=OverflowPolicy.REPLACE),
+        )
+    )
+    await asyncio.gather(tasks[1], return_exceptions=True)
+    assert tasks[1].cancelled()
+    assert not tasks[0].done()
+    assert started == [0]
+
+    release.set()
+    await asyncio.gather(tasks[0], tasks[2])
+    assert started == [0, 2]
+    assert not scheduler.get_tasks()
+
+
+@pytest.mark.asyncio
+async def test_global_limit_and_cancel():
+    """The global limit applies across handlers, and tasks can be cancelled by token."""
+    scheduler = BackgroundTaskScheduler(max_tasks=1)
+    tasks, started, _ = await _run_tasks(
+        scheduler, BackgroundTaskLimits(), ["a", "b", "a"]
+    )
+    assert started == [0]
+
+    assert scheduler.cancel(token="a") == 2
+    await asyncio.gather(tasks[0], tasks[2], return_exceptions=True)
+    assert tasks[0].cancelled()
+    assert tasks[2].cancelled()
+    # The cancelled task freed the slot for the other token.
+    await asyncio.sleep(0)
+    assert started == [0, 1]
+    assert [info.token for info in scheduler.get_tasks()] == ["b"]
+    assert scheduler.cancel() == 1
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert not scheduler.get_tasks()
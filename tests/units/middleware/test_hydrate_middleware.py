@@ -49,3 +49,62 @@ async def test_preprocess_no_events(hydrate_middleware, event1, mocker: MockerFi
     assert isinstance(update, StateUpdate)
     assert update.delta == state.dict()
     assert not update.events
+
+
+class OtherState(State):
+    """A state that is not rendered by the test page."""
+
+    other: int = 0
+
+
+@pytest.mark.asyncio
+async def test_route_scoped_hydration(hydrate_middleware, event1):
+    """Test that hydration only sends the states rendered by the current page.
+
+    Args:
+        hydrate_middleware: Instance of HydrateMiddleware
+        event1: An Event.
+    """
+    from reflex import constants
+    from reflex.components.base.fragment import Fragment
+    from reflex.istate.data import RouterData
+    from reflex.istate.manager.memory import StateManagerMemory
+
+    from .conftest import create_event
+
+    app = App(_state=State)
+    app._state_manager = StateManagerMemory(state=State)
+    app.add_page(Fragment.create, route="index")
+    app._route_states = {
+        "index": frozenset({State.get_full_name(), TestState.get_full_name()})
+    }
+    state = State(_reflex_internal_init=True)
+    state.router_data = {**event1.router_data, constants.RouteVar.ORIGIN: "/"}
+    state.router = RouterData.from_router_data(state.router_data)
+
+    update = await hydrate_middleware.preprocess(app=app, event=event1, state=state)
+    assert isinstance(update, StateUpdate)
+    assert list(update.delta) == [State.get_full_name()]
+
+    # The states rendered by the page follow the on_load_internal event.
+    on_load_internal = create_event(
+        f"{State.get_name()}.{constants.CompileVars.ON_LOAD_INTERNAL}"
+    )
+    update = await hydrate_middleware.postprocess(
+        app=app,
+        event=on_load_internal,
+        state=state,
+        update=StateUpdate(
+            delta={State.get_full_name(): {"is_hydrated_rx_state_": True}}
+        ),
+    )
+    assert set(update.delta) == {State.get_full_name(), TestState.get_full_name()}
+    assert update.delta[State.get_full_name()]["is_hydrated_rx_state_"] is True
+    assert update.delta[TestState.get_full_name()]["num_rx_state_"] == 0
+    assert OtherState.get_full_name() not in update.delta
+
+    # Without route states the whole state is hydrated at once.
+    app._route_states = {}
+    update = await hydrate_middleware.preprocess(app=app, event=event1, state=state)
+    assert isinstance(update, StateUpdate)
+    assert OtherState.get_full_name() in update.delta
@@ -22,7 +22,7 @@ def mock_redis() -> Redis:
     Returns:
         The mocked redis client.
     """
-    keys: dict[bytes, EncodableT | set[EncodableT]] = {}
+    keys: dict[bytes, EncodableT | set[EncodableT] | dict[bytes, EncodableT]] = {}
     expire_times: dict[bytes, float] = {}
     event_log: list[dict[str, bytes]] = []
     event_log_new_events = asyncio.Event()
@@ -112,6 +112,31 @@ def mock_redis() -> Redis:
             raise TypeError(WRONGTYPE_MESSAGE)
         return len(keyset)
 
+    async def mock_hset(  # noqa: RUF029
+        key: KeyT, mapping: dict[str, EncodableT] | None = None
+    ) -> int:
+        _expire_keys()
+        key = _key_bytes(key)
+        hash_ = keys.setdefault(key, {})
+        if not isinstance(hash_, dict):
+            raise TypeError(WRONGTYPE_MESSAGE)
+        before = len(hash_)
+        for field, value in (mapping or {}).items():
+            hash_[_key_bytes(field)] = (
+                value.encode() if isinstance(value, str) else value
+            )
+        _keyspace_event(key, "hset")
+        return len(hash_) - before
+
+    async def mock_hmget(key: KeyT, fields: list[str]) -> list[Any]:  # noqa: RUF029
+        _expire_keys()
+        hash_ = keys.get(_key_bytes(key))
+        if hash_ is None:
+            return [None] * len(fields)
+        if not isinstance(hash_, dict):
+            raise TypeError(WRONGTYPE_MESSAGE)
+        return [hash_.get(_key_bytes(field)) for field in fields]
+
     async def mock_delete(key: KeyT) -> int:  # noqa: RUF029
         _expire_keys()
         key = _key_bytes(key)
@@ -153,20 +178,32 @@ def mock_redis() -> Redis:
         ):
             results.append(redis_mock.set(key=key, value=value, ex=ex, px=px, nx=nx))
 
+        def hset_pipeline(key: KeyT, mapping: dict[str, EncodableT] | None = None):
+            results.append(redis_mock.hset(key=key, mapping=mapping))
+
+        def hmget_pipeline(key: KeyT, fields: list[str]):
+            results.append(redis_mock.hmget(key, fields))
+
         def sadd_pipeline(key: KeyT, value: EncodableT):
             results.append(redis_mock.sadd(key=key, value=value))
 
         def pexpire_pipeline(key: KeyT, px: int, xx: bool = False):
             results.append(redis_mock.pexpire(key=key, px=px, xx=xx))
 
+        def getdel_pipeline(key: KeyT):
+            results.append(redis_mock.getdel(key))
+
         async def execute():
             _expire_keys()
             return await asyncio.gather(*results)
 
         pipeline_mock.get = get_pipeline
         pipeline_mock.set = set_pipeline
+        pipeline_mock.hset = hset_pipeline
+        pipeline_mock.hmget = hmget_pipeline
         pipeline_mock.sadd = sadd_pipeline
         pipeline_mock.pexpire = pexpire_pipeline
+        pipeline_mock.getdel = getdel_pipeline
         pipeline_mock.execute = execute
 
         return pipeline_mock
@@ -228,6 +265,8 @@ def mock_redis() -> Redis:
     redis_mock = AsyncMock(spec=Redis)
     redis_mock.get = mock_get
     redis_mock.set = mock_set
+    redis_mock.hset = mock_hset
+    redis_mock.hmget = mock_hmget
     redis_mock.delete = mock_delete
     redis_mock.getdel = mock_getdel
     redis_mock.sadd = mock_sadd
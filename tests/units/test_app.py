@@ -1,27 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import functools
 import io
+import json
 import unittest.mock
 import uuid
+import zlib
 from collections.abc import Generator
 from contextlib import nullcontext as does_not_raise
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest_mock import MockerFixture
+from socketio.exceptions import ConnectionRefusedError as SocketConnectionRefusedError
 from starlette.applications import Starlette
-from starlette.datastructures import UploadFile
+from starlette.requests import Request
 from starlette.responses import StreamingResponse
+from starlette.staticfiles import StaticFiles
 
 import reflex as rx
 from reflex import AdminDash, constants
 from reflex.app import (
     App,
     ComponentCallable,
+    EventNamespace,
     default_overlay_component,
     process,
     upload,
@@ -48,7 +55,8 @@ from reflex.state import (
     _substate_key,
 )
 from reflex.style import Style
-from reflex.utils import console, exceptions, format
+from reflex.utils import console, exceptions, format, metrics
+from reflex.utils.metrics import EventPhase
 from reflex.vars.base import computed_var
 
 from .conftest import chdir
@@ -899,6 +907,41 @@ async def test_dict_mutation_detection__plain_list(
             assert result.delta == expected_delta
 
 
+def _upload_request(headers: dict[str, str], files: list[tuple[str, bytes]]) -> Request:
+    """Build a multipart upload request.
+
+    Args:
+        headers: The reflex headers of the request.
+        files: The name and content of each uploaded file.
+
+    Returns:
+        The request.
+    """
+    body = b"".join(
+        b"--boundary\r\n"
+        + f'Content-Disposition: form-data; name="files"; filename="{filename}"\r\n\r\n'.encode()
+        + data
+        + b"\r\n"
+        for filename, data in files
+    )
+    chunks = [body + b"--boundary--\r\n"]
+
+    async def receive():  # noqa: RUF029
+        return {"type": "http.request", "body": chunks.pop(0), "more_body": False}
+
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [
+                (b"content-type", b"multipart/form-data; boundary=boundary"),
+                *((name.encode(), value.encode()) for name, value in headers.items()),
+            ],
+        },
+        receive,
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("state", "delta"),
@@ -929,7 +972,14 @@ async def test_dict_mutation_detection__plain_list(
         ),
     ],
 )
-async def test_upload_file(tmp_path, state, delta, token: str, mocker: MockerFixture):
+async def test_upload_file(
+    tmp_path,
+    state,
+    delta,
+    token: str,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+):
     """Test that file upload works correctly.
 
     Args:
@@ -938,7 +988,9 @@ async def test_upload_file(tmp_path, state, delta, token: str, mocker: MockerFix
         delta: Expected delta
         token: a Token.
         mocker: pytest mocker object.
+        monkeypatch: pytest monkeypatch object.
     """
+    monkeypatch.setenv("REFLEX_UPLOADED_FILES_DIR", str(tmp_path / "uploaded_files"))
     mocker.patch(
         "reflex.state.State.class_subclasses",
         {state if state is FileUploadState else FileStateBase1},
@@ -950,40 +1002,16 @@ async def test_upload_file(tmp_path, state, delta, token: str, mocker: MockerFix
     current_state = await app.state_manager.get_state(_substate_key(token, state))
     data = b"This is binary data"
 
-    # Create a binary IO object and write data to it
-    bio = io.BytesIO()
-    bio.write(data)
-
-    request_mock = unittest.mock.Mock()
-    request_mock.headers = {
-        "reflex-client-token": token,
-        "reflex-event-handler": f"{state.get_full_name()}.multi_handle_upload",
-    }
-
-    file1 = UploadFile(
-        filename="image1.jpg",
-        file=bio,
-    )
-    file2 = UploadFile(
-        filename="image2.jpg",
-        file=bio,
+    request = _upload_request(
+        {
+            "reflex-client-token": token,
+            "reflex-event-handler": f"{state.get_full_name()}.multi_handle_upload",
+        },
+        [("image1.jpg", data), ("image2.jpg", data)],
     )
 
-    async def form():  # noqa: RUF029
-        files_mock = unittest.mock.Mock()
-
-        def getlist(key: str):
-            assert key == "files"
-            return [file1, file2]
-
-        files_mock.getlist = getlist
-
-        return files_mock
-
-    request_mock.form = form
-
     upload_fn = upload(app)
-    streaming_response = await upload_fn(request_mock)
+    streaming_response = await upload_fn(request)
     assert isinstance(streaming_response, StreamingResponse)
     async for state_update in streaming_response.body_iterator:
         assert (
@@ -1009,39 +1037,32 @@ async def test_upload_file(tmp_path, state, delta, token: str, mocker: MockerFix
     "state",
     [FileUploadState, ChildFileUploadState, GrandChildFileUploadState],
 )
-async def test_upload_file_without_annotation(state, tmp_path, token):
+async def test_upload_file_without_annotation(
+    state, tmp_path, token, monkeypatch: pytest.MonkeyPatch
+):
     """Test that an error is thrown when there's no param annotated with rx.UploadFile or list[UploadFile].
 
     Args:
         state: The state class.
         tmp_path: Temporary path.
         token: a Token.
+        monkeypatch: pytest monkeypatch object.
     """
+    monkeypatch.setenv("REFLEX_UPLOADED_FILES_DIR", str(tmp_path / "uploaded_files"))
     state._tmp_path = tmp_path
     app = App(_state=State)
 
-    request_mock = unittest.mock.Mock()
-    request_mock.headers = {
-        "reflex-client-token": token,
-        "reflex-event-handler": f"{state.get_full_name()}.handle_upload2",
-    }
-
-    async def form():  # noqa: RUF029
-        files_mock = unittest.mock.Mock()
-
-        def getlist(key: str):
-            assert key == "files"
-            return [unittest.mock.Mock(filename="image1.jpg")]
-
-        files_mock.getlist = getlist
-
-        return files_mock
-
-    request_mock.form = form
+    request = _upload_request(
+        {
+            "reflex-client-token": token,
+            "reflex-event-handler": f"{state.get_full_name()}.handle_upload2",
+        },
+        [("image1.jpg", b"data")],
+    )
 
     fn = upload(app)
     with pytest.raises(ValueError) as err:
-        await fn(request_mock)
+        await fn(request)
     assert (
         err.value.args[0]
         == f"`{state.get_full_name()}.handle_upload2` handler should have a parameter annotated as list[rx.UploadFile]"
@@ -1055,39 +1076,32 @@ async def test_upload_file_without_annotation(state, tmp_path, token):
     "state",
     [FileUploadState, ChildFileUploadState, GrandChildFileUploadState],
 )
-async def test_upload_file_background(state, tmp_path, token):
+async def test_upload_file_background(
+    state, tmp_path, token, monkeypatch: pytest.MonkeyPatch
+):
     """Test that an error is thrown handler is a background task.
 
     Args:
         state: The state class.
         tmp_path: Temporary path.
         token: a Token.
+        monkeypatch: pytest monkeypatch object.
     """
+    monkeypatch.setenv("REFLEX_UPLOADED_FILES_DIR", str(tmp_path / "uploaded_files"))
     state._tmp_path = tmp_path
     app = App(_state=State)
 
-    request_mock = unittest.mock.Mock()
-    request_mock.headers = {
-        "reflex-client-token": token,
-        "reflex-event-handler": f"{state.get_full_name()}.bg_upload",
-    }
-
-    async def form():  # noqa: RUF029
-        files_mock = unittest.mock.Mock()
-
-        def getlist(key: str):
-            assert key == "files"
-            return [unittest.mock.Mock(filename="image1.jpg")]
-
-        files_mock.getlist = getlist
-
-        return files_mock
-
-    request_mock.form = form
+    request = _upload_request(
+        {
+            "reflex-client-token": token,
+            "reflex-event-handler": f"{state.get_full_name()}.bg_upload",
+        },
+        [("image1.jpg", b"data")],
+    )
 
     fn = upload(app)
     with pytest.raises(TypeError) as err:
-        await fn(request_mock)
+        await fn(request)
     assert (
         err.value.args[0]
         == f"@rx.event(background=True) is not supported for upload handler `{state.get_full_name()}.bg_upload`."
@@ -1096,6 +1110,67 @@ async def test_upload_file_background(state, tmp_path, token):
     await app.state_manager.close()
 
 
+@pytest.mark.asyncio
+async def test_upload_file_too_large(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+):
+    """Test that an upload is rejected as soon as its body is larger than the limit.
+
+    Args:
+        tmp_path: Temporary path.
+        monkeypatch: Pytest monkeypatch object.
+        mocker: pytest mocker object.
+    """
+    import tempfile
+
+    from starlette.exceptions import HTTPException
+
+    monkeypatch.setenv("REFLEX_UPLOAD_MAX_BYTES", "200")
+    monkeypatch.setenv("REFLEX_UPLOAD_SPOOL_MAX_SIZE", "10")
+    monkeypatch.setenv("REFLEX_UPLOADED_FILES_DIR", str(tmp_path))
+    spool = mocker.spy(tempfile, "SpooledTemporaryFile")
+    body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="files"; filename="image1.jpg"\r\n'
+        b"\r\n" + b"x" * 1000 + b"\r\n--boundary--\r\n"
+    )
+    chunks = [body[i : i + 64] for i in range(0, len(body), 64)]
+
+    async def receive():  # noqa: RUF029
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    # Without a Content-Length, the size is checked while the body is parsed.
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"content-type", b"multipart/form-data; boundary=boundary")],
+        },
+        receive,
+    )
+    with pytest.raises(HTTPException) as err:
+        await upload(App(_state=State))(request)
+    assert err.value.status_code == 413
+    assert chunks
+
+    # The file spooled to disk before the body was rejected is closed.
+    spool.assert_called_once_with(max_size=10, dir=tmp_path)
+    assert spool.spy_return._rolled
+    assert spool.spy_return.closed
+
+
+@pytest.mark.asyncio
+async def test_upload_file_iter_chunks():
+    """Test that an uploaded file can be read chunk by chunk."""
+    data = b"x" * 100
+    chunks = [
+        chunk async for chunk in rx.UploadFile(file=io.BytesIO(data)).iter_chunks(30)
+    ]
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert b"".join(chunks) == data
+
+
 class DynamicState(BaseState):
     """State class for testing dynamic route var.
 
@@ -1422,6 +1497,101 @@ async def test_process_events(mocker: MockerFixture, token: str):
     await app.state_manager.close()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("handler", "scoped"),
+    [
+        (constants.CompileVars.HYDRATE, "client_storage"),
+        (constants.CompileVars.ON_LOAD_INTERNAL, "route"),
+        ("set_is_hydrated", None),
+    ],
+)
+async def test_process_route_scoped_states(
+    mocker: MockerFixture, token: str, handler: str, scoped: str | None
+):
+    """Test that hydration events only fetch the states they send when scoped to the page.
+
+    Args:
+        mocker: mocker object.
+        token: a Token.
+        handler: The name of the event handler.
+        scoped: Which states are expected to be fetched, None for all.
+    """
+
+    class _Fetched(Exception):
+        pass
+
+    app = App(_state=State)
+    route_states = frozenset({"reflex___state____state.page_state"})
+    client_storage_states = frozenset({"reflex___state____state.storage_state"})
+    mocker.patch.object(app, "get_route_state_names", return_value=route_states)
+    mocker.patch.object(App, "_client_storage_state_names", new=client_storage_states)
+    modify_state = mocker.patch.object(
+        app.state_manager, "modify_state", side_effect=_Fetched
+    )
+    event = Event(
+        token=token,
+        name=f"{State.get_name()}.{handler}",
+        router_data={"pathname": "/", "query": {}},
+    )
+    with pytest.raises(_Fetched):
+        async for _update in process(app, event, "mock_sid", {}, "127.0.0.1"):
+            pass
+    assert (
+        modify_state.call_args.kwargs.get("states")
+        == {
+            "client_storage": client_storage_states,
+            "route": route_states,
+            None: None,
+        }[scoped]
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_event_metrics(
+    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture, token: str
+):
+    """Test that the phases of an event are timed when the metrics are enabled.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+        mocker: mocker object.
+        token: a Token.
+    """
+    monkeypatch.setenv("REFLEX_EVENT_METRICS", "true")
+    app = App(_state=GenState)
+    mocker.patch.object(app, "_postprocess", AsyncMock())
+    event = Event(
+        token=token,
+        name=f"{GenState.get_name()}.go",
+        payload={"c": 2},
+        router_data={"pathname": "/", "query": {}},
+    )
+    async with app.state_manager.modify_state(event.substate_token) as state:
+        state.router_data = {"simulate": "hydrated"}
+
+    timings = []
+    metrics.add_hook(timings.append)
+    try:
+        with metrics.event_scope():
+            async for _update in process(app, event, "mock_sid", {}, "127.0.0.1"):
+                pass
+    finally:
+        metrics.remove_hook(timings.append)
+        metrics.reset()
+
+    assert len(timings) == 1
+    assert timings[0].event == event.name
+    assert {
+        EventPhase.HANDLER,
+        EventPhase.COMPUTED_VARS,
+        EventPhase.GET_DELTA,
+        EventPhase.RESOLVE_DELTA,
+    } <= set(timings[0].phases)
+
+    await app.state_manager.close()
+
+
 @pytest.mark.parametrize(
     ("state", "overlay_component", "exp_page_child"),
     [
@@ -1663,6 +1833,41 @@ def test_call_app():
     assert isinstance(api, Starlette)
 
 
+def test_call_app_preload(mocker, monkeypatch: pytest.MonkeyPatch):
+    """Test that the loaded app is frozen before the workers are forked.
+
+    Args:
+        mocker: pytest mocker object.
+        monkeypatch: pytest monkeypatch object.
+    """
+    app = App()
+    app._compile = unittest.mock.Mock()
+    freeze = mocker.patch("gc.freeze")
+    app()
+    freeze.assert_not_called()
+
+    # Only the gunicorn process forking the workers freezes the app.
+    monkeypatch.setenv(environment.REFLEX_BACKEND_PRELOAD.name, "true")
+    app()
+    freeze.assert_not_called()
+
+    monkeypatch.setenv(environment.REFLEX_BACKEND_PRELOADED.name, "true")
+    app()
+    freeze.assert_called_once()
+
+
+def test_patch_deltas_require_full_hydration(monkeypatch: pytest.MonkeyPatch):
+    """Test that patch deltas cannot be combined with route scoped hydration.
+
+    Args:
+        monkeypatch: pytest monkeypatch object.
+    """
+    monkeypatch.setenv(environment.REFLEX_STATE_PATCH_DELTAS.name, "true")
+    monkeypatch.setenv(environment.REFLEX_ROUTE_SCOPED_HYDRATION.name, "true")
+    with pytest.raises(exceptions.ConfigError):
+        App()
+
+
 def test_app_with_optional_endpoints():
     from reflex.components.core.upload import Upload
 
@@ -1671,6 +1876,15 @@ def test_app_with_optional_endpoints():
     app._add_optional_endpoints()
     # TODO: verify the availability of the endpoints in app.api
 
+    # Uploaded files are served as they are, without precompressed variants.
+    assert app._api is not None
+    (uploaded_files,) = (
+        route
+        for route in app._api.routes
+        if getattr(route, "name", None) == "uploaded_files"
+    )
+    assert type(uploaded_files.app) is StaticFiles  # pyright: ignore [reportAttributeAccessIssue]
+
 
 def test_app_state_manager():
     app = App(enable_state=False)
@@ -1782,6 +1996,76 @@ def test_app_with_invalid_var_dependencies(compilable_app: tuple[App, Path]):
         app._compile()
 
 
+def test_backend_manifest(
+    compilable_app: tuple[App, Path], mocker, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that backend workers only evaluate the stateful pages of the manifest.
+
+    Args:
+        compilable_app: compilable_app fixture.
+        mocker: pytest mocker object.
+        monkeypatch: pytest monkeypatch object.
+    """
+    app, web_dir = compilable_app
+    mocker.patch("reflex.utils.prerequisites.get_web_dir", return_value=web_dir)
+
+    class ManifestState(BaseState):
+        value: int = 0
+
+        @rx.event
+        def on_load(self):
+            pass
+
+    def index():
+        return rx.text("index")
+
+    def stateful():
+        class StatefulPageState(ManifestState):
+            pass
+
+        return rx.text("stateful")
+
+    def add_pages(app: App):
+        app._state = ManifestState
+        app.add_page(index, on_load=ManifestState.on_load)
+        app.add_page(stateful)
+
+    add_pages(app)
+    app._compile(use_rich=False)
+    manifest_path = web_dir / constants.Dirs.BACKEND / constants.Dirs.BACKEND_MANIFEST
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["reflex_version"] == constants.Reflex.VERSION
+    assert list(manifest["routes"]) == ["index", "stateful"]
+    assert manifest["routes"]["index"][0].endswith("ManifestState.on_load")
+    assert manifest["stateful_pages"] == ["stateful"]
+    assert ManifestState.get_full_name() in manifest["state_schemas"]
+
+    # A backend worker only evaluates the stateful pages, without writing anything.
+    monkeypatch.setenv(environment.REFLEX_SKIP_COMPILE.name, "true")
+    worker = App(theme=None)
+    add_pages(worker)
+    compile_page = mocker.patch.object(worker, "_compile_page")
+    write_marker = mocker.patch.object(worker, "_write_stateful_pages_marker")
+    warn = mocker.patch("reflex.utils.console.warn")
+    worker._compile()
+    compile_page.assert_called_once_with("stateful", save_page=False)
+    write_marker.assert_not_called()
+    warn.assert_not_called()
+
+    # When the pages changed, all pages are evaluated.
+    worker = App(theme=None)
+    add_pages(worker)
+    worker.add_page(rx.text("new"), route="new")
+    compile_page = mocker.patch.object(worker, "_compile_page")
+    worker._compile()
+    assert [c.args[0] for c in compile_page.call_args_list] == [
+        "stateful",
+        "index",
+        "new",
+    ]
+    warn.assert_called_once()
+
+
 # Test custom exception handlers
 
 
@@ -2010,3 +2294,170 @@ async def test_app_modify_state_clean(token: str, substate: bool, frontend: bool
         )
     else:
         assert app._event_namespace.emit_update.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_app_modify_states(token: str):
+    """Test that modify_states emits one delta per modified token.
+
+    Args:
+        token: A client token.
+    """
+
+    class Broadcast(BaseState):
+        count: int = 0
+
+    app = App(_state=Broadcast)
+    app._event_namespace = AsyncMock()
+    tokens = [_substate_key(f"{token}{i}", Broadcast) for i in range(3)]
+
+    async for batch_token, state in app.modify_states(tokens):
+        if batch_token != tokens[1]:
+            state.count = 1
+
+    assert [
+        call.kwargs["token"] for call in app._event_namespace.emit_update.call_args_list
+    ] == [tokens[0], tokens[2]]
+    exp_delta = {Broadcast.get_full_name(): {"count_rx_state_": 1}}
+    for call in app._event_namespace.emit_update.call_args_list:
+        assert call.kwargs["update"].delta == exp_delta
+    for batch_token in tokens:
+        state = await app.state_manager.get_state(batch_token)
+        assert not state.dirty_vars
+
+    # The delta of the last state is emitted when leaving the loop early.
+    app._event_namespace.emit_update.reset_mock()
+    async with contextlib.aclosing(app.modify_states(tokens)) as states:
+        async for _, state in states:
+            state.count = 2
+            break
+    assert [
+        call.kwargs["token"] for call in app._event_namespace.emit_update.call_args_list
+    ] == [tokens[0]]
+    assert (await app.state_manager.get_state(tokens[0])).count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("encoding", "compressed"),
+    [("binary", False), ("deflate", True)],
+)
+async def test_emit_update_binary_frames(
+    monkeypatch: pytest.MonkeyPatch, encoding: str, compressed: bool
+):
+    """Clients advertising an update encoding receive binary frames.
+
+    Args:
+        monkeypatch: Pytest monkeypatch object.
+        encoding: The encoding advertised by the client.
+        compressed: Whether the update is expected to be compressed.
+    """
+    monkeypatch.setenv("REFLEX_SOCKET_BINARY_UPDATES", "true")
+    monkeypatch.setenv("REFLEX_SOCKET_COMPRESSION_THRESHOLD", "100")
+    mock_app = Mock()
+    mock_app.state_manager.modify_state = Mock(
+        return_value=AsyncMock(__aenter__=AsyncMock(return_value=Mock(router_data={})))
+    )
+    namespace = EventNamespace(namespace="/event", app=mock_app)
+    namespace.emit = AsyncMock()
+    await namespace.on_connect(
+        sid="sid1",
+        environ={"QUERY_STRING": f"token=token1&update_encoding={encoding}"},
+    )
+
+    update = StateUpdate(delta={"state": {"rows": list(range(100))}})
+    await namespace.emit_update(update, token="token1")
+
+    event_name, frame = namespace.emit.call_args.args
+    assert event_name == constants.SocketEvent.EVENT_BINARY
+    body = frame[1:]
+    if compressed:
+        assert frame[0] == constants.UpdateEncoding.FLAG_DEFLATE
+        body = zlib.decompress(body)
+    else:
+        assert frame[0] == constants.UpdateEncoding.FLAG_RAW
+    assert json.loads(body) == {
+        "delta": {"state": {"rows": list(range(100))}},
+        "events": [],
+        "final": True,
+    }
+    assert namespace.emit_stats.messages == 1
+    assert namespace.emit_stats.bytes_before == len(body)
+    assert namespace.emit_stats.bytes_after == len(frame)
+
+    # Clients without an advertised encoding get plain updates.
+    await namespace.on_connect(sid="sid2", environ={"QUERY_STRING": "token=token2"})
+    await namespace.emit_update(update, token="token2")
+    assert namespace.emit.call_args.args == (constants.SocketEvent.EVENT, update)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backpressure", ["queue", "reject"])
+async def test_event_namespace_worker_limits(mocker, backpressure: str):
+    """Connections over the worker cap are refused, and events over it queued or rejected.
+
+    Args:
+        mocker: pytest mocker object.
+        backpressure: What to do with events over the cap.
+    """
+    conf = rx.Config(
+        app_name="testing",
+        max_connections_per_worker=1,
+        max_events_per_worker=1,
+        event_backpressure=backpressure,
+    )
+    mocker.patch("reflex.config._get_config", return_value=conf)
+    mock_app = Mock()
+    mock_app.state_manager.modify_state = Mock(
+        return_value=AsyncMock(__aenter__=AsyncMock(return_value=Mock(router_data={})))
+    )
+    mock_app.sio.get_environ.return_value = {"asgi.scope": {"headers": []}}
+    namespace = EventNamespace(namespace="/event", app=mock_app)
+    namespace.emit = AsyncMock()
+    namespace.emit_update = AsyncMock()
+
+    await namespace.on_connect(sid="sid1", environ={"QUERY_STRING": "token=token1"})
+    with pytest.raises(SocketConnectionRefusedError):
+        await namespace.on_connect(sid="sid2", environ={"QUERY_STRING": "token=token2"})
+    if task := namespace.on_disconnect("sid1"):
+        await task
+    await namespace.on_connect(sid="sid2", environ={"QUERY_STRING": "token=token2"})
+    if task := namespace.on_disconnect("sid2"):
+        await task
+
+    # A connection failing to link its token does not keep its slot.
+    link_token_to_sid = namespace.link_token_to_sid
+    namespace.link_token_to_sid = AsyncMock(side_effect=RuntimeError("redis down"))
+    with pytest.raises(RuntimeError):
+        await namespace.on_connect(sid="sid3", environ={"QUERY_STRING": "token=token3"})
+    assert not namespace._connected_sids
+    namespace.link_token_to_sid = link_token_to_sid
+    await namespace.on_connect(sid="sid2", environ={"QUERY_STRING": "token=token2"})
+
+    release = asyncio.Event()
+    processed = []
+
+    async def _process_event(event, sid, headers, client_ip):
+        processed.append(event.name)
+        await release.wait()
+
+    namespace._process_event = _process_event
+    first = asyncio.create_task(
+        namespace.on_event("sid2", {"token": "token2", "name": "state.first"})
+    )
+    second = asyncio.create_task(
+        namespace.on_event("sid2", {"token": "token2", "name": "state.second"})
+    )
+    await asyncio.sleep(0.01)
+    assert processed == ["state.first"]
+    if backpressure == "reject":
+        assert second.done()
+        update = namespace.emit_update.call_args.kwargs["update"]
+        assert update.final
+        assert not update.delta
+    release.set()
+    await asyncio.gather(first, second)
+    if backpressure == "queue":
+        assert processed == ["state.first", "state.second"]
+    else:
+        assert processed == ["state.first"]
@@ -638,6 +638,46 @@ def test_event_decorator_backward_compatibility():
     assert hasattr(bg_handler.fn, BACKGROUND_TASK_MARKER)  # pyright: ignore [reportAttributeAccessIssue]
 
 
+def test_event_decorator_background_task_limits():
+    """Test that concurrency limits are stored for background tasks only."""
+    from reflex.istate.scheduler import BackgroundTaskLimits, OverflowPolicy
+
+    class MyTestState(BaseState):
+        @event(background=True, max_concurrency_per_token=1, overflow="replace")
+        async def handle_search(self):
+            pass
+
+        @event(background=True)
+        async def handle_unlimited(self):
+            pass
+
+    assert MyTestState.handle_search.background_task_limits == BackgroundTaskLimits(
+        max_concurrency_per_token=1, overflow=OverflowPolicy.REPLACE
+    )
+    assert MyTestState.handle_unlimited.background_task_limits is None
+
+    def handle_sync(self):
+        pass
+
+    with pytest.raises(ValueError, match="only supported for background tasks"):
+        event(max_concurrency=2)(handle_sync)
+
+
+@pytest.mark.parametrize("flush_interval", [0, -1, 10])
+def test_event_decorator_invalid_flush_interval(flush_interval: float):
+    """Test that the flush interval must be positive and less than the lock expiration.
+
+    Args:
+        flush_interval: The flush interval to validate (s).
+    """
+
+    async def handle_batched(self):
+        pass
+
+    with pytest.raises(ValueError, match="flush interval"):
+        event(background=True, flush_interval=flush_interval)(handle_batched)
+
+
 def test_event_var_in_rx_cond():
     """Test that EventVar and EventChainVar cannot be used in rx.cond()."""
     from reflex.components.core.cond import cond as rx_cond
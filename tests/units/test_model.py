@@ -239,3 +239,80 @@ async def test_upcast_event_handler_arg(handler, payload):
         assert update.delta == {
             UpcastStateWithSqlAlchemy.get_full_name(): {"passed" + FIELD_MARKER: True}
         }
+
+
+class AsyncHelperItem(Model, table=True):
+    """A table for testing the async helpers."""
+
+    name: str
+    count: int = 0
+
+
+@pytest.mark.asyncio
+async def test_async_model_helpers(tmp_path: Path):
+    """Test the async get, bulk insert, upsert and chunked select helpers.
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite+aiosqlite:///{tmp_path / 'reflex.db'}"
+    async with reflex.model.get_async_engine(url).begin() as connection:
+        await connection.run_sync(AsyncHelperItem.__table__.create)  # pyright: ignore [reportAttributeAccessIssue]
+
+    async with reflex.model.asession(url) as session:
+        assert (
+            await AsyncHelperItem.abulk_insert(
+                [AsyncHelperItem(name=f"item{i}") for i in range(5)], session=session
+            )
+            == 5
+        )
+        assert await AsyncHelperItem.abulk_insert([], session=session) == 0
+        assert await AsyncHelperItem.aupsert(
+            [
+                {"id": 1, "name": "first", "count": 1},
+                AsyncHelperItem(id=6, name="sixth"),
+            ],
+            session=session,
+        )
+        session.expire_all()
+
+        item = await AsyncHelperItem.aget(1, session=session)
+        assert item is not None
+        assert (item.name, item.count) == ("first", 1)
+        assert await AsyncHelperItem.aget(7, session=session) is None
+
+        chunks = [
+            [item.id for item in chunk]
+            async for chunk in AsyncHelperItem.aselect_chunks(
+                AsyncHelperItem.select().order_by(AsyncHelperItem.id),  # pyright: ignore [reportArgumentType]
+                chunk_size=4,
+                session=session,
+            )
+        ]
+        assert chunks == [[1, 2, 3, 4], [5, 6]]
+
+    stats = reflex.model.get_pool_stats()[url]
+    assert stats["checked_out"] == 0
+
+
+@pytest.mark.asyncio
+async def test_event_asession(tmp_path: Path):
+    """Test that the event session is shared within a scope and closed after it.
+
+    Args:
+        tmp_path: A temporary directory.
+    """
+    import sqlalchemy
+
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite+aiosqlite:///{tmp_path / 'reflex.db'}"
+    with pytest.raises(RuntimeError):
+        reflex.model.event_asession(url)
+
+    async with reflex.model.asession_scope():
+        session = reflex.model.event_asession(url)
+        assert reflex.model.event_asession(url) is session
+        await session.exec(sqlalchemy.text("SELECT 1"))
+        assert session.in_transaction()
+    assert not session.in_transaction()
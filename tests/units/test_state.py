@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import copy
 import dataclasses
 import datetime
@@ -9,25 +10,30 @@ import json
 import os
 import sys
 import threading
+import typing
 from collections.abc import AsyncGenerator, Callable
 from textwrap import dedent
 from typing import Any, ClassVar
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 import pytest_asyncio
 from plotly.graph_objects import Figure
 from pytest_mock import MockerFixture
+from starlette.applications import Starlette
 
 import reflex as rx
 import reflex.config
 from reflex import constants
 from reflex.app import App
+from reflex.app_mixins.lifespan import LifespanMixin
 from reflex.base import Base
 from reflex.constants import CompileVars, RouteVar, SocketEvent
-from reflex.constants.state import FIELD_MARKER
+from reflex.constants.state import FIELD_MARKER, PATCH_MARKER
 from reflex.environment import environment
 from reflex.event import Event, EventHandler
+from reflex.istate import executor
+from reflex.istate.executor import get_sync_handler_stats
 from reflex.istate.manager import StateManager
 from reflex.istate.manager.disk import StateManagerDisk
 from reflex.istate.manager.memory import StateManagerMemory
@@ -1224,6 +1230,42 @@ def test_conditional_computed_vars():
     }
 
 
+def test_var_dependency_closure():
+    """Test that dirty propagation follows chains of computed vars across states."""
+
+    class ChainState(BaseState):
+        v: int = 1
+
+        @computed_var
+        def double(self) -> int:
+            return self.v * 2
+
+    class ChainChildState(ChainState):
+        @computed_var
+        def quadruple(self) -> int:
+            return self.double * 2
+
+        @computed_var
+        def octuple(self) -> int:
+            return self.quadruple * 2
+
+    assert ChainState._get_var_dependency_closure("v") == (
+        (ChainState.get_full_name(), "double"),
+        (ChainChildState.get_full_name(), "quadruple"),
+        (ChainChildState.get_full_name(), "octuple"),
+    )
+
+    cs = ChainState(_reflex_internal_init=True)
+    child = cs.substates[ChainChildState.get_name()]
+    assert child.octuple == 8
+    cs._clean()
+    cs.v = 2
+    assert child.octuple == 16
+    assert cs.dirty_vars == {"v", "double"}
+    assert child.dirty_vars == {"quadruple", "octuple"}
+    assert ChainChildState.get_name() in cs.dirty_substates
+
+
 def test_event_handlers_convert_to_fns(test_state, child_state):
     """Test that when the state is initialized, event handlers are converted to fns.
 
@@ -1801,6 +1843,61 @@ async def test_state_manager_contend(
         assert not state_manager._states_locks[token].locked()
 
 
+@pytest.mark.asyncio
+async def test_state_manager_modify_states(state_manager: StateManager, token: str):
+    """Test modifying and fetching the states of many tokens in batches.
+
+    Args:
+        state_manager: A state manager instance.
+        token: A token.
+    """
+    tokens = [_substate_key(f"{token}{i}", state_manager.state) for i in range(5)]
+
+    # Hold one lock elsewhere so that token is modified after its batch.
+    contended = asyncio.Event()
+
+    async def _hold_lock():
+        async with state_manager.modify_state(tokens[1]) as state:
+            state.num2 = 1
+            contended.set()
+            await asyncio.sleep(0.05)
+
+    holder = asyncio.create_task(_hold_lock())
+    await contended.wait()
+    seen = []
+    async for batch_token, state in state_manager.modify_states(
+        [*tokens, tokens[0]], batch_size=2
+    ):
+        seen.append(batch_token)
+        state.num1 = tokens.index(batch_token)
+    await holder
+    assert sorted(seen) == sorted(tokens)
+
+    # Leaving the loop early keeps the modifications, including the current one.
+    async with contextlib.aclosing(
+        state_manager.modify_states(tokens, batch_size=2)
+    ) as states:
+        async for batch_token, state in states:
+            state.num1 += 10
+            if batch_token == tokens[3]:
+                break
+
+    if environment.REFLEX_OPLOCK_ENABLED.get():
+        await state_manager.close()
+
+    fetched = {
+        batch_token: state.num1
+        async for batch_token, state in state_manager.get_states(tokens, batch_size=2)
+    }
+    assert fetched == {
+        batch_token: i + 10 if i < 4 else i for i, batch_token in enumerate(tokens)
+    }
+    assert (await state_manager.get_state(tokens[1])).num2 == 1
+    if isinstance(state_manager, StateManagerRedis):
+        for batch_token in tokens:
+            assert (await state_manager.redis.get(f"{batch_token}_lock")) is None
+
+
 @pytest_asyncio.fixture(loop_scope="function", scope="function")
 async def state_manager_redis() -> AsyncGenerator[StateManager, None]:
     """Instance of state manager for redis only.
@@ -2289,6 +2386,27 @@ class BackgroundTaskState(BaseState):
         async with self:
             self.order.append("reset")
 
+    @rx.event(background=True, flush_interval=5)
+    async def background_task_batched(self):
+        """A background task whose changes are flushed together."""
+        for i in range(5):
+            async with self:
+                self.order.append(f"batched:{i}")
+
+    @rx.event(background=True, flush_interval=5)
+    async def background_task_batched_error(self):
+        """A background task raising while changes are held by the flush interval.
+
+        Raises:
+            RuntimeError: always, from the last context.
+        """
+        for i in range(2):
+            async with self:
+                self.order.append(f"batched:{i}")
+        async with self:
+            msg = "The last context failed."
+            raise RuntimeError(msg)
+
     @rx.event(background=True)
     async def background_task_generator(self):
         """A background task generator that does nothing.
@@ -2498,6 +2616,226 @@ async def test_background_task_reset(mock_app: rx.App, token: str):
     ]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("handler", "exp_order"),
+    [
+        ("background_task_batched", [f"batched:{i}" for i in range(5)]),
+        ("background_task_batched_error", ["batched:0", "batched:1"]),
+    ],
+)
+async def test_background_task_flush_interval(
+    mock_app: rx.App, token: str, handler: str, exp_order: list[str]
+):
+    """Test that a flush interval writes the changes of many contexts together.
+
+    The changes held when a context raises are still written.
+
+    Args:
+        mock_app: An app that will be returned by `get_app()`
+        token: A token.
+        handler: The name of the background task.
+        exp_order: The expected order after the task.
+    """
+    router_data = {"query": {}, "token": token}
+    sid = "test_sid"
+    namespace = mock_app.event_namespace
+    assert namespace is not None
+    namespace.sid_to_token[sid] = token
+    namespace._token_manager.instance_id = "mock"
+    namespace._token_manager.token_to_socket[token] = SocketRecord(
+        instance_id="mock", sid=sid
+    )
+    mock_app.state_manager.state = mock_app._state = BackgroundTaskState
+    async for update in rx.app.process(
+        mock_app,
+        Event(
+            token=token,
+            name=f"{BackgroundTaskState.get_full_name()}.{handler}",
+            router_data=router_data,
+            payload={},
+        ),
+        sid=sid,
+        headers={},
+        client_ip="",
+    ):
+        assert update == StateUpdate()
+
+    for task in tuple(mock_app._background_tasks):
+        await task
+    assert not mock_app._background_tasks
+
+    if environment.REFLEX_OPLOCK_ENABLED.get():
+        await mock_app.state_manager.close()
+
+    assert (
+        await mock_app.state_manager.get_state(
+            _substate_key(token, BackgroundTaskState)
+        )
+    ).order == exp_order
+
+    # The first context is flushed right away, the others together at the end.
+    emit_mock = namespace.emit
+    order_deltas = [
+        delta["order" + FIELD_MARKER]
+        for call in emit_mock.mock_calls  # pyright: ignore [reportAttributeAccessIssue]
+        if "order" + FIELD_MARKER
+        in (delta := call.args[1].delta.get(BackgroundTaskState.get_full_name(), {}))
+    ]
+    assert order_deltas == [exp_order[:1], exp_order]
+
+
+class ReadOnlyEventState(BaseState):
+    """A state with read-only event handlers."""
+
+    counter: int = 0
+
+    @rx.event(read_only=True)
+    def poll(self):
+        """Return an event based on the current counter.
+
+        Returns:
+            An event logging the counter.
+        """
+        return rx.console_log(f"counter={self.counter}")
+
+    @rx.event(read_only=True)
+    def bad_poll(self):
+        """Attempt to modify the state from a read-only handler."""
+        self.counter += 1
+
+
+@pytest.mark.asyncio
+async def test_read_only_event(mock_app: rx.App, token: str):
+    """Test that read-only events use a snapshot and never modify the state.
+
+    Args:
+        mock_app: An app that will be returned by `get_app()`
+        token: A token.
+    """
+    router_data = {"query": {}}
+    mock_app.state_manager.state = mock_app._state = ReadOnlyEventState
+    substate_token = _substate_key(token, ReadOnlyEventState)
+    async with mock_app.state_manager.modify_state(substate_token) as state:
+        state.router_data = {**router_data, "token": token}
+        state.router = RouterData.from_router_data(state.router_data)
+        state.counter = 3
+    if environment.REFLEX_OPLOCK_ENABLED.get():
+        await mock_app.state_manager.close()
+
+    # Read-only events must not take the state lock.
+    mock_app.state_manager.modify_state = Mock(side_effect=AssertionError)  # pyright: ignore [reportAttributeAccessIssue]
+    updates = [
+        update
+        async for update in rx.app.process(
+            mock_app,
+            Event(
+                token=token,
+                name=f"{ReadOnlyEventState.get_name()}.poll",
+                router_data=router_data,
+                payload={},
+            ),
+            sid="",
+            headers={},
+            client_ip="",
+        )
+    ]
+    assert len(updates) == 1
+    assert updates[0].delta == {}
+    assert updates[0].final
+    assert "counter=3" in updates[0].events[0].payload["function"]
+
+    async for update in rx.app.process(
+        mock_app,
+        Event(
+            token=token,
+            name=f"{ReadOnlyEventState.get_name()}.bad_poll",
+            router_data=router_data,
+            payload={},
+        ),
+        sid="",
+        headers={},
+        client_ip="",
+    ):
+        assert update.delta == {}
+    mock_app.state_manager.modify_state.assert_not_called()
+    assert (await mock_app.state_manager.get_state(substate_token)).counter == 3
+
+    with pytest.raises(ValueError, match="both background and read-only"):
+        rx.event(read_only=True, background=True)(ReadOnlyEventState.poll.fn)
+
+
+class ThreadedEventState(BaseState):
+    """A state with event handlers running in the sync handler thread pool."""
+
+    thread_names: list[str] = []
+
+    @rx.event(threaded=True)
+    def record(self):
+        """Record the thread running the handler."""
+        self.thread_names.append(threading.current_thread().name)
+
+    @rx.event(threaded=True)
+    def record_twice(self):
+        """Record the thread running each step of the handler.
+
+        Returns:
+            An event logging the number of steps.
+
+        Yields:
+            Nothing, to send an update.
+        """
+        self.thread_names.append(threading.current_thread().name)
+        yield
+        self.thread_names.append(threading.current_thread().name)
+        return rx.console_log("done")  # noqa: B901
+
+
+@pytest.mark.asyncio
+async def test_threaded_event():
+    """Test that threaded handlers run off the event loop thread."""
+    state = ThreadedEventState(_reflex_internal_init=True)  # pyright: ignore [reportCallIssue]
+    updates = [
+        update
+        async for update in state._process_event(ThreadedEventState.record, state, {})
+    ]
+    assert len(updates) == 1
+    assert updates[0].delta[ThreadedEventState.get_full_name()] == {
+        "thread_names" + FIELD_MARKER: [ANY]
+    }
+
+    updates = [
+        update
+        async for update in state._process_event(
+            ThreadedEventState.record_twice, state, {}
+        )
+    ]
+    assert [update.final for update in updates] == [False, False, True]
+    assert "done" in updates[1].events[0].payload["function"]
+    assert len(state.thread_names) == 3
+    assert all(name.startswith("reflex_sync_handler") for name in state.thread_names)
+
+    stats = get_sync_handler_stats()
+    assert stats.completed >= 4
+    assert stats.queued == stats.running == 0
+
+    async def async_handler(self):
+        pass
+
+    with pytest.raises(TypeError, match="must be synchronous"):
+        rx.event(threaded=True)(async_handler)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shuts_down_sync_handler_executor():
+    """Test that the sync handler thread pool is shut down with the app."""
+    app = LifespanMixin()
+    executor.get_sync_handler_executor()
+    async with app._run_lifespan_tasks(Starlette()):
+        assert executor._executor is not None
+    assert executor._executor is None
+
+
 @pytest.mark.asyncio
 async def test_background_task_no_chain():
     """Test that a background task cannot be chained."""
@@ -2637,6 +2975,89 @@ def test_mutable_dict(mutable_state: MutableTestState):
     assert_hashmap_dirty()
 
 
+def _apply_patch(value: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply patch operations the same way the frontend reducer does.
+
+    Args:
+        value: The previous value.
+        ops: The operations.
+
+    Returns:
+        The patched value.
+    """
+    result = copy.copy(value)
+    for op in ops:
+        if isinstance(result, list):
+            if op["op"] == "remove":
+                del result[op["path"]]
+            elif op["op"] == "replace":
+                result[op["path"]] = op["value"]
+            elif op["path"] == "-":
+                result.append(op["value"])
+            else:
+                result.insert(op["path"], op["value"])
+        elif op["op"] == "remove":
+            del result[op["path"]]
+        else:
+            result[op["path"]] = op["value"]
+    return result
+
+
+def test_mutable_patch_delta(
+    mutable_state: MutableTestState, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that in-place list/dict mutations are sent as patch operations.
+
+    Args:
+        mutable_state: A test state.
+        monkeypatch: Pytest monkeypatch object.
+    """
+    monkeypatch.setenv("REFLEX_STATE_PATCH_DELTAS", "true")
+    state_name = mutable_state.get_full_name()
+    mutable_state.array = list(range(20))
+    mutable_state.hashmap = {key: key for key in "abcdef"}
+    mutable_state._clean()
+
+    def get_patched(name: str, previous: Any) -> Any:
+        delta = json.loads(json_dumps(mutable_state.get_delta()))[state_name]
+        mutable_state._clean()
+        assert name + FIELD_MARKER not in delta
+        return _apply_patch(previous, delta[name + PATCH_MARKER])
+
+    mutable_state.array.append(10)
+    mutable_state.array.pop(0)
+    mutable_state.array[-1] = 99
+    mutable_state.array.insert(-2, 5)
+    mutable_state.array.remove(3)
+    del mutable_state.array[1]
+    assert get_patched("array", list(range(20))) == mutable_state.array
+
+    mutable_state.hashmap["d"] = "4"
+    mutable_state.hashmap.pop("a")
+    assert get_patched("hashmap", {key: key for key in "abcdef"}) == (
+        mutable_state.hashmap
+    )
+
+    # Nested mutations and reassignments send the full value.
+    mutable_state.array[0] = [1]
+    mutable_state.array[0].append(2)
+    assert "array" + FIELD_MARKER in mutable_state.get_delta()[state_name]
+    mutable_state._clean()
+    mutable_state.array = [1, 2]
+    mutable_state.array.append(3)
+    assert mutable_state.get_delta()[state_name] == {"array" + FIELD_MARKER: [1, 2, 3]}
+    mutable_state._clean()
+
+    # Patches are only sent when they are smaller than the value.
+    mutable_state.array.extend([4, 5, 6])
+    assert "array" + FIELD_MARKER in mutable_state.get_delta()[state_name]
+    mutable_state._clean()
+
+    monkeypatch.setenv("REFLEX_STATE_PATCH_DELTAS", "false")
+    mutable_state.array.append(7)
+    assert "array" + FIELD_MARKER in mutable_state.get_delta()[state_name]
+
+
 def test_mutable_set(mutable_state: MutableTestState):
     """Test that mutable sets are tracked correctly.
 
@@ -4144,6 +4565,28 @@ async def test_upcast_event_handler_arg(handler, payload):
         }
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_app_simple")
+async def test_payload_decoders_cached(mocker: MockerFixture):
+    """Test that handler type hints are only resolved on the first event.
+
+    Args:
+        mocker: pytest mocker object.
+    """
+    object.__setattr__(UpcastState.py_tuple, "__payload_decoders", None)
+    get_type_hints = mocker.spy(typing, "get_type_hints")
+    state = UpcastState()
+    for _ in range(3):
+        async for _update in state._process_event(
+            UpcastState.py_tuple, state, {"t": ["foo", "foo"]}
+        ):
+            pass
+    assert state.passed
+    assert [call.args for call in get_type_hints.mock_calls] == [
+        (UpcastState.py_tuple.fn,)
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_var_value(state_manager: StateManager, substate_token: str):
     """Test that get_var_value works correctly.
@@ -0,0 +1,174 @@
+"""Tests for zipping the exported app."""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from rich.progress import Progress
+
+from reflex import constants
+from reflex.utils import build
+
+
+class _QuietProgress(Progress):
+    """A progress bar printing to its own console."""
+
+    def __init__(self, *columns, **kwargs):
+        super().__init__(*columns, console=Console(file=io.StringIO()), **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def quiet_progress(monkeypatch):
+    """Keep the progress bar of the zip off the shared console.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(build, "Progress", _QuietProgress)
+
+
+def _make_tree(root: Path):
+    """Write the files of an app to zip.
+
+    Args:
+        root: The root directory.
+    """
+    (root / "app").mkdir(parents=True)
+    (root / "app" / "app.py").write_text("import reflex as rx\n" * 200)
+    (root / "app" / "logo.png").write_bytes(bytes(range(256)) * 8)
+    (root / "app" / "data.db").write_bytes(b"db")
+    (root / ".hidden").write_text("hidden")
+    (root / "excluded").mkdir()
+    (root / "excluded" / "secret.txt").write_text("secret")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "app.cpython.pyc").write_bytes(b"pyc")
+
+
+def _zip(root: Path, target: Path, **kwargs):
+    """Zip a directory as the backend.
+
+    Args:
+        root: The root directory.
+        target: The target zip file.
+        kwargs: The options of the zip.
+    """
+    build._zip(
+        component_name=constants.ComponentName.BACKEND,
+        target=target,
+        root_directory=root,
+        exclude_venv_directories=True,
+        directory_names_to_exclude={"__pycache__"},
+        files_to_exclude={root / "excluded", target},
+        **kwargs,
+    )
+
+
+def test_zip(tmp_path: Path):
+    """Files are excluded by path, name and pattern, and compressed members are stored."""
+    root = tmp_path / "root"
+    _make_tree(root)
+    target = root / "backend.zip"
+    _zip(root, target)
+
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.testzip() is None
+        infos = {info.filename: info for info in zipf.infolist()}
+        assert set(infos) == {"app/app.py", "app/logo.png"}
+        assert infos["app/app.py"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["app/app.py"].compress_size < infos["app/app.py"].file_size
+        assert infos["app/logo.png"].compress_type == zipfile.ZIP_STORED
+        assert zipf.read("app/app.py") == (root / "app" / "app.py").read_bytes()
+        assert zipf.read("app/logo.png") == (root / "app" / "logo.png").read_bytes()
+    assert not list(root.glob(".backend.zip*"))
+
+    _zip(root, target, store_compressed=False, include_db_file=True)
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.getinfo("app/logo.png").compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.read("app/data.db") == b"db"
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_zip_incremental(tmp_path: Path, monkeypatch, incremental: bool):
+    """Unchanged members of the previous zip are reused in incremental mode.
+
+    Args:
+        tmp_path: The temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+        incremental: Whether to zip incrementally.
+    """
+    root = tmp_path / "root"
+    _make_tree(root)
+    target = tmp_path / "backend.zip"
+    _zip(root, target)
+
+    compressed = []
+    compress_member = build._compress_member
+
+    def _compress_member(path, arcname, compress_type, previous):
+        zinfo, data = compress_member(path, arcname, compress_type, previous)
+        if data is not None:
+            compressed.append(arcname)
+        return zinfo, data
+
+    monkeypatch.setattr(build, "_compress_member", _compress_member)
+    (root / "app" / "app.py").write_text("import reflex\n" * 100)
+    (root / "app" / "new.py").write_text("new")
+    _zip(root, target, incremental=incremental)
+
+    if incremental:
+        assert sorted(compressed) == ["app/app.py", "app/new.py"]
+    else:
+        assert sorted(compressed) == ["app/app.py", "app/logo.png", "app/new.py"]
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.testzip() is None
+        assert {info.filename for info in zipf.infolist()} == {
+            "app/app.py",
+            "app/logo.png",
+            "app/new.py",
+        }
+        for name in ("app/app.py", "app/logo.png", "app/new.py"):
+            assert zipf.read(name) == (root / name).read_bytes()
+
+
+def test_zip_streams_large_files(tmp_path: Path, monkeypatch):
+    """Large files are streamed into the zip, and reused when unchanged.
+
+    Args:
+        tmp_path: The temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(build, "_STREAM_MIN_SIZE", 1024)
+    monkeypatch.setattr(build, "_CHUNK_SIZE", 1000)
+    root = tmp_path / "root"
+    _make_tree(root)
+    target = tmp_path / "backend.zip"
+    _zip(root, target)
+
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.testzip() is None
+        assert zipf.getinfo("app/app.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.getinfo("app/logo.png").compress_type == zipfile.ZIP_STORED
+        for name in ("app/app.py", "app/logo.png"):
+            assert zipf.read(name) == (root / name).read_bytes()
+
+    streamed = []
+    stream_member = build._stream_member
+
+    def _stream_member(zipf, path, arcname, compress_type, previous, previous_fp):
+        reused = stream_member(
+            zipf, path, arcname, compress_type, previous, previous_fp
+        )
+        streamed.append((arcname, reused))
+        return reused
+
+    monkeypatch.setattr(build, "_stream_member", _stream_member)
+    (root / "app" / "app.py").write_text("import reflex\n" * 100)
+    _zip(root, target, incremental=True)
+
+    assert sorted(streamed) == [("app/app.py", False), ("app/logo.png", True)]
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.testzip() is None
+        for name in ("app/app.py", "app/logo.png"):
+            assert zipf.read(name) == (root / name).read_bytes()
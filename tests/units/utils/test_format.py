@@ -720,3 +720,24 @@ def test_format_library_name(input: str, output: str):
 )
 def test_json_dumps(input, output):
     assert format.json_dumps(input) == output
+
+
+@pytest.mark.parametrize("fast", [False, True])
+@pytest.mark.parametrize(
+    "input",
+    [
+        {"k1": False, "k2": [1, 2.5, "ü"]},
+        {1: datetime.datetime(2024, 1, 2, 3, 4, 5)},
+        [datetime.timedelta(1, 1, 1), 2**70],
+    ],
+)
+def test_json_dumps_bytes(input, fast: bool):
+    """The binary encoder matches the stdlib based encoder.
+
+    Args:
+        input: The object to encode.
+        fast: Whether to use orjson when installed.
+    """
+    assert json.loads(format.json_dumps_bytes(input, fast=fast)) == json.loads(
+        format.json_dumps(input)
+    )
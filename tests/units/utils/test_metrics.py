@@ -0,0 +1,115 @@
+"""Tests for the event timing metrics."""
+
+import pytest
+
+from reflex.utils import metrics
+from reflex.utils.metrics import EventPhase, EventTiming
+
+
+@pytest.fixture
+def event_metrics(monkeypatch: pytest.MonkeyPatch):
+    """Enable the event metrics, clearing the histograms around the test.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Yields:
+        The timings passed to the hooks.
+    """
+    monkeypatch.setenv("REFLEX_EVENT_METRICS", "true")
+    timings: list[EventTiming] = []
+    metrics.reset()
+    metrics.add_hook(timings.append)
+    yield timings
+    metrics.remove_hook(timings.append)
+    metrics.reset()
+
+
+def test_disabled():
+    """Nothing is recorded when the metrics are disabled."""
+    metrics.reset()
+    assert metrics.measure(EventPhase.HANDLER) is metrics.measure(EventPhase.EMIT)
+    with metrics.event_scope("state.handler"), metrics.measure(EventPhase.HANDLER):
+        pass
+    assert not metrics.get_histograms()
+
+
+def test_event_scope(event_metrics: list[EventTiming]):
+    """The phases of an event are accumulated and recorded once per event.
+
+    Args:
+        event_metrics: The timings passed to the hooks.
+    """
+    with metrics.event_scope("state.handler"):
+        for _ in range(3):
+            # Recursive measures of the same phase are not counted twice.
+            with (
+                metrics.measure(EventPhase.GET_DELTA),
+                metrics.measure(EventPhase.GET_DELTA),
+            ):
+                pass
+        with (
+            metrics.event_scope("state.background"),
+            metrics.measure(EventPhase.HANDLER),
+        ):
+            pass
+    with metrics.measure(EventPhase.EMIT):
+        pass
+
+    assert [timing.event for timing in event_metrics] == [
+        "state.background",
+        "state.handler",
+    ]
+    background, handler = event_metrics
+    assert set(background.phases) == {EventPhase.HANDLER}
+    assert set(handler.phases) == {EventPhase.GET_DELTA}
+    phase = handler.phases[EventPhase.GET_DELTA]
+    assert handler.start_ns <= phase.start_ns
+    assert phase.duration_ns <= handler.duration_ns
+
+    histograms = metrics.get_histograms()
+    assert set(histograms) == {
+        ("state.background", EventPhase.EVENT),
+        ("state.background", EventPhase.HANDLER),
+        ("state.handler", EventPhase.EVENT),
+        ("state.handler", EventPhase.GET_DELTA),
+    }
+    assert all(histogram.count == 1 for histogram in histograms.values())
+
+
+def test_unknown_event(event_metrics: list[EventTiming]):
+    """Events are recorded under their handler once it is found, others together.
+
+    Args:
+        event_metrics: The timings passed to the hooks.
+    """
+    for name in ("state.missing1", "state.missing2", "state.handler"):
+        with metrics.event_scope():
+            if name == "state.handler":
+                metrics.resolve_event(name)
+
+    assert [timing.event for timing in event_metrics] == [
+        metrics.UNKNOWN_EVENT,
+        metrics.UNKNOWN_EVENT,
+        "state.handler",
+    ]
+    assert set(metrics.get_histograms()) == {
+        (metrics.UNKNOWN_EVENT, EventPhase.EVENT),
+        ("state.handler", EventPhase.EVENT),
+    }
+
+
+def test_export_prometheus(event_metrics: list[EventTiming]):
+    """The histograms are exported in the Prometheus text format.
+
+    Args:
+        event_metrics: The timings passed to the hooks.
+    """
+    with metrics.event_scope('state."quoted"'):
+        pass
+    lines = metrics.export_prometheus().splitlines()
+    assert lines[1] == "# TYPE reflex_event_phase_seconds histogram"
+    labels = 'event="state.\\"quoted\\"",phase="event"'
+    assert f'reflex_event_phase_seconds_bucket{{{labels},le="0.0005"}} 1' in lines
+    assert f'reflex_event_phase_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"reflex_event_phase_seconds_count{{{labels}}} 1" in lines
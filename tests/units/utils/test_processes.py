@@ -7,7 +7,9 @@ from unittest import mock
 
 import pytest
 
+import reflex as rx
 from reflex.testing import DEFAULT_TIMEOUT, AppHarness
+from reflex.utils import processes
 from reflex.utils.processes import is_process_on_port
 
 
@@ -153,3 +155,79 @@ def test_is_process_on_port_concurrent_access():
     assert AppHarness._poll_for(
         lambda: shared is not None and not is_process_on_port(shared)
     )
+
+
+@pytest.mark.parametrize(
+    ("files", "cpu_limit", "memory_limit"),
+    [
+        ({}, None, None),
+        ({"cpu.max": "max 100000", "memory.max": "max"}, None, None),
+        ({"cpu.max": "150000 100000", "memory.max": "1073741824"}, 1.5, 2**30),
+        (
+            {
+                "cpu/cpu.cfs_quota_us": "200000",
+                "cpu/cpu.cfs_period_us": "100000",
+                "memory/memory.limit_in_bytes": "536870912",
+            },
+            2.0,
+            2**29,
+        ),
+        (
+            {
+                "cpu/cpu.cfs_quota_us": "-1",
+                "cpu/cpu.cfs_period_us": "100000",
+                "memory/memory.limit_in_bytes": "9223372036854771712",
+            },
+            None,
+            None,
+        ),
+    ],
+)
+def test_cgroup_limits(tmp_path, monkeypatch, files, cpu_limit, memory_limit):
+    """Test reading the CPU and memory limits of cgroup v1 and v2.
+
+    Args:
+        tmp_path: The temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+        files: The files of the cgroup filesystem.
+        cpu_limit: The expected CPU limit.
+        memory_limit: The expected memory limit.
+    """
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content + "\n")
+    monkeypatch.setattr(processes, "_CGROUP_ROOT", tmp_path)
+    assert processes.get_cpu_limit() == cpu_limit
+    assert processes.get_memory_limit() == memory_limit
+
+
+@pytest.mark.parametrize(
+    ("backend_workers", "cpu_limit", "memory_limit", "expected"),
+    [
+        (None, None, None, 17),
+        (None, 2.0, None, 5),
+        (None, 1.5, None, 5),
+        (None, 2.0, 3 * 512 * 1024**2, 3),
+        (None, None, 100, 1),
+        (4, 2.0, 100, 4),
+    ],
+)
+def test_get_num_workers(
+    mocker, backend_workers, cpu_limit, memory_limit, expected: int
+):
+    """Test sizing the backend workers from the container limits.
+
+    Args:
+        mocker: The pytest mocker fixture.
+        backend_workers: The backend_workers config.
+        cpu_limit: The CPU limit of the container.
+        memory_limit: The memory limit of the container.
+        expected: The expected number of workers.
+    """
+    conf = rx.Config(app_name="testing", backend_workers=backend_workers)
+    mocker.patch("reflex.config._get_config", return_value=conf)
+    mocker.patch("reflex.utils.prerequisites.get_redis_sync", return_value=mock.Mock())
+    mocker.patch("os.sched_getaffinity", return_value=set(range(8)), create=True)
+    mocker.patch.object(processes, "get_cpu_limit", return_value=cpu_limit)
+    mocker.patch.object(processes, "get_memory_limit", return_value=memory_limit)
+    assert processes.get_num_workers() == expected
@@ -0,0 +1,158 @@
+"""Tests for the static files served with precompressed variants."""
+
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from reflex.utils import staticfiles
+from reflex.utils.staticfiles import (
+    IMMUTABLE_CACHE_CONTROL,
+    PrecompressedStaticFiles,
+    get_accepted_encodings,
+    precompress_directory,
+)
+
+SCRIPT = "console.log('reflex');\n" * 200
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    """Create a build output with precompressed variants.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture.
+
+    Returns:
+        The directory of the build output.
+    """
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-Bx2k3D4f.js").write_text(SCRIPT)
+    (tmp_path / "index.html").write_text("<html></html>")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG" * 1000)
+    precompress_directory(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_dir: Path) -> TestClient:
+    """Serve the build output.
+
+    Args:
+        static_dir: The directory of the build output.
+
+    Returns:
+        The test client.
+    """
+    app = Starlette(
+        routes=[Mount("/", PrecompressedStaticFiles(directory=static_dir, html=True))]
+    )
+    return TestClient(app)
+
+
+def test_precompress_directory(static_dir: Path):
+    """Only compressible files that shrink get variants.
+
+    Args:
+        static_dir: The directory of the build output.
+    """
+    variants = {path.name for path in static_dir.rglob("*.gz")}
+    # Small files are not worth compressing, and images are already compressed.
+    assert variants == {"index-Bx2k3D4f.js.gz"}
+    assert bool(list(static_dir.rglob("*.br"))) == (staticfiles.brotli is not None)
+
+
+def test_accepted_encodings():
+    """The encodings with a zero quality are not accepted."""
+    assert get_accepted_encodings("gzip, deflate, br;q=0, zstd;q=0.5") == {
+        "gzip",
+        "deflate",
+        "zstd",
+    }
+    assert get_accepted_encodings("") == set()
+
+
+def test_serve_precompressed(client: TestClient):
+    """The gzip variant is served to clients accepting it, with immutable caching.
+
+    Args:
+        client: The test client.
+    """
+    response = client.get(
+        "/assets/index-Bx2k3D4f.js", headers={"accept-encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.text == SCRIPT
+
+    response = client.get(
+        "/assets/index-Bx2k3D4f.js", headers={"accept-encoding": "identity"}
+    )
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == SCRIPT
+
+
+def test_range_and_etag(client: TestClient):
+    """Range requests and conditional requests are answered from the file.
+
+    Args:
+        client: The test client.
+    """
+    headers = {"accept-encoding": "identity"}
+    response = client.get(
+        "/assets/index-Bx2k3D4f.js", headers={**headers, "range": "bytes=0-6"}
+    )
+    assert response.status_code == 206
+    assert response.text == SCRIPT[:7]
+
+    etag = client.get("/assets/index-Bx2k3D4f.js", headers=headers).headers["etag"]
+    response = client.get(
+        "/assets/index-Bx2k3D4f.js", headers={**headers, "if-none-match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_html_revalidated(client: TestClient):
+    """HTML pages are revalidated by the clients on each request.
+
+    Args:
+        client: The test client.
+    """
+    response = client.get("/")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == "<html></html>"
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "assets/team-portrait.jpg",
+        "assets/logo-darkmode.png",
+        "images/index-Bx2k3D4f.js",
+        "assets/nested/index-Bx2k3D4f.js",
+    ],
+)
+def test_public_files_not_immutable(tmp_path: Path, path: str):
+    """Files outside the bundler output, or not named after a hash, are not immutable.
+
+    Args:
+        tmp_path: The pytest tmp_path fixture.
+        path: The path of the served file.
+    """
+    # A parent directory named like the bundler output must not matter either.
+    directory = tmp_path / "assets" / "build"
+    (directory / path).parent.mkdir(parents=True)
+    (directory / path).write_bytes(b"\x89PNG")
+    client = TestClient(
+        Starlette(routes=[Mount("/", PrecompressedStaticFiles(directory=directory))])
+    )
+
+    response = client.get(f"/{path}")
+    assert response.status_code == 200
+    assert "cache-control" not in response.headers
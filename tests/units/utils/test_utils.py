@@ -549,3 +549,39 @@ def test_is_prod_mode() -> None:
     assert utils_exec.is_prod_mode()
     environment.REFLEX_ENV_MODE.set(None)
     assert not utils_exec.is_prod_mode()
+
+
+@pytest.mark.parametrize("preload", [False, True])
+def test_run_backend_prod_preload(
+    preload: bool, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the preloaded backend forks gunicorn workers.
+
+    Args:
+        preload: Whether REFLEX_BACKEND_PRELOAD is set.
+        mocker: The pytest mocker fixture.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    if preload:
+        monkeypatch.setenv(environment.REFLEX_BACKEND_PRELOAD.name, "true")
+    monkeypatch.setenv(environment.REFLEX_USE_GRANIAN.name, "true")
+    monkeypatch.delenv("GUNICORN_CMD_ARGS", raising=False)
+    mocker.patch.object(constants, "IS_WINDOWS", False)
+    mocker.patch("importlib.util.find_spec", return_value=object())
+    mocker.patch("reflex.utils.processes.get_num_workers", return_value=4)
+    mocker.patch.object(utils_exec, "get_app_instance", return_value="app.app:app")
+    mocker.patch.object(utils_exec, "get_app_instance_from_file", return_value="app")
+    new_process = mocker.patch("reflex.utils.processes.new_process")
+
+    utils_exec.run_backend_prod("0.0.0.0", 8000, frontend_present=True)
+
+    command = new_process.call_args.args[0]
+    env = new_process.call_args.kwargs["env"]
+    if preload:
+        assert command[:3] == ["gunicorn", "--preload", "--worker-class"]
+        assert command[command.index("--workers") + 1] == "4"
+        assert "--threads" not in command
+        assert env[environment.REFLEX_BACKEND_PRELOADED.name] == "true"
+    else:
+        assert command[0] == "granian"
+        assert environment.REFLEX_BACKEND_PRELOADED.name not in env